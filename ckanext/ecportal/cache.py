@@ -0,0 +1,273 @@
+import logging
+import os
+import threading
+import time
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+log = logging.getLogger(__name__)
+
+# the version stamp of a StampedCache is checked at most this often
+# (in seconds)
+DEFAULT_CHECK_INTERVAL = 30
+
+# the modification time of a ReloadableFile is checked at most this often
+# (in seconds)
+DEFAULT_FILE_CHECK_INTERVAL = 5
+
+# default number of items kept by an LRUCache (or TTLCache)
+DEFAULT_LRU_SIZE = 1000
+
+_MISSING = object()
+
+
+class StampedCache(object):
+    '''
+    Process-level cache of a single value that is stored in the database.
+
+    load() returns the value and stamp() returns its current version stamp,
+    which must change whenever the value changes (in any process). The
+    stamp is checked at most every check_interval seconds, and the value is
+    only loaded again when the stamp has changed. invalidate() forces the
+    stamp to be checked on the next call to get(), so that changes made by
+    this process are picked up straight away.
+    '''
+
+    def __init__(self, load, stamp, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.load = load
+        self.stamp = stamp
+        self.check_interval = check_interval
+        self._value = _MISSING
+        self._version = _MISSING
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        checked_at = self._checked_at
+        if checked_at is not None and \
+                time.time() - checked_at < self.check_interval:
+            return self._value
+
+        with self._lock:
+            now = time.time()
+            if self._checked_at is None or \
+                    now - self._checked_at >= self.check_interval:
+                version = self.stamp()
+                if version != self._version or self._value is _MISSING:
+                    self._value = self.load()
+                    self._version = version
+                    log.debug('Loaded value for version %r', version)
+                self._checked_at = now
+            return self._value
+
+    def invalidate(self):
+        self._checked_at = None
+
+
+class ReloadableFile(object):
+    '''
+    Process-level cache of the contents of the file at path, as returned by
+    load(file).
+
+    The file is loaded the first time get() is called, and loaded again
+    when its modification time changes, which is checked at most every
+    check_interval seconds. If the file can't be read or loaded, the error
+    is logged and the previously loaded value (or None) is returned, until
+    the file is loaded successfully.
+    '''
+
+    def __init__(self, path, load,
+                 check_interval=DEFAULT_FILE_CHECK_INTERVAL):
+        self.path = path
+        self.load = load
+        self.check_interval = check_interval
+        self._value = None
+        self._mtime = None
+        self._checked_at = None
+
+    def get(self):
+        now = time.time()
+        if self._checked_at is None or \
+                now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            try:
+                mtime = os.stat(self.path).st_mtime
+                if mtime != self._mtime:
+                    with open(self.path) as f:
+                        self._value = self.load(f)
+                    self._mtime = mtime
+                    log.debug('Loaded %s', self.path)
+            except (IOError, OSError, ValueError), e:
+                log.error('Cannot load %s: %s', self.path, e)
+        return self._value
+
+
+class LRUCache(object):
+    '''
+    Process-level cache of at most max_size items, which discards the least
+    recently used item when it is full.
+
+    The items are kept in a circular doubly linked list of
+    [previous, next, key, value] links, ordered from the least to the most
+    recently used, so that every operation takes constant time.
+    '''
+
+    def __init__(self, max_size=DEFAULT_LRU_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __len__(self):
+        return len(self._links)
+
+    def _unlink(self, link):
+        previous, next = link[0], link[1]
+        previous[1] = next
+        next[0] = previous
+
+    def _append(self, link):
+        last = self._root[0]
+        link[0] = last
+        link[1] = self._root
+        last[1] = link
+        self._root[0] = link
+
+    def get(self, key, default=None):
+        with self._lock:
+            link = self._links.get(key)
+            if link is None:
+                return default
+            self._unlink(link)
+            self._append(link)
+            return link[3]
+
+    def set(self, key, value):
+        with self._lock:
+            link = self._links.get(key)
+            if link is not None:
+                self._unlink(link)
+                link[3] = value
+            else:
+                if len(self._links) >= self.max_size:
+                    oldest = self._root[1]
+                    self._unlink(oldest)
+                    del self._links[oldest[2]]
+                link = self._links[key] = [None, None, key, value]
+            self._append(link)
+
+    def delete(self, key):
+        with self._lock:
+            link = self._links.pop(key, None)
+            if link is not None:
+                self._unlink(link)
+
+    def clear(self):
+        self._links = {}
+        self._root = []
+        self._root[:] = [self._root, self._root, None, None]
+
+
+class TTLCache(object):
+    '''
+    Process-level cache of at most max_size items (see LRUCache), which
+    expire ttl seconds after they were set, unless another ttl is given to
+    set().
+    '''
+
+    def __init__(self, ttl, max_size=DEFAULT_LRU_SIZE):
+        self.ttl = ttl
+        self._cache = LRUCache(max_size)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, key, default=None):
+        expires, value = self._cache.get(key, (None, default))
+        if expires is None:
+            return default
+        if expires <= time.time():
+            self._cache.delete(key)
+            return default
+        return value
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+        self._cache.set(key, (time.time() + ttl, value))
+
+    def delete(self, key):
+        self._cache.delete(key)
+
+    def clear(self):
+        self._cache.clear()
+
+
+class MemoryHashCache(object):
+    '''
+    Process-level cache of named hashes of (field, value) pairs. Values
+    expire after ttl seconds, and at most max_size hashes are kept (see
+    LRUCache).
+    '''
+
+    def __init__(self, max_size=DEFAULT_LRU_SIZE, ttl=None):
+        self.ttl = ttl
+        self._cache = LRUCache(max_size)
+
+    def get(self, name, field):
+        expires, value = self._cache.get(name, {}).get(field, (None, None))
+        if expires is None or expires > time.time():
+            return value
+
+    def set(self, name, field, value):
+        now = time.time()
+        expires = now + self.ttl if self.ttl else None
+        # drop the expired fields, so that a hash that keeps being set
+        # (e.g. for each new revision of a dataset) doesn't keep growing
+        fields = dict((f, v) for f, v in self._cache.get(name, {}).items()
+                      if v[0] is None or v[0] > now)
+        fields[field] = (expires, value)
+        self._cache.set(name, fields)
+
+    def delete(self, name):
+        self._cache.delete(name)
+
+
+class RedisHashCache(object):
+    '''
+    Cache of named hashes of (field, value) pairs stored in a Redis server,
+    shared by every process using it. Hashes expire ttl seconds after they
+    were last set. Connection errors are logged and treated as cache misses.
+    '''
+
+    def __init__(self, url, ttl=None, prefix=''):
+        if redis is None:
+            raise ImportError('The redis module is required to use '
+                              'a Redis cache')
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = redis.StrictRedis.from_url(url)
+
+    def get(self, name, field):
+        try:
+            return self._redis.hget(self.prefix + name, field)
+        except redis.RedisError, e:
+            log.error('Could not read from the Redis cache: %s', e)
+
+    def set(self, name, field, value):
+        pipeline = self._redis.pipeline()
+        pipeline.hset(self.prefix + name, field, value)
+        if self.ttl:
+            pipeline.expire(self.prefix + name, self.ttl)
+        try:
+            pipeline.execute()
+        except redis.RedisError, e:
+            log.error('Could not write to the Redis cache: %s', e)
+
+    def delete(self, name):
+        try:
+            self._redis.delete(self.prefix + name)
+        except redis.RedisError, e:
+            log.error('Could not delete from the Redis cache: %s', e)
@@ -4,16 +4,26 @@ import os
 import sys
 import csv
 import json
+import time
+import inspect
+import bisect
+import multiprocessing
 
 import ckan
 import ckan.plugins as plugins
 import ckan.model as model
 import ckan.logic as logic
 import ckan.lib.cli as cli
+import ckan.lib.search as search
+import ckanext.ecportal.controllers as controllers
 import ckanext.ecportal.forms as forms
+import ckanext.ecportal.plugin as ecportal_plugin
 import ckanext.ecportal.searchcloud as searchcloud
 import ckanext.ecportal.rdfutil as rdfutil
+import ckanext.ecportal.unicode_sort as unicode_sort
+import ckanext.ecportal.vocabularies as vocabularies
 import lxml.etree
+import pylons
 
 log = logging.getLogger()
 
@@ -22,6 +32,62 @@ class InvalidDateFormat(Exception):
     pass
 
 
+def _init_index_worker():
+    '''
+    Set up a search-index-rebuild worker process: database connections
+    inherited from the parent process can't be shared, so each worker
+    opens its own, and loads the term translations and vocabulary index
+    once for all of the datasets it indexes.
+    '''
+    model.Session.remove()
+    model.meta.engine.dispose()
+    ecportal_plugin.begin_translation_batch()
+    vocabularies.invalidate()
+
+
+def _index_defers_commit(package_index):
+    '''
+    Return True if package_index can index datasets without committing to
+    Solr after each one (older versions of CKAN always commit).
+    '''
+    return 'defer_commit' in \
+        inspect.getargspec(package_index.index_package)[0]
+
+
+def _index_chunk(chunk):
+    '''
+    Index the datasets in chunk, a (chunk number, list of package ids)
+    tuple, committing to Solr once at the end of the chunk if possible.
+
+    Returns a (chunk number, number of datasets indexed, list of package ids
+    that failed) tuple.
+    '''
+    chunk_number, package_ids = chunk
+    package_index = search.index_for(model.Package)
+
+    defer_commit = _index_defers_commit(package_index)
+    index_kwargs = {'defer_commit': True} if defer_commit else {}
+
+    indexed = 0
+    failed = []
+    for package_id in package_ids:
+        try:
+            pkg_dict = plugins.toolkit.get_action('package_show')(
+                {'model': model, 'ignore_auth': True, 'validate': False},
+                {'id': package_id})
+            package_index.index_package(pkg_dict, **index_kwargs)
+            indexed += 1
+        except Exception, e:
+            log.error('Error indexing dataset %s: %s', package_id, e)
+            failed.append(package_id)
+
+    if defer_commit:
+        package_index.commit()
+    model.Session.remove()
+
+    return chunk_number, indexed, failed
+
+
 class ECPortalCommand(cli.CkanCommand):
     '''
     Commands:
@@ -52,8 +118,18 @@ class ECPortalCommand(cli.CkanCommand):
         paster ecportal purge-package-extra-revision -c <config>
         paster ecportal purge-task-data -c <config>
 
-        paster ecportal searchcloud-install-tables -c <config>
+        paster ecportal searchcloud-install-tables [--partitioned] -c <config>
         paster ecportal searchcloud-generate-unapproved-search-list -c <config>
+        paster ecportal searchcloud-purge-search-queries -c <config>
+        paster ecportal searchcloud-manage-partitions -c <config>
+
+        paster ecportal search-index-rebuild [--workers <n>]
+                [--chunk-size <n>] [--resume] [--refresh]
+                [--state-file <file>] -c <config>
+
+        paster ecportal benchmark-before-index <count (optional)> -c <config>
+        paster ecportal benchmark-sort-keys <count (optional)> -c <config>
+        paster ecportal benchmark-before-search <count (optional)> -c <config>
 
     Where:
         <data> = path to XML file (format of the Eurostat bulk import metadata)
@@ -62,6 +138,22 @@ class ECPortalCommand(cli.CkanCommand):
         <folder> = Output folder for dataset export
         <file> = (optional) path to input JSON or CSV file. If not specified,
                  the default files in the /data directory are used.
+        <count> = (optional) number of datasets (or searches per language,
+                  for benchmark-before-search) to use, default 100
+
+    searchcloud-install-tables options:
+        --partitioned = store the searches in one search_query table per
+                        month (see searchcloud-manage-partitions)
+
+    search-index-rebuild options:
+        --workers = number of indexing processes, default 1
+        --chunk-size = number of datasets indexed (and committed to Solr)
+                       together, default 100
+        --resume = skip the chunks completed by a previous run with the same
+                   state file (implies --refresh)
+        --refresh = don't clear the search index first
+        --state-file = file recording the completed chunks, default
+                       search-index-rebuild.state
         <config> = path to your ckan config file
 
     The commands should be run from the ckanext-ecportal directory.
@@ -86,6 +178,27 @@ class ECPortalCommand(cli.CkanCommand):
         'publishers': default_data_dir + '/../../data/po-corporate-bodies.json'
     }
 
+    def __init__(self, name):
+        super(ECPortalCommand, self).__init__(name)
+        self.parser.add_option('--workers', dest='workers', type='int',
+                               default=1,
+                               help='Number of search index workers')
+        self.parser.add_option('--chunk-size', dest='chunk_size',
+                               type='int', default=100,
+                               help='Number of datasets per index chunk')
+        self.parser.add_option('--resume', dest='resume',
+                               action='store_true', default=False,
+                               help='Resume an interrupted index rebuild')
+        self.parser.add_option('-r', '--refresh', dest='refresh',
+                               action='store_true', default=False,
+                               help="Don't clear the index before rebuild")
+        self.parser.add_option('--state-file', dest='state_file',
+                               default='search-index-rebuild.state',
+                               help='Index rebuild progress file')
+        self.parser.add_option('--partitioned', dest='partitioned',
+                               action='store_true', default=False,
+                               help='Partition the search_query table')
+
     def command(self):
         '''
         Parse command line arguments and call appropriate method.
@@ -178,9 +291,30 @@ class ECPortalCommand(cli.CkanCommand):
         elif cmd == 'searchcloud-generate-unapproved-search-list':
             self.searchcloud_generate_unapproved_search_list()
 
+        elif cmd == 'searchcloud-purge-search-queries':
+            self.searchcloud_purge_search_queries()
+
+        elif cmd == 'searchcloud-manage-partitions':
+            self.searchcloud_manage_partitions()
+
         elif cmd == 'import-csv-translations':
             self.import_csv_translation()
 
+        elif cmd == 'search-index-rebuild':
+            self.search_index_rebuild()
+
+        elif cmd == 'benchmark-before-index':
+            count = int(self.args[1]) if len(self.args) >= 2 else 100
+            self.benchmark_before_index(count)
+
+        elif cmd == 'benchmark-sort-keys':
+            count = int(self.args[1]) if len(self.args) >= 2 else 100
+            self.benchmark_sort_keys(count)
+
+        elif cmd == 'benchmark-before-search':
+            count = int(self.args[1]) if len(self.args) >= 2 else 100
+            self.benchmark_before_search(count)
+
         else:
             log.error('Command "%s" not recognized' % (cmd,))
 
@@ -799,8 +933,271 @@ class ECPortalCommand(cli.CkanCommand):
         searchcloud.generate_unapproved_list(model.Session, days=30)
         model.Session.commit()
 
+    def searchcloud_purge_search_queries(self):
+        '''
+        Delete the searches that have been rolled up into the daily counts
+        from the search_query table.
+        '''
+        deleted = searchcloud.purge_search_queries(model.Session)
+        model.Session.commit()
+        log.warn('Deleted %d rolled up searches', deleted)
+
     def searchcloud_install_tables(self):
         def out(text):
             print text
-        searchcloud.install_tables(model.Session, out)
+        searchcloud.install_tables(model.Session, out,
+                                   partitioned=self.options.partitioned)
         model.Session.commit()
+
+    def searchcloud_manage_partitions(self):
+        '''
+        This command is usually executed via a Cron job once a day to create
+        the search_query partitions of the coming months and drop the ones
+        that are past the retention period.
+        '''
+        def out(text):
+            print text
+        if not searchcloud.is_partitioned(model.Session):
+            log.error('The search_query table is not partitioned, run '
+                      'searchcloud-install-tables --partitioned first')
+            return
+        searchcloud.create_partitions(model.Session, out)
+        searchcloud.drop_expired_partitions(model.Session, out)
+        model.Session.commit()
+
+    def _read_completed_chunks(self, state_file):
+        '''
+        Return the (first package id, last package id) ranges of the chunks
+        completed by a previous search-index-rebuild run.
+        '''
+        if not os.path.exists(state_file):
+            return []
+        with open(state_file) as f:
+            return [tuple(line.split()) for line in f if line.strip()]
+
+    def search_index_rebuild(self):
+        '''
+        Rebuild the search index using a pool of worker processes.
+
+        Active datasets are split into chunks of consecutive package ids,
+        which are indexed in parallel. Each completed chunk is recorded in
+        the state file so that an interrupted rebuild can be resumed.
+        '''
+        workers = max(self.options.workers, 1)
+        chunk_size = max(self.options.chunk_size, 1)
+        state_file = self.options.state_file
+
+        package_ids = sorted(
+            row[0] for row in model.Session.query(model.Package.id)
+            .filter_by(state='active'))
+
+        if self.options.resume:
+            completed = sorted(self._read_completed_chunks(state_file))
+            firsts = [first for first, last in completed]
+
+            def is_completed(package_id):
+                i = bisect.bisect_right(firsts, package_id) - 1
+                return i >= 0 and package_id <= completed[i][1]
+
+            package_ids = [package_id for package_id in package_ids
+                           if not is_completed(package_id)]
+            print 'Resuming search index rebuild, %d datasets left' % \
+                len(package_ids)
+        else:
+            if not self.options.refresh:
+                print 'Clearing the search index'
+                search.index_for(model.Package).clear()
+            open(state_file, 'w').close()
+
+        chunks = [(number, package_ids[start:start + chunk_size])
+                  for number, start in enumerate(
+                      range(0, len(package_ids), chunk_size))]
+        model.Session.remove()
+
+        if not _index_defers_commit(search.index_for(model.Package)):
+            log.warn('This version of CKAN commits to Solr after indexing '
+                     'each dataset, which makes the rebuild much slower '
+                     'and can overload Solr with several workers')
+
+        if workers > 1:
+            pool = multiprocessing.Pool(workers, _init_index_worker)
+            results = pool.imap_unordered(_index_chunk, chunks)
+        else:
+            pool = None
+            ecportal_plugin.begin_translation_batch()
+            results = (_index_chunk(chunk) for chunk in chunks)
+
+        start = time.time()
+        total_indexed = 0
+        total_failed = 0
+        finished = False
+        try:
+            for done, (number, indexed, failed) in enumerate(results, 1):
+                total_indexed += indexed
+                total_failed += len(failed)
+                chunk_ids = chunks[number][1]
+                if not failed:
+                    with open(state_file, 'a') as f:
+                        f.write('%s %s\n' % (chunk_ids[0], chunk_ids[-1]))
+                elapsed = time.time() - start
+                print ('Indexed chunk %d/%d: %d datasets indexed, '
+                       '%d failed (%.1f datasets/s)') % (
+                    done, len(chunks), total_indexed, total_failed,
+                    total_indexed / elapsed if elapsed else 0)
+            finished = True
+        finally:
+            if pool:
+                # on Ctrl-C or an error in a worker, stop the chunks that
+                # are still queued rather than waiting for all of them
+                if finished:
+                    pool.close()
+                else:
+                    pool.terminate()
+                pool.join()
+            else:
+                ecportal_plugin.end_translation_batch()
+
+        if total_failed:
+            log.error('%d datasets could not be indexed, run the command '
+                      'again with --resume to retry them', total_failed)
+
+    def benchmark_before_index(self, count=100):
+        '''
+        Time the validation of the data_dict done by
+        ECPortalDatasetController.before_index for up to count datasets,
+        with the full db_to_form_schema and with the index schema, and
+        check that both give the same result.
+        '''
+        package_ids = [row[0] for row in
+                       model.Session.query(model.Package.id)
+                       .filter_by(state='active').limit(count)]
+        if not package_ids:
+            print 'No datasets to index'
+            return
+
+        context = {'model': model, 'ignore_auth': True, 'validate': False}
+        data_dicts = [
+            json.dumps(plugins.toolkit.get_action('package_show')(
+                context.copy(), {'id': package_id}))
+            for package_id in package_ids]
+
+        results = {}
+        for label, full_validation in [('full validation', True),
+                                       ('index schema', False)]:
+            start = time.time()
+            results[label] = [
+                json.dumps(controllers.validate_for_index(
+                    json.loads(data_dict), full_validation))
+                for data_dict in data_dicts]
+            elapsed = time.time() - start
+            print '%s: %.2f ms per dataset (%d datasets)' % (
+                label, 1000 * elapsed / len(data_dicts), len(data_dicts))
+
+        mismatches = [package_id for package_id, full, fast in
+                      zip(package_ids, results['full validation'],
+                          results['index schema'])
+                      if json.loads(full) != json.loads(fast)]
+        for package_id in mismatches:
+            print 'Validated data_dict differs for dataset %s' % package_id
+
+    def benchmark_sort_keys(self, count=100):
+        '''
+        Time the computation of the title sort keys of up to count datasets
+        in every language, as done by MulitlingualDataset.before_index, with
+        strip_accents and UNICODE_SORT and with unicode_sort.sort_key, and
+        check that both give the same keys.
+        '''
+        titles = [row[0] for row in
+                  model.Session.query(model.Package.title)
+                  .filter_by(state='active').limit(count)
+                  if row[0]]
+        if not titles:
+            print 'No datasets to index'
+            return
+
+        table = model.term_translation_table
+        translations = collections.defaultdict(dict)
+        for term, translation, lang_code in model.Session.query(
+                table.c.term, table.c.term_translation, table.c.lang_code)\
+                .filter(table.c.term.in_(titles)):
+            translations[term][lang_code] = translation
+        # the title of each dataset in each language, as in before_index
+        values = [translations[title].get(lang) or title
+                  for title in titles for lang in ecportal_plugin.LANGS]
+
+        def strip_accents_key(title):
+            return (unicode_sort.strip_accents(title) + '   ' +
+                    title).translate(unicode_sort.UNICODE_SORT)
+
+        results = {}
+        for label, sort_key in [('strip_accents', strip_accents_key),
+                                ('sort_key', unicode_sort.sort_key)]:
+            start = time.time()
+            results[label] = [sort_key(value) for value in values]
+            elapsed = time.time() - start
+            print '%s: %.3f ms per dataset (%d datasets, %d titles)' % (
+                label, 1000 * elapsed / len(titles), len(titles),
+                len(values))
+
+        mismatches = set(value for value, old, new in
+                         zip(values, results['strip_accents'],
+                             results['sort_key'])
+                         if old != new)
+        for value in mismatches:
+            print 'Sort key differs for title %r' % value
+
+    def benchmark_before_search(self, count=100):
+        '''
+        Time count searches in every language through the query parameters
+        set by MulitlingualDataset.before_search, building them for each
+        search as originally done and taking them from the query profiles,
+        and check that both give the same parameters.
+        '''
+        default_lang = pylons.config.get('ckan.locale_default')
+
+        def original_before_search(search_params, current_lang):
+            lang_set = set(ecportal_plugin.LANGS)
+            if not current_lang in lang_set:
+                current_lang = default_lang
+            if not current_lang in lang_set:
+                current_lang = 'en'
+            lang_set.remove(current_lang)
+
+            query_fields = 'title_%s^8 text_%s^4' % (current_lang,
+                                                     current_lang)
+            for lang in lang_set:
+                query_fields += ' title_%s^2 text_%s' % (lang, lang)
+            search_params['qf'] = query_fields
+
+            search_string = search_params.get('q') or ''
+            if not search_string and not search_params.get('sort'):
+                search_params['sort'] = 'title_string_%s asc' % current_lang
+            return search_params
+
+        searches = [{'q': ''}, {'q': 'population'},
+                    {'q': '', 'sort': 'modified_date desc'}]
+        langs = ecportal_plugin.LANGS + ['xx']
+
+        results = {}
+        for label, before_search in [
+                ('original', original_before_search),
+                ('query profiles', ecportal_plugin.apply_query_profile)]:
+            start = time.time()
+            results[label] = [
+                before_search(dict(searches[i % len(searches)]), lang)
+                for lang in langs for i in xrange(count)]
+            elapsed = time.time() - start
+            print '%s: %.2f us per search (%d searches)' % (
+                label, 1000000 * elapsed / len(results[label]),
+                len(results[label]))
+
+        def normalize(search_params):
+            return dict(search_params, qf=sorted(search_params['qf'].split()))
+
+        mismatches = set(
+            json.dumps(normalize(original))
+            for original, profiled in zip(results['original'],
+                                          results['query profiles'])
+            if normalize(original) != normalize(profiled))
+        for search_params in mismatches:
+            print 'Search parameters differ: %s' % search_params
@@ -1,5 +1,6 @@
 import logging
 import datetime
+import StringIO
 from pylons import response
 
 import ckan.lib.base as base
@@ -8,8 +9,11 @@ import ckan.model as model
 import ckan.plugins as p
 import ckan.lib.navl.dictization_functions
 import ckan.lib.helpers
+import ckan.logic.validators as val
 import ckanext.ecportal.forms as forms
+import ckanext.ecportal.validators as ecportal_validators
 import ckanext.ecportal.searchcloud as searchcloud
+import ckanext.ecportal.vocabularies as vocabularies
 
 log = logging.getLogger(__name__)
 _validate = ckan.lib.navl.dictization_functions.validate
@@ -36,26 +40,22 @@ class ECPortalSearchCloudAdminController(base.BaseController):
                 'You are not authorized to access search cloud administation'
             )
 
+    def _lang(self):
+        '''
+        Return the language of the search cloud being administered, or None
+        for the search cloud shown in languages that don't have their own.
+        '''
+        return p.toolkit.request.params.get('lang') or None
+
     def index(self):
         self._sysadmin_or_abort()
+        p.toolkit.c.languages = searchcloud.get_languages(model.Session)
         return p.toolkit.render('searchcloud/index.html')
 
-    def _parse_json(self, json_data):
+    def _parse_json(self, json_file):
+        values = []
         try:
-            rows = json.loads(json_data)
-        except:
-            raise SearchCloudException(
-                'JSON file could not be parsed. Please ensure file is valid'
-                ' JSON and pay careful attention to trailing commas.'
-            )
-        else:
-            values = []
-            if not isinstance(rows, list):
-                raise SearchCloudException(
-                    'JSON file does not contain a list of terms. Expected the'
-                    ' same format as the download.'
-                )
-            for i, row in enumerate(rows):
+            for i, row in enumerate(searchcloud.iter_json_list(json_file)):
                 if not isinstance(row, list):
                     raise SearchCloudException(
                         ('Row %i has a value %r. It is not a list of'
@@ -74,45 +74,60 @@ class ECPortalSearchCloudAdminController(base.BaseController):
                             "Row %i doesn't contain a search string" % (i,)
                         )
                     values.append([row[0].strip(), count])
-            return values
+        except TypeError:
+            raise SearchCloudException(
+                'JSON file does not contain a list of terms. Expected the'
+                ' same format as the download.'
+            )
+        except ValueError:
+            raise SearchCloudException(
+                'JSON file could not be parsed. Please ensure file is valid'
+                ' JSON and pay careful attention to trailing commas.'
+            )
+        return values
 
     def upload(self):
         self._sysadmin_or_abort()
+        p.toolkit.c.lang = self._lang()
         if p.toolkit.request.method == 'GET':
             return p.toolkit.render('searchcloud/upload.html')
         else:
             file_field = p.toolkit.request.POST['searchcloud']
-            data = file_field.value.decode('utf8')
             try:
-                rows = self._parse_json(data)
+                rows = self._parse_json(file_field.file)
             except SearchCloudException, e:
                 p.toolkit.c.error = str(e)
                 return p.toolkit.render('searchcloud/error.html')
             else:
                 p.toolkit.c.json = searchcloud.approved_to_json(rows)
-                p.toolkit.c.data = data
+                # the parsed rows are passed on to save() rather than the
+                # uploaded file, which may be much larger
+                p.toolkit.c.data = json.dumps(rows)
                 return p.toolkit.render('searchcloud/preview.html')
 
     def save(self):
         self._sysadmin_or_abort()
         data = p.toolkit.request.POST['searchcloud']
         try:
-            rows = self._parse_json(data)
+            rows = self._parse_json(StringIO.StringIO(data))
         except SearchCloudException, e:
             p.toolkit.c.error = str(e)
             return p.toolkit.render('searchcloud/error.html')
         else:
-            searchcloud.update_approved(model.Session, rows)
+            searchcloud.update_approved(model.Session, rows, self._lang())
             # Save our changes
             model.Session.commit()
             return p.toolkit.render('searchcloud/saved.html')
 
     def download(self):
         self._sysadmin_or_abort()
-        data = searchcloud.get_latest(model.Session)
+        lang = self._lang()
+        data = searchcloud.get_latest(model.Session, lang)
         # We don't know when the script is run, so let's assume just
         # after midnight and use today's date
         date = datetime.datetime.now().strftime('%Y-%m-%d')
+        if lang:
+            date = '%s-%s' % (lang, date)
         response.charset = 'utf8'
         response.content_type = 'application/json'
         response.headers['Content-Disposition'] = \
@@ -120,21 +135,59 @@ class ECPortalSearchCloudAdminController(base.BaseController):
         return json.dumps(data, indent=4)
 
 
-def _vocabularies(tag_name):
+# Validators in the dataset db_to_form_schema that never change the data,
+# they only record errors, which are discarded when indexing. Some of them
+# query the database for every dataset, so they are left out of the schema
+# used by before_index.
+_INDEX_SKIPPED_VALIDATORS = set([val.package_name_validator,
+                                 val.name_validator,
+                                 val.duplicate_extras_key,
+                                 ecportal_validators.duplicate_extras_key])
+_INDEX_SCHEMA = None
+
+
+def _strip_validators(schema, validators):
+    stripped = {}
+    for key, value in schema.iteritems():
+        if isinstance(value, dict):
+            stripped[key] = _strip_validators(value, validators)
+        else:
+            stripped[key] = [v for v in value if v not in validators]
+    return stripped
+
+
+def _index_schema():
+    '''
+    Return the schema used to validate datasets before indexing.
+
+    It is built once per process from the dataset db_to_form_schema,
+    without the validators in _INDEX_SKIPPED_VALIDATORS.
     '''
-    Return a list containing the names of each vocabulary that
-    contains the tag tag_name.
+    global _INDEX_SCHEMA
+    if _INDEX_SCHEMA is None:
+        _INDEX_SCHEMA = _strip_validators(_f.db_to_form_schema({}),
+                                          _INDEX_SKIPPED_VALIDATORS)
+    return _INDEX_SCHEMA
 
-    Returns an empty list if tag_name does not belong to any vocabulary.
 
-    If no such tag exists, throws a ckan.plugins.toolkit.ObjectNotFound
-    exception.
+def validate_for_index(data_dict, full_validation=False):
     '''
-    query = model.Session.query(model.tag.Tag.name,
-                                model.vocabulary.Vocabulary.name)\
-        .filter(model.tag.Tag.name == tag_name)\
-        .filter(model.tag.Tag.vocabulary_id == model.vocabulary.Vocabulary.id)
-    return [t[1] for t in query]
+    Return data_dict validated against the dataset db_to_form_schema, as
+    stored in the search index.
+
+    If full_validation is True the schema is rebuilt and every validator is
+    run, which gives the same result but is slower.
+    '''
+    context = {'model': model,
+               'session': model.Session,
+               'user': u''}
+    if full_validation:
+        schema = _f.db_to_form_schema({})
+    else:
+        schema = _index_schema()
+
+    validated_pkg, errors = _validate(data_dict, schema, context=context)
+    return validated_pkg
 
 
 class ECPortalDatasetController(p.SingletonPlugin):
@@ -166,15 +219,8 @@ class ECPortalDatasetController(p.SingletonPlugin):
 
     def before_index(self, pkg_dict):
         # save a validated version of the package dict in the search index
-        context = {'model': model,
-                   'session': model.Session,
-                   'user': u''}
-        schema = _f.db_to_form_schema({})
-
-        validated_pkg, errors = _validate(json.loads(pkg_dict['data_dict']),
-                                          schema,
-                                          context=context)
-        pkg_dict['data_dict'] = json.dumps(validated_pkg)
+        pkg_dict['data_dict'] = json.dumps(
+            validate_for_index(json.loads(pkg_dict['data_dict'])))
 
         pkg_dict.pop('rdf', None)
         pkg_dict.pop('extras_rdf', None)
@@ -184,7 +230,7 @@ class ECPortalDatasetController(p.SingletonPlugin):
         free_tags = []
 
         for tag in pkg_dict.get('tags'):
-            vocabs = _vocabularies(tag)
+            vocabs = vocabularies.vocabularies(tag)
             if vocabs:
                 for vocab in vocabs:
                     key = u'vocab_%s' % vocab
@@ -124,7 +124,9 @@ class ECPortalDatasetForm(p.SingletonPlugin):
         if new_group_id:
             try:
                 data = {'id': new_group_id}
-                new_group = p.toolkit.get_action('group_show')(context, data)
+                group_context = dict(context, ecodp_group_counts_only=True)
+                new_group = p.toolkit.get_action('group_show')(
+                    group_context, data)
                 c.new_group = new_group['name']
             except p.toolkit.ObjectNotFound:
                 c.new_group = None
@@ -1,6 +1,7 @@
 import logging
 import datetime
 import operator
+import threading
 import pylons.config as config
 import genshi
 import sqlalchemy.exc
@@ -12,41 +13,41 @@ import ckan.model as model
 import ckan.plugins as p
 import ckan.lib.search as search
 import ckan.lib.i18n as i18n
+import ckan.lib.base as base
 import ckan.logic as logic
 import ckan.lib.dictization as dictization
 from ckan.authz import Authorizer
+import ckanext.ecportal.cache as cache
 import ckanext.ecportal.unicode_sort as unicode_sort
 import ckanext.ecportal.searchcloud as searchcloud
+import ckanext.ecportal.translation as translation
 
 NUM_TOP_PUBLISHERS = 6
 NUM_MOST_VIEWED_DATASETS = 10
 UNICODE_SORT = unicode_sort.UNICODE_SORT
+
+# the results of recent_updates() and most_viewed_datasets() are cached for
+# ckan.ecportal.widget_cache.ttl seconds, or WIDGET_ERROR_TTL seconds if the
+# search failed
+DEFAULT_WIDGET_TTL = 60
+WIDGET_ERROR_TTL = 10
+_WIDGET_CACHE = None
+_MISSING = object()
+
+# the snippets rendered by cached_snippet() are cached for
+# ckan.ecportal.fragment_cache.ttl seconds, or at most WIDGET_ERROR_TTL
+# seconds if a widget search failed while rendering them
+DEFAULT_FRAGMENT_TTL = 300
+_FRAGMENT_CACHE = None
+# number of failed widget searches returned in each thread, see
+# _cached_search() and cached_snippet()
+_widget_errors = threading.local()
+
 log = logging.getLogger(__file__)
 
 
 def translate(terms, lang, fallback_lang):
-    translations = logic.get_action('term_translation_show')(
-        {'model': model},
-        {'terms': terms, 'lang_codes': [lang]}
-    )
-
-    term_translations = {}
-    for translation in translations:
-        term_translations[translation['term']] = \
-            translation['term_translation']
-
-    for term in terms:
-        if not term in term_translations:
-            translation = logic.get_action('term_translation_show')(
-                {'model': model},
-                {'terms': [term], 'lang_codes': [fallback_lang]}
-            )
-            if translation:
-                term_translations[term] = translation[0]['term_translation']
-            else:
-                term_translations[term] = term
-
-    return term_translations
+    return translation.translate(terms, lang, fallback_lang)
 
 
 def tags_and_translations(context, vocab, lang, lang_fallback):
@@ -96,10 +97,122 @@ def format_description(description):
         return genshi.HTML(error_msg)
 
 
-def recent_updates(n):
+def _widget_cache():
+    global _WIDGET_CACHE
+    if _WIDGET_CACHE is None:
+        _WIDGET_CACHE = cache.TTLCache(int(config.get(
+            'ckan.ecportal.widget_cache.ttl', DEFAULT_WIDGET_TTL)))
+    return _WIDGET_CACHE
+
+
+def _request_lang():
+    try:
+        return p.toolkit.request.environ.get('CKAN_LANG')
+    except TypeError:
+        # not called while handling a request
+        return None
+
+
+def _cached_search(name, n, run, error_result):
     '''
-    Return a list of the n most recently updated datasets.
+    Return run(n), cached for each language for
+    ckan.ecportal.widget_cache.ttl seconds. If run() raises a SearchError,
+    error_result is returned (and cached for WIDGET_ERROR_TTL seconds, so
+    that the search isn't repeated for every request while Solr is
+    unavailable).
+    '''
+    widgets = _widget_cache()
+    if not widgets.ttl:
+        try:
+            return run(n)
+        except search.SearchError, e:
+            log.error('Error searching for %s: %s', name, e)
+            _add_widget_error()
+            return error_result
+
+    key = (name, _request_lang(), n)
+    failed, result = widgets.get(key, (None, _MISSING))
+    if result is _MISSING:
+        try:
+            failed, result = False, run(n)
+            widgets.set(key, (failed, result))
+        except search.SearchError, e:
+            log.error('Error searching for %s: %s', name, e)
+            failed, result = True, error_result
+            widgets.set(key, (failed, result),
+                        min(widgets.ttl, WIDGET_ERROR_TTL))
+    if failed:
+        _add_widget_error()
+
+    # copy the cached list, which the caller may change
+    if result is not None:
+        result = list(result)
+    return result
+
+
+def _add_widget_error():
+    _widget_errors.count = _widget_error_count() + 1
+
+
+def _widget_error_count():
+    return getattr(_widget_errors, 'count', 0)
+
+
+def invalidate_search_widgets():
+    '''
+    Discard the results of recent_updates() and most_viewed_datasets()
+    cached by this process, called whenever a dataset is indexed or deleted.
+    '''
+    if _WIDGET_CACHE is not None:
+        _WIDGET_CACHE.clear()
+
+
+def _fragment_cache():
+    global _FRAGMENT_CACHE
+    if _FRAGMENT_CACHE is None:
+        _FRAGMENT_CACHE = cache.TTLCache(int(config.get(
+            'ckan.ecportal.fragment_cache.ttl', DEFAULT_FRAGMENT_TTL)))
+    return _FRAGMENT_CACHE
+
+
+def cached_snippet(template_name, **kw):
+    '''
+    Render the snippet template_name like h.snippet(), caching the output
+    for each language.
+
+    The snippet must only depend on the language and on data that is
+    shared by every user (the values of kw are not part of the cache key),
+    as the cached output is shown to everyone. The cache is cleared by
+    invalidate_fragments(). If a widget search fails while rendering the
+    snippet, the output is only cached for as long as the widget's error
+    result.
+    '''
+    fragments = _fragment_cache()
+    if not fragments.ttl:
+        return base.render_snippet(template_name, **kw)
+
+    key = (template_name, _request_lang())
+    output = fragments.get(key)
+    if output is None:
+        errors = _widget_error_count()
+        output = base.render_snippet(template_name, **kw)
+        if _widget_error_count() == errors:
+            fragments.set(key, output)
+        else:
+            fragments.set(key, output, min(fragments.ttl, WIDGET_ERROR_TTL))
+    return output
+
+
+def invalidate_fragments():
     '''
+    Discard the snippets cached by cached_snippet() in this process, called
+    whenever datasets or publishers are changed.
+    '''
+    if _FRAGMENT_CACHE is not None:
+        _FRAGMENT_CACHE.clear()
+
+
+def _recent_updates(n):
     context = {'model': model,
                'session': model.Session,
                'user': p.toolkit.c.user or p.toolkit.c.author}
@@ -107,13 +220,17 @@ def recent_updates(n):
             'sort': u'modified_date desc',
             'facet': u'false',
             'fq': u'capacity: "public"'}
-    try:
-        search_results = p.toolkit.get_action('package_search')(context, data)
-    except search.SearchError:
-        search_results = {}
+    search_results = p.toolkit.get_action('package_search')(context, data)
     return search_results.get('results', [])
 
 
+def recent_updates(n):
+    '''
+    Return a list of the n most recently updated datasets.
+    '''
+    return _cached_search('recent updates', n, _recent_updates, [])
+
+
 def top_publishers(groups):
     '''
     Updates the 'packages' field in each group dict (up to a maximum
@@ -175,13 +292,7 @@ def groups_available(user):
         ckan_lang, ckan_lang_fallback)
 
     def sort_translations(key):
-        # Strip accents first and if equivilant do next stage comparison.
-        # leaving space and concatenating is to avoid having todo a real
-        # 2 level sort.
-        display_name = key[1]
-        return (unicode_sort.strip_accents(display_name) +
-                '   ' +
-                display_name).translate(UNICODE_SORT)
+        return unicode_sort.sort_key(key[1])
 
     publishers = [
         (group['name'],
@@ -245,17 +356,50 @@ def resource_dropdown():
 _RESOURCE_MAPPING = None
 
 
-def resource_mapping():
+class ResourceMapping(object):
+    '''
+    The contents of resource_mapping.json, which maps resource formats,
+    mimetypes and file extensions to a [canonical format, display name,
+    default resource name] list, split into one dict for each of them.
+    '''
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+        self.formats = {}
+        self.display_names = {}
+        self.resource_names = {}
+        for key, (format, display_name, resource_name) in \
+                mapping.iteritems():
+            self.formats[key] = format
+            self.display_names[key] = display_name
+            self.resource_names[key] = resource_name
+
+
+def resource_formats():
+    '''
+    Return the ResourceMapping of the ckan.resource_mapping file, which is
+    loaded again whenever the file changes, or an empty ResourceMapping if
+    the file has never been loaded successfully.
+    '''
     global _RESOURCE_MAPPING
-    if not _RESOURCE_MAPPING:
+    if _RESOURCE_MAPPING is None:
         file_location = config.get(
             'ckan.resource_mapping',
             '/applications/ecodp/users/ecodp/ckan/ecportal/src/ckanext-ecportal/data/resource_mapping.json'
         )
-        with open(file_location) as resource_file:
-            _RESOURCE_MAPPING = json.loads(resource_file.read())
+        _RESOURCE_MAPPING = cache.ReloadableFile(
+            file_location,
+            lambda resource_file: ResourceMapping(json.load(resource_file)))
+
+    mapping = _RESOURCE_MAPPING.get()
+    if mapping is None:
+        # the error has been logged by ReloadableFile
+        return ResourceMapping({})
+    return mapping
 
-    return _RESOURCE_MAPPING
+
+def resource_mapping():
+    return resource_formats().mapping
 
 
 def resource_display_format(resource_dict):
@@ -263,9 +407,7 @@ def resource_display_format(resource_dict):
 
 
 def format_display_name(format):
-    if format in resource_mapping():
-        format = resource_mapping()[format][1]
-    return format
+    return resource_formats().display_names.get(format, format)
 
 
 def dataset_resource_formats(resources):
@@ -279,32 +421,32 @@ def dataset_resource_formats(resources):
     return list(set([r['format'] for r in resources if r.get('format')]))
 
 
+def _most_viewed_datasets(num_datasets):
+    data = {'rows': num_datasets,
+            'sort': u'views_total desc',
+            'facet': u'false',
+            'fq': u'capacity: "public"',
+            'fl': 'id, name, title, views_total'}
+    # Ugly: going through ckan.lib.search directly
+    # (instead of get_action('package_search').
+    #
+    # TODO: Can we return views_total using package_search for internal
+    # use only (without outputting it during public API calls)?
+    query = search.query_for(model.Package)
+    result = query.run(data)
+    return [r for r in result.get('results', [])
+            if r.get('views_total', 0) > 0]
+
+
 def most_viewed_datasets(num_datasets=NUM_MOST_VIEWED_DATASETS):
-    try:
-        data = {'rows': num_datasets,
-                'sort': u'views_total desc',
-                'facet': u'false',
-                'fq': u'capacity: "public"',
-                'fl': 'id, name, title, views_total'}
-        # Ugly: going through ckan.lib.search directly
-        # (instead of get_action('package_search').
-        #
-        # TODO: Can we return views_total using package_search for internal
-        # use only (without outputting it during public API calls)?
-        query = search.query_for(model.Package)
-        result = query.run(data)
-        return [r for r in result.get('results', [])
-                if r.get('views_total', 0) > 0]
-    except search.SearchError, e:
-        log.error('Error searching for most viewed datasets')
-        log.error(e)
+    return _cached_search('most viewed datasets', num_datasets,
+                          _most_viewed_datasets, None)
 
 
 def approved_search_terms():
     try:
-        terms = searchcloud.get_approved(model.Session)
-        if terms:
-            return searchcloud.approved_to_json(terms)
+        return searchcloud.approved_cloud(model.Session,
+                                          str(current_locale()))
     except sqlalchemy.exc.ProgrammingError:
         log.error('Could not retrieve search cloud results from database. '
                   'Do the tables exist? Rolling back the session.')
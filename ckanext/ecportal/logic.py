@@ -1,17 +1,47 @@
+import json
+import pylons.config as config
+import sqlalchemy
+
 import ckan.logic as logic
 import ckan.plugins as plugins
 import ckan.lib.dictization as d
 import ckan.lib.navl.dictization_functions
 import ckan.lib.plugins as lib_plugins
 import urlparse
+from ckan.authz import Authorizer
 
+import ckanext.ecportal.cache as cache
 import ckanext.ecportal.schema as schema
+import ckanext.ecportal.translation as translation
 import ckanext.ecportal.helpers as helpers
 import ckanext.ecportal.unicode_sort as unicode_sort
+import ckanext.ecportal.vocabularies as vocabularies
 UNICODE_SORT = unicode_sort.UNICODE_SORT
 _RESOURCE_MAPPING = None
 
+# fields of a resource set by _change_resource_details, and the number of
+# resource revisions whose values are cached
+_RESOURCE_DETAILS_FIELDS = ('format', 'name', 'description')
+_RESOURCE_DETAILS = cache.LRUCache(10000)
+
+# the sorted group lists shown in the web UI (rebuilt at least every
+# ckan.ecportal.group_list.max_age seconds, to pick up changes made by
+# other processes)
+DEFAULT_GROUP_LIST_MAX_AGE = 300
+_GROUP_LIST_CACHE = cache.TTLCache(DEFAULT_GROUP_LIST_MAX_AGE, 1000)
+
+# optional cache of package_show results, see _package_show_cache()
+_PACKAGE_SHOW_CACHE = None
+DEFAULT_PACKAGE_CACHE_SIZE = 1000
+DEFAULT_PACKAGE_CACHE_TTL = 300
+# package_show is not cached when called with any of these in the context,
+# or with validate set to False
+_PACKAGE_SHOW_UNCACHED_CONTEXT = set(['schema', 'revision_id',
+                                      'revision_date', 'for_edit',
+                                      'for_view'])
+
 _validate = ckan.lib.navl.dictization_functions.validate
+_MISSING = object()
 
 
 def _get_filename_and_extension(resource):
@@ -86,7 +116,6 @@ def group_update(context, data_dict):
     :rtype: dictionary
     '''
     model = context['model']
-    session = context['session']
 
     id = data_dict.get('id')
     group = model.Group.get(id)
@@ -94,25 +123,51 @@ def group_update(context, data_dict):
     if group is None:
         raise logic.NotFound('Group was not found.')
 
+    # can't save display_name so remove it from data_dict
+    data_dict.pop('display_name', None)
+
     # If the context requires it, then update the packages, as would normally
     # happen with the group_update action.
-    if not context.get('ecodp_update_packages', False):
-
-        members = session.query(model.Member.table_id).filter_by(
-            table_name='package',
-            group_id=group.id,
-            state='active'
-        ).all()
-        packages = []
-
-        for member in members:
-            packages.append({'name': member[0]})
-        data_dict['packages'] = packages
+    if context.get('ecodp_update_packages', False):
+        return logic.action.update.group_update(context, data_dict)
+
+    # Leave 'packages' out and ask core to keep the existing package
+    # memberships as they are, rather than loading every package and saving
+    # all of the memberships again. The other member lists are replaced as
+    # in a full update, so missing ones still remove every member.
+    for key in ('users', 'groups', 'tags', 'extras'):
+        data_dict.setdefault(key, [])
+    data_dict.pop('packages', None)
+    allow_partial_update = context.get('allow_partial_update', _MISSING)
+    context['allow_partial_update'] = True
+    try:
+        return logic.action.update.group_update(context, data_dict)
+    finally:
+        if allow_partial_update is _MISSING:
+            del context['allow_partial_update']
+        else:
+            context['allow_partial_update'] = allow_partial_update
 
-    # can't save display_name so remove it from data_dict
-    data_dict.pop('display_name', None)
 
-    return logic.action.update.group_update(context, data_dict)
+def _group_member_counts(group, context):
+    '''
+    Return a dict mapping the member types of group ('package', 'user',
+    'group' and 'tag') to the number of active members of that type,
+    counted with a single query.
+    '''
+    model = context['model']
+    session = context['session']
+    package_table = model.package_table
+    active_packages = sqlalchemy.select([package_table.c.id],
+                                        package_table.c.state == 'active')
+    query = session.query(model.Member.table_name,
+                          sqlalchemy.func.count(model.Member.id))\
+        .filter(model.Member.group_id == group.id)\
+        .filter(model.Member.state == 'active')\
+        .filter(sqlalchemy.or_(model.Member.table_name != 'package',
+                               model.Member.table_id.in_(active_packages)))\
+        .group_by(model.Member.table_name)
+    return dict(query.all())
 
 
 # copy of group_dictize form core only change removing package_list dictize
@@ -125,6 +180,13 @@ def group_dictize(group, context):
     result_dict['extras'] = d.model_dictize.extras_dict_dictize(
         group._extras, context)
 
+    # only count the members of the group, for pages listing publishers
+    if context.get('ecodp_group_counts_only', False):
+        counts = _group_member_counts(group, context)
+        for member_type in ('package', 'user', 'group', 'tag'):
+            result_dict[member_type + '_count'] = counts.get(member_type, 0)
+        return result_dict
+
     context['with_capacity'] = True
 
     if context.get('ecodp_with_package_list', False):
@@ -200,12 +262,15 @@ def sort_group(key):
         display_name = key
     else:
         display_name = key.get('display_name', '')
-    # Strip accents first and if equivilant do next stage comparison.
-    # Leaving space and concatenating is to avoid having todo a real
-    # 2 level sort.
-    return (unicode_sort.strip_accents(display_name) +
-            '   ' +
-            display_name).translate(UNICODE_SORT)
+    return unicode_sort.sort_key(display_name)
+
+
+def invalidate_group_list():
+    '''
+    Discard the group lists cached by group_list() in this process, called
+    whenever groups or their datasets are created, updated or deleted.
+    '''
+    _GROUP_LIST_CACHE.clear()
 
 
 def group_list(context, data_dict):
@@ -227,9 +292,18 @@ def group_list(context, data_dict):
 
     :rtype: list of strings
     '''
-    groups = logic.action.get.group_list(context, data_dict)
+    if not context.get('for_view', False):
+        return sorted(logic.action.get.group_list(context, data_dict),
+                      key=sort_group)
+
+    # the lists shown in the web UI are cached for each language, as the
+    # group titles are translated
+    key = (str(helpers.current_locale()),
+           json.dumps(data_dict, sort_keys=True))
+    cached = _GROUP_LIST_CACHE.get(key)
+    if cached is None:
+        groups = logic.action.get.group_list(context, data_dict)
 
-    if context.get('for_view', False):
         # in the web UI only list publishers with published datasets
 
         # depending upon the context, group['packages'] may be either a
@@ -239,25 +313,27 @@ def group_list(context, data_dict):
         else:
             groups = [g for g in groups if len(g['packages']) > 0]
 
-    return sorted(groups, key=sort_group)
+        cached = sorted(groups, key=sort_group)
+        _GROUP_LIST_CACHE.set(key, cached, int(config.get(
+            'ckan.ecportal.group_list.max_age', DEFAULT_GROUP_LIST_MAX_AGE)))
 
+    # copy the cached groups, which the caller may change
+    return [dict(group) for group in cached]
 
-def _change_resource_details(resource):
-    formats = helpers.resource_mapping().keys()
+
+def _normalize_resource_details(resource, mapping):
     resource_format = resource.get('format', '').lower().lstrip('.')
     filename, extension = _get_filename_and_extension(resource)
     if not resource_format:
         resource_format = extension
-    if resource_format in formats:
-        resource['format'] = helpers.resource_mapping()[resource_format][0]
+    if resource_format in mapping.formats:
+        resource['format'] = mapping.formats[resource_format]
         if resource.get('name', '') in ['Unnamed resource', '', None]:
-            resource['name'] = helpers.resource_mapping()[resource_format][2]
-            if filename:
-                resource['name'] = resource['name']
+            resource['name'] = mapping.resource_names[resource_format]
     elif resource.get('name', '') in ['Unnamed resource', '', None]:
         if extension and not resource_format:
-            if extension in formats:
-                resource['format'] = helpers.resource_mapping()[extension][0]
+            if extension in mapping.formats:
+                resource['format'] = mapping.formats[extension]
             else:
                 resource['format'] = extension.upper()
         resource['name'] = 'Web Page'
@@ -266,6 +342,104 @@ def _change_resource_details(resource):
         resource['description'] = filename
 
 
+def _change_resource_details(resource):
+    '''
+    Normalise the format, name and description of resource for display.
+
+    The result only depends on the resource and the resource mapping, so it
+    is cached for each revision of the resource, and the URL is only parsed
+    again once the resource or the mapping has changed.
+    '''
+    mapping = helpers.resource_formats()
+    revision_id = resource.get('revision_id')
+    if not revision_id:
+        _normalize_resource_details(resource, mapping)
+        return
+
+    # the mapping is part of the key so that a reloaded mapping is used
+    key = (resource.get('id'), revision_id, mapping)
+    details = _RESOURCE_DETAILS.get(key)
+    if details is None:
+        _normalize_resource_details(resource, mapping)
+        details = dict((field, resource[field])
+                       for field in _RESOURCE_DETAILS_FIELDS
+                       if field in resource)
+        _RESOURCE_DETAILS.set(key, details)
+    else:
+        resource.update(details)
+
+
+def _package_show_cache():
+    '''
+    Return the cache of package_show results set by the
+    ckan.ecportal.package_cache option ("memory" or "redis"), or None if the
+    results are not cached.
+    '''
+    global _PACKAGE_SHOW_CACHE
+    if _PACKAGE_SHOW_CACHE is None:
+        backend = config.get('ckan.ecportal.package_cache', '')
+        ttl = int(config.get('ckan.ecportal.package_cache.ttl',
+                             DEFAULT_PACKAGE_CACHE_TTL))
+        if backend == 'memory':
+            _PACKAGE_SHOW_CACHE = cache.MemoryHashCache(
+                int(config.get('ckan.ecportal.package_cache.size',
+                               DEFAULT_PACKAGE_CACHE_SIZE)), ttl)
+        elif backend == 'redis':
+            _PACKAGE_SHOW_CACHE = cache.RedisHashCache(
+                config.get('ckan.ecportal.package_cache.redis_url',
+                           'redis://localhost:6379/0'),
+                ttl, prefix='ckanext-ecportal:package_show:')
+        else:
+            _PACKAGE_SHOW_CACHE = False
+    return _PACKAGE_SHOW_CACHE or None
+
+
+def _request_attribute(name):
+    try:
+        return getattr(plugins.toolkit.c, name, None)
+    except TypeError:
+        # not called while handling a request
+        return None
+
+
+def _auth_capacity(context):
+    '''
+    Return the capacity in which the user of context sees datasets, which is
+    part of the key of the cached package_show results.
+
+    The sysadmin status is taken from the user object already loaded for
+    the request where possible, and otherwise looked up once per request.
+    '''
+    user = context.get('user')
+    if not user:
+        return 'public'
+
+    user_obj = context.get('auth_user_obj') or _request_attribute('userobj')
+    if not user_obj or user_obj.name != user:
+        is_sysadmin = Authorizer().is_sysadmin(unicode(user))
+    elif hasattr(user_obj, 'sysadmin'):
+        is_sysadmin = user_obj.sysadmin
+    else:
+        is_sysadmin = _request_attribute('ecodp_is_sysadmin')
+        if is_sysadmin in (None, ''):
+            is_sysadmin = Authorizer().is_sysadmin(unicode(user))
+            plugins.toolkit.c.ecodp_is_sysadmin = is_sysadmin
+
+    if is_sysadmin:
+        return 'sysadmin'
+    return u'user:' + user
+
+
+def invalidate_package_show(package_id):
+    '''
+    Discard the cached package_show results of a dataset, called whenever
+    the dataset is updated or deleted.
+    '''
+    package_cache = _package_show_cache()
+    if package_cache is not None:
+        package_cache.delete(package_id)
+
+
 def package_show(context, data_dict):
     '''Return the metadata of a dataset (package) and its resources.
 
@@ -275,6 +449,36 @@ def package_show(context, data_dict):
     :rtype: dictionary
 
     '''
+    package_cache = _package_show_cache()
+    if package_cache is None or \
+            _PACKAGE_SHOW_UNCACHED_CONTEXT.intersection(context) or \
+            not context.get('validate', True):
+        return _package_show(context, data_dict)
+
+    model = context['model']
+    pkg = model.Package.get(data_dict.get('id') or
+                            data_dict.get('name_or_id') or '')
+    if pkg is None:
+        # let core raise the usual error
+        return _package_show(context, data_dict)
+
+    # the same checks as core, which isn't called for cached results
+    context['session'] = model.Session
+    context['package'] = pkg
+    plugins.toolkit.check_access('package_show', context, data_dict)
+
+    field = u'%s:%s:%s' % (pkg.revision_id, context.get('api_version', ''),
+                           _auth_capacity(context))
+    cached = package_cache.get(pkg.id, field)
+    if cached is not None:
+        return json.loads(cached)
+
+    result = _package_show(context, data_dict)
+    package_cache.set(pkg.id, field, json.dumps(result))
+    return result
+
+
+def _package_show(context, data_dict):
     # Override package_show to sort the resources by name
     result = logic.action.get.package_show(context, data_dict)
 
@@ -404,6 +608,103 @@ def resource_show(context, data_dict):
     return resource
 
 
+# wrappers around the resource and member actions, which change a dataset
+# without calling the edit hook of IPackageController, keeping the cached
+# package_show results up to date
+
+def _invalidate_package_show(context, package_id):
+    pkg = context['model'].Package.get(package_id or '')
+    if pkg is not None:
+        invalidate_package_show(pkg.id)
+
+
+def _resource_package_id(context, resource_id):
+    resource = context['model'].Resource.get(resource_id or '')
+    if resource is not None and resource.resource_group is not None:
+        return resource.resource_group.package_id
+
+
+def resource_create(context, data_dict):
+    resource = logic.action.create.resource_create(context, data_dict)
+    _invalidate_package_show(context, data_dict.get('package_id'))
+    return resource
+
+
+def resource_update(context, data_dict):
+    package_id = _resource_package_id(context, data_dict.get('id'))
+    resource = logic.action.update.resource_update(context, data_dict)
+    _invalidate_package_show(context, package_id)
+    return resource
+
+
+def resource_delete(context, data_dict):
+    package_id = _resource_package_id(context, data_dict.get('id'))
+    logic.action.delete.resource_delete(context, data_dict)
+    _invalidate_package_show(context, package_id)
+
+
+def member_create(context, data_dict):
+    member = logic.action.create.member_create(context, data_dict)
+    if data_dict.get('object_type') == 'package':
+        _invalidate_package_show(context, data_dict.get('object'))
+        invalidate_group_list()
+    return member
+
+
+def member_delete(context, data_dict):
+    logic.action.delete.member_delete(context, data_dict)
+    if data_dict.get('object_type') == 'package':
+        _invalidate_package_show(context, data_dict.get('object'))
+        invalidate_group_list()
+
+
+# wrappers around the vocabulary and tag actions, keeping the in-memory
+# vocabulary index used when indexing datasets up to date
+
+def vocabulary_create(context, data_dict):
+    vocab = logic.action.create.vocabulary_create(context, data_dict)
+    vocabularies.invalidate()
+    return vocab
+
+
+def vocabulary_update(context, data_dict):
+    vocab = logic.action.update.vocabulary_update(context, data_dict)
+    vocabularies.invalidate()
+    return vocab
+
+
+def vocabulary_delete(context, data_dict):
+    logic.action.delete.vocabulary_delete(context, data_dict)
+    vocabularies.invalidate()
+
+
+def tag_create(context, data_dict):
+    tag = logic.action.create.tag_create(context, data_dict)
+    vocabularies.invalidate()
+    return tag
+
+
+def tag_delete(context, data_dict):
+    logic.action.delete.tag_delete(context, data_dict)
+    vocabularies.invalidate()
+
+
+# wrappers around the term translation actions, keeping the translations
+# cached by translation.translate() up to date
+
+def term_translation_update(context, data_dict):
+    result = logic.action.update.term_translation_update(context, data_dict)
+    translation.invalidate()
+    return result
+
+
+def term_translation_update_many(context, data_dict):
+    result = logic.action.update.term_translation_update_many(context,
+                                                              data_dict)
+    translation.invalidate()
+    return result
+
+
 def purge_publisher_datasets(context, data_dict):
     '''
     Purge all deleted datasets belonging to a given publisher.
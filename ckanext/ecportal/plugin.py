@@ -1,18 +1,20 @@
 import logging
 import json
-import sqlalchemy.exc
 import pylons.config
 import pylons
 
 import ckan.model as model
+import ckan.logic as logic
 import ckan.plugins as p
 import ckan.config.routing as routing
 import ckanext.multilingual.plugin as multilingual
 
 import ckanext.ecportal.logic as ecportal_logic
 import ckanext.ecportal.auth as ecportal_auth
+import ckanext.ecportal.cache as cache
 import ckanext.ecportal.searchcloud as searchcloud
 import ckanext.ecportal.helpers as helpers
+import ckanext.ecportal.translation as translation
 import ckanext.ecportal.unicode_sort as unicode_sort
 
 log = logging.getLogger(__file__)
@@ -26,8 +28,59 @@ KEYS_TO_IGNORE = ['state', 'revision_id', 'id',  # title done seperately
                   'metadata_created', 'metadata_modified', 'site_id',
                   'data_dict', 'rdf']
 
+# term translations shared by every dataset indexed in the current batch,
+# see begin_translation_batch()
+_index_translations = None
+
+
+def begin_translation_batch(terms=None):
+    '''
+    Start an indexing batch.
+
+    The translations of terms (or of every term, if terms is None) into all
+    of LANGS are loaded with a single query and reused by
+    MulitlingualDataset.before_index until end_translation_batch() is
+    called, instead of querying term_translation twice per dataset.
+    '''
+    global _index_translations
+    _index_translations = translation.TermTranslations(LANGS)
+    _index_translations.load(terms)
+
+
+def end_translation_batch():
+    global _index_translations
+    _index_translations = None
+
+
+def _index_text_fields():
+    '''
+    Return the set of dataset fields whose values are indexed (and
+    translated) in the text_<lang> fields, or None to use every field that
+    is not in KEYS_TO_IGNORE.
+    '''
+    text_fields = pylons.config.get('ckan.ecportal.index.text_fields')
+    if text_fields is None:
+        return None
+    return set(text_fields.split())
+
+
+def _index_term_translations(terms):
+    if _index_translations is None and p.toolkit.asbool(
+            pylons.config.get('ckan.ecportal.index.preload_translations')):
+        begin_translation_batch()
+
+    if _index_translations is not None:
+        return _index_translations.show(terms)
+
+    return p.toolkit.get_action('term_translation_show')(
+        {'model': model},
+        {'terms': terms,
+         'lang_codes': LANGS})
+
 
 class MulitlingualDataset(multilingual.MultilingualDataset):
+    p.implements(p.IConfigurable)
+
     def before_index(self, search_data):
         # same code as in ckanext multilingual except language codes and
         # where mareked
@@ -40,89 +93,222 @@ class MulitlingualDataset(multilingual.MultilingualDataset):
         # translate title
         title = search_data.get('title')
         search_data['title_' + default_lang] = title
-        title_translations = p.toolkit.get_action('term_translation_show')(
-            {'model': model},
-            {'terms': [title],
-             'lang_codes': LANGS})
+        title_translations = _index_term_translations([title])
 
-        for translation in title_translations:
-            title_field = 'title_' + translation['lang_code']
-            search_data[title_field] = translation['term_translation']
+        for term_translation in title_translations:
+            title_field = 'title_' + term_translation['lang_code']
+            search_data[title_field] = term_translation['term_translation']
 
         # EC change add sort order field.
+        # The sort key is only computed once for each distinct title. With
+        # the title sort fallback, languages without a title of their own
+        # get no field, and are sorted on title_sort instead (see
+        # before_search).
+        fallback = _title_sort_fallback()
+        sort_keys = {}
         for lang in LANGS:
-            title_field = 'title_' + lang
-            title_value = search_data.get(title_field)
-            title_string_field = 'title_string_' + lang
+            title_value = search_data.get('title_' + lang)
             if not title_value:
                 title_value = title
+            if fallback and title_value == title:
+                continue
 
-            # Strip accents first and if equivilant do next stage comparison.
-            # Leaving space and concatonating is to avoid having todo a real
-            # 2 level sort.
-            sortable_title = \
-                unicode_sort.strip_accents(title_value) + '   ' + title_value
-            search_data[title_string_field] = \
-                sortable_title.translate(UNICODE_SORT)
+            sort_key = sort_keys.get(title_value)
+            if sort_key is None:
+                sort_key = sort_keys[title_value] = \
+                    unicode_sort.sort_key(title_value)
+            search_data['title_string_' + lang] = sort_key
 
         ##########################################
 
         ## translate rest
+        # EC change: only the fields in ckan.ecportal.index.text_fields (if
+        # set) are used, and each distinct term only once.
+        text_fields = _index_text_fields()
         all_terms = []
+        seen_terms = set()
         for key, value in search_data.iteritems():
             if key in KEYS_TO_IGNORE or key.startswith('title'):
                 continue
-            if isinstance(value, list):
-                all_terms.extend(value)
-            elif not isinstance(value, basestring):
+            if text_fields is not None and key not in text_fields:
                 continue
-            else:
-                all_terms.append(value)
+            if not isinstance(value, list):
+                value = [value]
+            for term in value:
+                if isinstance(term, basestring) and term not in seen_terms:
+                    seen_terms.add(term)
+                    all_terms.append(term)
 
-        field_translations = p.toolkit.get_action('term_translation_show')(
-            {'model': model},
-            {'terms': all_terms,
-             'lang_codes': LANGS})
+        field_translations = _index_term_translations(all_terms)
 
         text_field_items = dict(('text_' + lang, []) for lang in LANGS)
 
         text_field_items['text_' + default_lang].extend(all_terms)
 
-        for translation in sorted(field_translations):
-            lang_field = 'text_' + translation['lang_code']
+        for term_translation in field_translations:
+            lang_field = 'text_' + term_translation['lang_code']
             text_field_items[lang_field].append(
-                translation['term_translation'])
+                term_translation['term_translation'])
 
         for key, value in text_field_items.iteritems():
             search_data[key] = ' '.join(value)
 
         return search_data
 
+    def configure(self, config):
+        global _query_profiles
+        _query_profiles = _load_query_profiles(config)
+
     def before_search(self, search_params):
-        lang_set = set(LANGS)
-        current_lang = pylons.request.environ['CKAN_LANG']
-        # fallback to default locale if locale not in suported langs
-        if not current_lang in lang_set:
-            current_lang = pylons.config.get('ckan.locale_default')
+        return apply_query_profile(search_params,
+                                   pylons.request.environ['CKAN_LANG'])
+
+
+class QueryProfile(object):
+    '''
+    The Solr query parameters used when searching in one language: the
+    query fields (qf), and the sort order used when there are no search
+    terms.
+    '''
+
+    def __init__(self, lang, qf, sort, title_sort_fallback=False):
+        self.lang = lang
+        self.qf = qf
+        self.sort = sort
+        self.title_sort_fallback = title_sort_fallback
+
+
+class QueryProfiles(object):
+    '''
+    Registry of the QueryProfile of each language in langs, built once.
+
+    The title and text fields of the current language are boosted by the
+    first value of title_boosts and text_boosts, and those of the other
+    languages by the second value, multiplied by the factor for that
+    language in lang_boosts (if any). Languages with a factor of 0 are not
+    searched unless they are the current language.
+    '''
+
+    def __init__(self, langs, default_lang, title_boosts=(8, 2),
+                 text_boosts=(4, 1), lang_boosts=None,
+                 title_sort_fallback=False):
+        lang_boosts = lang_boosts or {}
         # fallback to english if default locale is not supported
-        if not current_lang in lang_set:
-            current_lang = 'en'
-        # treat current lang differenly so remove from set
-        lang_set.remove(current_lang)
+        if default_lang not in langs:
+            default_lang = 'en'
+        self.default_lang = default_lang
+
+        self._profiles = {}
+        for current_lang in langs:
+            # weight current lang more highly
+            query_fields = [
+                _boosted_field('title_' + current_lang, title_boosts[0]),
+                _boosted_field('text_' + current_lang, text_boosts[0])]
+            for lang in langs:
+                boost = lang_boosts.get(lang, 1)
+                if lang == current_lang or not boost:
+                    continue
+                query_fields.append(_boosted_field(
+                    'title_' + lang, title_boosts[1] * boost))
+                query_fields.append(_boosted_field(
+                    'text_' + lang, text_boosts[1] * boost))
+
+            sort = 'title_string_%s asc' % current_lang
+            if title_sort_fallback:
+                sort = _add_title_sort_fallback(sort)
+
+            self._profiles[current_lang] = QueryProfile(
+                current_lang, ' '.join(query_fields), sort,
+                title_sort_fallback)
+
+    def get(self, lang):
+        '''
+        Return the QueryProfile of lang, or of the default language if lang
+        is not supported.
+        '''
+        profile = self._profiles.get(lang)
+        if profile is None:
+            profile = self._profiles[self.default_lang]
+        return profile
+
+
+def _boosted_field(field, boost):
+    if boost == 1:
+        return field
+    return '%s^%g' % (field, boost)
+
+
+def _parse_boosts(value, default):
+    if not value:
+        return default
+    return tuple(float(boost) for boost in value.split())
+
+
+def _load_query_profiles(config):
+    lang_boosts = {}
+    for item in config.get('ckan.ecportal.search.lang_boosts', '').split():
+        lang, boost = item.split(':')
+        lang_boosts[lang] = float(boost)
+
+    return QueryProfiles(
+        LANGS,
+        config.get('ckan.locale_default', 'en'),
+        title_boosts=_parse_boosts(
+            config.get('ckan.ecportal.search.title_boosts'), (8, 2)),
+        text_boosts=_parse_boosts(
+            config.get('ckan.ecportal.search.text_boosts'), (4, 1)),
+        lang_boosts=lang_boosts,
+        title_sort_fallback=p.toolkit.asbool(
+            config.get('ckan.ecportal.index.title_sort_fallback')))
+
+
+_query_profiles = None
+
+
+def query_profiles():
+    global _query_profiles
+    if _query_profiles is None:
+        _query_profiles = _load_query_profiles(pylons.config)
+    return _query_profiles
+
+
+def apply_query_profile(search_params, lang):
+    '''
+    Set the query fields and the default sort order of search_params for
+    searching in lang, as done by MulitlingualDataset.before_search.
+    '''
+    profile = query_profiles().get(lang)
+    search_params['qf'] = profile.qf
+
+    if not search_params.get('sort'):
+        search_string = search_params.get('q') or ''
+        if not search_string:
+            search_params['sort'] = profile.sort
+    elif profile.title_sort_fallback:
+        search_params['sort'] = _add_title_sort_fallback(
+            search_params['sort'])
 
-        # weight current lang more highly
-        query_fields = 'title_%s^8 text_%s^4' % (current_lang, current_lang)
+    return search_params
 
-        for lang in lang_set:
-            query_fields += ' title_%s^2 text_%s' % (lang, lang)
 
-        search_params['qf'] = query_fields
+def _title_sort_fallback():
+    return p.toolkit.asbool(
+        pylons.config.get('ckan.ecportal.index.title_sort_fallback'))
 
-        search_string = search_params.get('q') or ''
-        if not search_string and not search_params.get('sort'):
-            search_params['sort'] = 'title_string_%s asc' % current_lang
 
-        return search_params
+def _add_title_sort_fallback(sort):
+    '''
+    Add title_sort after each title_string_<lang> field in the Solr sort
+    parameter sort, in the same direction, so that datasets without a title
+    of their own in that language are sorted on their original title.
+    '''
+    clauses = []
+    for clause in sort.split(','):
+        clauses.append(clause)
+        parts = clause.split()
+        if len(parts) == 2 and parts[0].startswith('title_string_'):
+            clauses.append('title_sort ' + parts[1])
+    return ','.join(clauses)
 
 
 class ECPortalPlugin(p.SingletonPlugin):
@@ -131,6 +317,7 @@ class ECPortalPlugin(p.SingletonPlugin):
     p.implements(p.IActions)
     p.implements(p.IAuthFunctions)
     p.implements(p.IPackageController, inherit=True)
+    p.implements(p.IGroupController, inherit=True)
     p.implements(p.ITemplateHelpers)
 
     def get_auth_functions(self):
@@ -148,8 +335,26 @@ class ECPortalPlugin(p.SingletonPlugin):
             'purge_task_data': ecportal_auth.purge_task_data
         }
 
+    # create, edit and delete are called with datasets (IPackageController)
+    # and groups (IGroupController)
+
+    def create(self, entity):
+        ecportal_logic.invalidate_group_list()
+        helpers.invalidate_fragments()
+
+    def edit(self, entity):
+        ecportal_logic.invalidate_package_show(entity.id)
+        ecportal_logic.invalidate_group_list()
+        helpers.invalidate_fragments()
+
+    def delete(self, entity):
+        ecportal_logic.invalidate_package_show(entity.id)
+        ecportal_logic.invalidate_group_list()
+        helpers.invalidate_search_widgets()
+        helpers.invalidate_fragments()
+
     def get_actions(self):
-        return {
+        actions = {
             'group_list': ecportal_logic.group_list,
             'group_update': ecportal_logic.group_update,
             'group_show': ecportal_logic.group_show,
@@ -163,8 +368,24 @@ class ECPortalPlugin(p.SingletonPlugin):
             'user_update': ecportal_logic.user_update,
             'package_show': ecportal_logic.package_show,
             'package_search': ecportal_logic.package_search,
-            'resource_show': ecportal_logic.resource_show
+            'resource_show': ecportal_logic.resource_show,
+            'resource_create': ecportal_logic.resource_create,
+            'resource_update': ecportal_logic.resource_update,
+            'member_create': ecportal_logic.member_create,
+            'member_delete': ecportal_logic.member_delete,
+            'vocabulary_create': ecportal_logic.vocabulary_create,
+            'vocabulary_update': ecportal_logic.vocabulary_update,
+            'vocabulary_delete': ecportal_logic.vocabulary_delete,
+            'tag_create': ecportal_logic.tag_create,
+            'tag_delete': ecportal_logic.tag_delete,
+            'term_translation_update': ecportal_logic.term_translation_update,
+            'term_translation_update_many':
+            ecportal_logic.term_translation_update_many
         }
+        # resource_delete is not available in every CKAN version
+        if hasattr(logic.action.delete, 'resource_delete'):
+            actions['resource_delete'] = ecportal_logic.resource_delete
+        return actions
 
     def update_config(self, config):
         p.toolkit.add_template_directory(config, 'templates')
@@ -211,51 +432,20 @@ class ECPortalPlugin(p.SingletonPlugin):
         if not search_string:
             return search_params
         lang = str(helpers.current_locale())
-        try:
-            # Unfortunately a nested session doesn't behave the way we want,
-            # failing to actually commit the change made.
-            # We can either create a separate connection for this
-            # functionality on each request (potentially costly),
-            # or just commit at this point on the basis that for a search
-            # request, no changes that can't be committed will have been
-            # saved to the database. For now, we choose the latter.
-            ## model.Session.begin_nested() # establish a savepoint
-            searchcloud.track_term(model.Session, lang, search_string)
-        except sqlalchemy.exc.ProgrammingError, e:
-            # We don't want the non-existence of the search_query table to
-            # crash searches, we just won't log queries
-            log.error(e)
-            if 'relation "search_query" does not exist' in str(e):
-                log.error('Please run the paster searchcloud-install-tables '
-                          'command to set up the correct tables for '
-                          'search logging')
-                model.Session.rollback()
-            else:
-                raise
-        except Exception, e:
-            # Exceptions from here don't appear to bubble up, so we make sure
-            # to log them so that someone debugging a problem has a chance to
-            # find the source error.
-            log.error(e)
-            raise
-        else:
-            model.Session.commit()
-            log.debug(
-                'Inserted the term %r into the search_query table'
-                ' and committed successfully',
-                search_string
-            )
+
+        # The term is buffered and written to the database in bulk by a
+        # background thread, so that searches don't wait on (or commit) the
+        # request session.
+        searchcloud.term_logger().track(lang, search_string)
 
         return search_params
 
     def before_index(self, pkg_dict):
+        helpers.invalidate_search_widgets()
+        helpers.invalidate_fragments()
+
         title = pkg_dict.get('title', pkg_dict.get('name'))
-        # Strip accents first and if equivilant do next stage comparison.
-        # Leaving space and concatenating is to avoid having todo a real
-        # 2 level sort.
-        pkg_dict['title_sort'] = (unicode_sort.strip_accents(title) +
-                                  '   '
-                                  + title).translate(UNICODE_SORT)
+        pkg_dict['title_sort'] = unicode_sort.sort_key(title)
 
         # set 'metadata_modified' field to value of metadata_modified if
         # not present (this field is used to sort datasets according to
@@ -268,13 +458,9 @@ class ECPortalPlugin(p.SingletonPlugin):
             pkg_dict['modified_date'] = helpers.ecportal_date_to_iso(
                 pkg_dict['modified_date']) + 'Z'
 
-        def change_format(format):
-            if format in helpers.resource_mapping():
-                format = helpers.resource_mapping()[format][1]
-            return format
-
-        pkg_dict['res_format'] = [change_format(format) for format in
-                                  pkg_dict.get('res_format', [])]
+        display_names = helpers.resource_formats().display_names
+        pkg_dict['res_format'] = [display_names.get(format, format)
+                                  for format in pkg_dict.get('res_format', [])]
 
         return pkg_dict
 
@@ -292,6 +478,7 @@ class ECPortalPlugin(p.SingletonPlugin):
                 'ecportal_date_to_iso': helpers.ecportal_date_to_iso,
                 'most_viewed_datasets': helpers.most_viewed_datasets,
                 'approved_search_terms': helpers.approved_search_terms,
+                'cached_snippet': helpers.cached_snippet,
                 'resource_display_name': helpers.resource_display_name,
                 'resource_display_format': helpers.resource_display_format,
                 'resource_dropdown': helpers.resource_dropdown,
@@ -300,53 +487,106 @@ class ECPortalPlugin(p.SingletonPlugin):
                 'search_url_params': helpers.search_url_params}
 
 
+class LocalizedContent(object):
+    '''
+    The contents of a homepage content or maintenance message JSON file,
+    where each of fields maps language codes to text (or HTML, for the
+    fields in html_fields).
+
+    The values of the fields in each language, falling back to English, are
+    looked up once when the file is loaded, and a copy of them is returned
+    by get() together with the values in constants. A ValueError is raised
+    if content or one of its fields is not a JSON object.
+    '''
+
+    def __init__(self, content, fields, html_fields=(), constants=None):
+        if not isinstance(content, dict):
+            raise ValueError('Expected a JSON object')
+        self.content = content
+        translations = dict((field, content.get(field) or {})
+                            for field in fields)
+        for field, values in translations.iteritems():
+            if not isinstance(values, dict):
+                raise ValueError('Expected a JSON object for "%s"' % field)
+        langs = set(['en'])
+        for values in translations.itervalues():
+            langs.update(values)
+
+        self._by_lang = {}
+        for lang in langs:
+            localized = dict(constants or {})
+            for field, values in translations.iteritems():
+                value = values.get(lang) or values.get('en')
+                if field in html_fields:
+                    value = p.toolkit.literal(value)
+                localized[field] = value
+            self._by_lang[lang] = localized
+
+    def get(self, language):
+        return dict(self._by_lang.get(language) or self._by_lang['en'])
+
+
+def _load_home_content(f):
+    return LocalizedContent(json.load(f), ['title', 'body'],
+                            html_fields=['body'])
+
+
+def _load_maintenance(f):
+    content = json.load(f)
+    if not isinstance(content, dict):
+        raise ValueError('Expected a JSON object')
+    return LocalizedContent(content, ['message'],
+                            constants={'class': content.get('class', 'red')})
+
+
 class ECPortalHomepagePlugin(p.SingletonPlugin):
     p.implements(p.IConfigurable)
     p.implements(p.ITemplateHelpers)
 
-    home_content = None
-    maintenance = None
-
-    def _read_json_file(self, file_path):
-        try:
-            with open(file_path, 'r') as f:
-                return json.loads(f.read())
-        except IOError, e:
-            log.error('Cannot open homepage content JSON file {0}'.format(
-                file_path))
-            log.error(e)
-        except ValueError, e:
-            log.error('Cannot load homepage content JSON file {0}'.format(
-                file_path))
-            log.error(e)
+    _home_file = None
+    _maintenance_file = None
 
     def configure(self, config):
+        # the files are read again when they change, which is checked at
+        # most every ckan.ecportal.home.check_interval seconds
+        check_interval = int(config.get(
+            'ckan.ecportal.home.check_interval',
+            cache.DEFAULT_FILE_CHECK_INTERVAL))
+        self._home_file = self._maintenance_file = None
+
         content_path = config.get('ckan.home.content')
         if content_path:
             log.info('Reading homepage content from {0}'.format(content_path))
-            self.home_content = self._read_json_file(content_path)
+            self._home_file = cache.ReloadableFile(
+                content_path, _load_home_content, check_interval)
 
         maintenance_path = config.get('ckan.home.maintenance')
         if maintenance_path:
             log.info('Reading maintenance message from {0}'.format(
                 maintenance_path))
-            self.maintenance = self._read_json_file(maintenance_path)
+            self._maintenance_file = cache.ReloadableFile(
+                maintenance_path, _load_maintenance, check_interval)
+
+    @property
+    def home_content(self):
+        if self._home_file is not None:
+            return self._home_file.get()
+
+    @property
+    def maintenance(self):
+        if self._maintenance_file is not None:
+            return self._maintenance_file.get()
 
     def get_helpers(self):
         return {'homepage_content': self.homepage_content,
                 'maintenance_message': self.maintenance_message}
 
     def homepage_content(self, language='en'):
-        if self.home_content:
-            title = (self.home_content.get('title', {}).get(language) or
-                     self.home_content.get('title', {}).get('en'))
-            body = (self.home_content.get('body', {}).get(language) or
-                    self.home_content.get('body', {}).get('en'))
-            return {'title': title, 'body': p.toolkit.literal(body)}
+        home_content = self.home_content
+        if home_content:
+            return home_content.get(language)
 
     def maintenance_message(self, language='en'):
-        if self.maintenance:
-            message = (self.maintenance.get('message', {}).get(language) or
-                       self.maintenance.get('message', {}).get('en'))
-            maintenance_class = self.maintenance.get('class', 'red')
-            return {'message': message, 'class': maintenance_class}
+        maintenance = self.maintenance
+        if maintenance:
+            return maintenance.get(language)
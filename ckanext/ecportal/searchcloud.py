@@ -1,31 +1,83 @@
+import atexit
+import codecs
+import collections
 import datetime
 import logging
+import os
+import threading
+import pylons.config as config
+import sqlalchemy
+import sqlalchemy.exc
+
+import ckan.model as model
 import ckan.lib.base as base
 
+import ckanext.ecportal.cache as cache
+
 log = logging.getLogger(__name__)
 json = base.json
 
+DEFAULT_FLUSH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 10
+DEFAULT_MAX_PENDING = 10000
 
-def update_approved(Session, rows):
-    Session.execute('DELETE FROM search_popular_approved;')
-    for row in rows:
-        Session.execute(
-            '''
-            INSERT INTO search_popular_approved
-                   (search_string, count)
-            VALUES (:search_string, :count)
-            ''',
-            {'search_string': row[0], 'count': row[1]},
-        )
+# Number of approved search terms saved by each INSERT statement
+APPROVED_INSERT_SIZE = 1000
+
+# Only days that ended at least this long ago are rolled up, so that
+# searches still buffered by the web processes at midnight are included.
+ROLLUP_DELAY = datetime.timedelta(minutes=5)
+
+# Number of months of future search_query partitions to keep ready, and
+# number of past months of searches to keep in them.
+DEFAULT_PARTITIONS_AHEAD = 3
+DEFAULT_RETENTION_MONTHS = 3
 
 
-def get_latest(Session):
+def _lang_filter(lang):
+    '''
+    Return the WHERE clause and parameters selecting the rows of lang, or
+    the rows of the search cloud for all languages if lang is None.
+    '''
+    if lang is None:
+        return 'lang IS NULL', {}
+    return 'lang = :lang', {'lang': lang}
+
+
+def update_approved(Session, rows, lang=None):
+    '''
+    Replace the approved search terms of lang (or of the search cloud for
+    all languages if lang is None) with rows of [search_string, count].
+
+    The rows are inserted in batches of APPROVED_INSERT_SIZE rows. Until the
+    transaction is committed other sessions keep seeing the previous terms,
+    so the search cloud is never empty while it is being replaced.
+    '''
+    where, params = _lang_filter(lang)
+    Session.execute('DELETE FROM search_popular_approved WHERE %s;' % where,
+                    params)
+    rows = [(lang, row[0], row[1]) for row in rows]
+    for i in range(0, len(rows), APPROVED_INSERT_SIZE):
+        insert_rows(Session, 'search_popular_approved',
+                    ('lang', 'search_string', 'count'),
+                    rows[i:i + APPROVED_INSERT_SIZE])
+    # let every process know that its cached search cloud is out of date
+    Session.execute(
+        'UPDATE search_popular_version SET version = version + 1;')
+    if _approved_cloud is not None:
+        _approved_cloud.invalidate()
+
+
+def get_latest(Session, lang=None):
+    where, params = _lang_filter(lang)
     results = Session.execute(
         '''
         SELECT search_string, count
         FROM search_popular_latest
+        WHERE %s
         ORDER BY count DESC;
-        '''
+        ''' % where,
+        params
     )
     # return the results in a form that can be JSON-serialised
     return [list(row) for row in results]
@@ -74,7 +126,130 @@ def index_exists(Session, table_name, index_name):
                             'index_name': index_name}).fetchone()[0]
 
 
-def install_tables(Session, out):
+def _add_months(day, months):
+    '''Return the first day of the month months after the month of day.'''
+    month = day.year * 12 + day.month - 1 + months
+    return datetime.date(month // 12, month % 12 + 1, 1)
+
+
+def partition_name(day):
+    '''Return the name of the search_query partition holding day.'''
+    return 'search_query_y%04dm%02d' % (day.year, day.month)
+
+
+def is_partitioned(Session):
+    return Session.execute(
+        '''
+        SELECT EXISTS(SELECT * FROM pg_trigger
+                      WHERE tgname='search_query_partition')
+        '''
+    ).fetchone()[0]
+
+
+def partition_search_query(Session):
+    '''
+    Partition the search_query table by month.
+
+    Each month's searches are stored in a search_query_yYYYYmMM table that
+    inherits from search_query, with a CHECK constraint on searched_at so
+    that queries on a range of dates only scan the relevant partitions.
+    Inserts into search_query are redirected to the partition by a trigger,
+    or kept in search_query itself if the partition doesn't exist.
+    Searches made before the table was partitioned are kept in
+    search_query.
+    '''
+    Session.execute('''
+        CREATE OR REPLACE FUNCTION search_query_insert() RETURNS TRIGGER AS $$
+        BEGIN
+            EXECUTE 'INSERT INTO '
+                || quote_ident('search_query_y'
+                               || to_char(NEW.searched_at, 'YYYY')
+                               || 'm'
+                               || to_char(NEW.searched_at, 'MM'))
+                || ' SELECT ($1).*' USING NEW;
+            RETURN NULL;
+        EXCEPTION WHEN undefined_table THEN
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER search_query_partition
+            BEFORE INSERT ON search_query
+            FOR EACH ROW EXECUTE PROCEDURE search_query_insert();
+    ''')
+
+
+def list_partitions(Session):
+    results = Session.execute(
+        '''
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+        JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+        WHERE parent.relname = 'search_query'
+        ORDER BY child.relname;
+        '''
+    )
+    return [row[0] for row in results]
+
+
+def create_partitions(Session, out, months_ahead=None):
+    '''
+    Create the search_query partitions for the current month and the next
+    months_ahead months, if they don't exist.
+    '''
+    if months_ahead is None:
+        months_ahead = int(config.get(
+            'ckan.ecportal.searchcloud.partitions_ahead',
+            DEFAULT_PARTITIONS_AHEAD))
+    this_month = _add_months(datetime.date.today(), 0)
+    for months in range(months_ahead + 1):
+        start = _add_months(this_month, months)
+        name = partition_name(start)
+        if table_exists(Session, name):
+            continue
+        out('Creating the %s partition ...' % name)
+        Session.execute('''
+            CREATE TABLE {name} (
+                CHECK (searched_at >= DATE '{start}'
+                       AND searched_at < DATE '{end}')
+            ) INHERITS (search_query);
+            CREATE INDEX {name}_date ON {name} (searched_at);
+        '''.format(name=name, start=start.isoformat(),
+                   end=_add_months(start, 1).isoformat()))
+        out('done.')
+
+
+def drop_expired_partitions(Session, out, retention_months=None):
+    '''
+    Drop the search_query partitions of months that ended more than
+    retention_months months ago, as long as their searches have been
+    rolled up into the search_query_daily table.
+    '''
+    if retention_months is None:
+        retention_months = int(config.get(
+            'ckan.ecportal.searchcloud.retention_months',
+            DEFAULT_RETENTION_MONTHS))
+    keep_from = _add_months(datetime.date.today(), -retention_months)
+    until = rolled_up_until(Session)
+    for name in list_partitions(Session):
+        try:
+            start = datetime.datetime.strptime(name, 'search_query_y%Ym%m')
+        except ValueError:
+            continue
+        end = _add_months(start.date(), 1)
+        if end > keep_from:
+            continue
+        if not until or end > until:
+            out('Not dropping the %s partition, its searches have not '
+                'been rolled up yet' % name)
+            continue
+        out('Dropping the %s partition ...' % name)
+        Session.execute('DROP TABLE %s;' % name)
+        out('done.')
+
+
+def install_tables(Session, out, partitioned=False):
     created_count = 0
 
     if not table_exists(Session, 'search_query'):
@@ -114,6 +289,31 @@ def install_tables(Session, out):
         created_count += 1
         out('done.')
 
+    if not table_exists(Session, 'search_popular_version'):
+        out('Creating the search_popular_version table ...')
+        Session.execute('''
+            CREATE TABLE search_popular_version (
+                version BIGINT NOT NULL
+            );
+            INSERT INTO search_popular_version (version) VALUES (0);
+        ''')
+        created_count += 1
+        out('done.')
+
+    if not table_exists(Session, 'search_query_daily'):
+        out('Creating the search_query_daily table ...')
+        Session.execute('''
+            CREATE TABLE search_query_daily (
+                day DATE NOT NULL
+              , lang VARCHAR(10) NOT NULL
+              , search_string VARCHAR NOT NULL
+              , count BIGINT NOT NULL
+            );
+            CREATE INDEX search_query_daily_day ON search_query_daily (day);
+        ''')
+        created_count += 1
+        out('done.')
+
     if not index_exists(Session, 'search_query', 'search_query_date'):
         out('Creating the search_query_date index ...')
         Session.execute('''
@@ -123,11 +323,97 @@ def install_tables(Session, out):
     else:
         out('The index already exists')
 
+    if partitioned:
+        if is_partitioned(Session):
+            out('The search_query table is already partitioned')
+        else:
+            out('Partitioning the search_query table ...')
+            partition_search_query(Session)
+            out('done.')
+        create_partitions(Session, out)
+
     if created_count == 0:
         out('The tables already exist')
 
 
+def rolled_up_until(Session):
+    '''
+    Return the first day whose searches have not been rolled up into the
+    search_query_daily table yet, or None if nothing has been rolled up.
+    '''
+    last_day = Session.execute(
+        'SELECT max(day) FROM search_query_daily;').fetchone()[0]
+    if last_day:
+        return last_day + datetime.timedelta(days=1)
+
+
+def rollup_search_queries(Session):
+    '''
+    Add the searches of each complete day that has not been rolled up yet
+    to the search_query_daily table, as one (day, lang, search_string,
+    count) row per distinct search.
+
+    Returns the first day that has not been rolled up.
+    '''
+    since = rolled_up_until(Session)
+    until = (datetime.datetime.now() - ROLLUP_DELAY).date()
+    if since and since >= until:
+        return since
+
+    Session.execute(
+        '''
+        INSERT INTO search_query_daily (day, lang, search_string, count) (
+            SELECT
+                CAST(searched_at AS DATE)
+              , lang
+              , search_string
+              , count(*)
+            FROM search_query
+            WHERE searched_at >= :since
+              AND searched_at < :until
+            GROUP BY
+                CAST(searched_at AS DATE)
+              , lang
+              , search_string
+        );
+        ''',
+        {'since': since or datetime.date.min, 'until': until}
+    )
+    return until
+
+
+def purge_search_queries(Session):
+    '''
+    Delete the searches that have already been rolled up from the
+    search_query table. Returns the number of rows deleted.
+    '''
+    until = rolled_up_until(Session)
+    if not until:
+        return 0
+    return Session.execute(
+        'DELETE FROM search_query WHERE searched_at < :until;',
+        {'until': until}
+    ).rowcount
+
+
 def generate_unapproved_list(Session, days=30):
+    '''
+    Replace the contents of the search_popular_latest table with the 100
+    most popular searches of the last days days, in all languages (with a
+    NULL lang) and in each language.
+
+    Complete days are read from the search_query_daily table (rolling up
+    any new days first), only the searches made since the last roll-up
+    are read from search_query.
+    '''
+    until = rollup_search_queries(Session)
+    since = datetime.datetime.now() - datetime.timedelta(days=days)
+    if until:
+        raw_since = max(since, datetime.datetime.combine(until,
+                                                         datetime.time()))
+    else:
+        raw_since = since
+
     Session.execute('DELETE FROM search_popular_latest;')
     Session.execute(
         '''
@@ -136,27 +422,119 @@ def generate_unapproved_list(Session, days=30):
                 -- currently ignoring language
                 NULL
               , search_string
-              , count(*)
-            FROM search_query
-            WHERE searched_at > :since
+              , sum(count)
+            FROM (
+                SELECT search_string, count
+                FROM search_query_daily
+                WHERE day >= :since_day
+              UNION ALL
+                SELECT search_string, count(*) AS count
+                FROM search_query
+                WHERE searched_at >= :raw_since
+                GROUP BY search_string
+            ) AS searches
             GROUP BY
                 -- We don't need to group by lang at the moment
                 search_string
-            ORDER BY count(*) DESC
+            ORDER BY sum(count) DESC
             LIMIT 100
         );
         ''',
-        {'since': datetime.datetime.now() - datetime.timedelta(days=30)}
+        {'since_day': since.date(), 'raw_since': raw_since}
+    )
+    Session.execute(
+        '''
+        INSERT INTO search_popular_latest (lang, search_string, count) (
+            SELECT lang, search_string, count
+            FROM (
+                SELECT
+                    lang
+                  , search_string
+                  , sum(count) AS count
+                  , row_number() OVER (
+                        PARTITION BY lang ORDER BY sum(count) DESC
+                    ) AS rank
+                FROM (
+                    SELECT lang, search_string, count
+                    FROM search_query_daily
+                    WHERE day >= :since_day
+                  UNION ALL
+                    SELECT lang, search_string, count(*) AS count
+                    FROM search_query
+                    WHERE searched_at >= :raw_since
+                    GROUP BY lang, search_string
+                ) AS searches
+                GROUP BY lang, search_string
+            ) AS ranked
+            WHERE rank <= 100
+        );
+        ''',
+        {'since_day': since.date(), 'raw_since': raw_since}
+    )
+
+
+def get_languages(Session):
+    '''
+    Return the languages that have a list of popular or approved searches.
+    '''
+    results = Session.execute(
+        '''
+        SELECT lang FROM search_popular_latest WHERE lang IS NOT NULL
+        UNION
+        SELECT lang FROM search_popular_approved WHERE lang IS NOT NULL
+        ORDER BY lang;
+        '''
     )
+    return [row[0] for row in results]
 
 
-def get_approved(Session):
+def get_approved(Session, lang=None):
+    where, params = _lang_filter(lang)
     results = Session.execute(
-        'SELECT search_string, count FROM search_popular_approved;')
+        'SELECT search_string, count FROM search_popular_approved '
+        'WHERE %s;' % where, params)
     # return the results in a form that can be JSON-serialised
     return [list(row) for row in results]
 
 
+def get_approved_version(Session):
+    return Session.execute(
+        'SELECT version FROM search_popular_version;').fetchone()[0]
+
+
+_approved_cloud = None
+
+
+def approved_cloud(Session, lang=None):
+    '''
+    Return the approved search cloud of lang as JSON (see
+    approved_to_json), or the search cloud for all languages if lang has no
+    approved terms, or None if there are no approved terms at all.
+
+    The JSON of every language is cached by each process, and only
+    generated again once the approved terms have been changed by
+    update_approved(), which is checked at most every
+    ckan.ecportal.searchcloud.cache_check_interval seconds.
+    '''
+    global _approved_cloud
+    if _approved_cloud is None:
+        def load():
+            results = Session.execute(
+                'SELECT lang, search_string, count '
+                'FROM search_popular_approved;')
+            rows = {}
+            for row_lang, search_string, count in results:
+                rows.setdefault(row_lang, []).append([search_string, count])
+            return dict((row_lang, approved_to_json(lang_rows))
+                        for row_lang, lang_rows in rows.iteritems())
+        _approved_cloud = cache.StampedCache(
+            load, lambda: get_approved_version(Session),
+            int(config.get('ckan.ecportal.searchcloud.cache_check_interval',
+                           cache.DEFAULT_CHECK_INTERVAL)))
+    clouds = _approved_cloud.get()
+    return clouds.get(lang) or clouds.get(None)
+
+
 def track_term(Session, lang, search_string):
     Session.execute(
         '''
@@ -167,6 +545,171 @@ def track_term(Session, lang, search_string):
     )
 
 
+def insert_rows(connection, table, columns, rows):
+    '''
+    Insert rows (sequences of values for columns) into table with a single
+    multi-row INSERT statement.
+    '''
+    if not rows:
+        return
+    values = []
+    params = {}
+    for i, row in enumerate(rows):
+        names = ['%s_%d' % (column, i) for column in columns]
+        values.append('(%s)' % ', '.join(':' + name for name in names))
+        params.update(zip(names, row))
+    connection.execute(
+        sqlalchemy.text('INSERT INTO %s (%s) VALUES %s' % (
+            table, ', '.join(columns), ', '.join(values))),
+        params)
+
+
+def insert_terms(connection, rows):
+    '''
+    Insert rows of (lang, search_string, searched_at) into the search_query
+    table with a single multi-row INSERT statement.
+    '''
+    insert_rows(connection, 'search_query',
+                ('lang', 'search_string', 'searched_at'), rows)
+
+
+class SearchTermLogger(object):
+    '''
+    Buffer tracked search terms in memory and write them to the
+    search_query table in bulk from a background thread.
+
+    Terms are written every flush_interval seconds, or as soon as
+    flush_size terms are pending, using a dedicated database connection
+    rather than the request session. At most max_pending terms are kept in
+    memory: if the database can't keep up, further terms are dropped.
+    '''
+
+    def __init__(self, flush_size=DEFAULT_FLUSH_SIZE,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 max_pending=DEFAULT_MAX_PENDING, engine=None):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.engine = engine
+        self.dropped = 0
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def track(self, lang, search_string):
+        '''Queue a search term to be written to the database.'''
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % self.flush_size == 0:
+                    log.error('Search term buffer is full, %d terms have '
+                              'been dropped', self.dropped)
+                return
+            self._pending.append((lang, search_string,
+                                  datetime.datetime.now()))
+            full = len(self._pending) >= self.flush_size
+        self._start()
+        if full:
+            self._wakeup.set()
+
+    def _start(self):
+        # the thread has to be (re)started in each process, as worker
+        # processes may be forked after the first term is tracked
+        if self._thread and self._thread.is_alive() and \
+                self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive() and \
+                    self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run,
+                                            name='SearchTermLogger')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception, e:
+                log.error('Error writing search terms: %s', e)
+
+    def flush(self):
+        '''
+        Write all pending terms to the database, in batches of flush_size
+        rows. Returns the number of terms written.
+
+        Terms that can't be written (for instance because the search_query
+        table doesn't exist) are logged and discarded.
+        '''
+        with self._flush_lock:
+            with self._lock:
+                rows = list(self._pending)
+                self._pending.clear()
+            if not rows:
+                return 0
+
+            connection = (self.engine or model.meta.engine).connect()
+            transaction = connection.begin()
+            try:
+                for start in range(0, len(rows), self.flush_size):
+                    insert_terms(connection,
+                                 rows[start:start + self.flush_size])
+                transaction.commit()
+            except sqlalchemy.exc.DBAPIError, e:
+                transaction.rollback()
+                log.error(e)
+                if 'search_query' in str(e):
+                    log.error('Please run the paster '
+                              'searchcloud-install-tables command to set '
+                              'up the correct tables for search logging')
+                log.error('Discarded %d search terms', len(rows))
+                return 0
+            finally:
+                connection.close()
+
+            log.debug('Inserted %d terms into the search_query table',
+                      len(rows))
+            return len(rows)
+
+
+_term_logger = None
+
+
+def term_logger():
+    '''
+    Return the SearchTermLogger of this process, configured with the
+    ckan.ecportal.searchcloud.* options.
+    '''
+    global _term_logger
+    if _term_logger is None:
+        _term_logger = SearchTermLogger(
+            flush_size=int(config.get(
+                'ckan.ecportal.searchcloud.flush_size',
+                DEFAULT_FLUSH_SIZE)),
+            flush_interval=float(config.get(
+                'ckan.ecportal.searchcloud.flush_interval',
+                DEFAULT_FLUSH_INTERVAL)),
+            max_pending=int(config.get(
+                'ckan.ecportal.searchcloud.max_pending',
+                DEFAULT_MAX_PENDING)))
+        atexit.register(_term_logger.flush)
+    return _term_logger
+
+
+def flush_tracked_terms():
+    '''Write any search terms still buffered in this process.'''
+    if _term_logger is not None:
+        return _term_logger.flush()
+    return 0
+
+
 def approved_to_json(rows):
     # Note: We don't use jqcloud's build in link
     #       functionality as it causes terms to be
@@ -179,6 +722,90 @@ def approved_to_json(rows):
     return json.dumps(cloud_data)
 
 
+def iter_json_list(json_file, chunk_size=64 * 1024):
+    '''
+    Parse a JSON list from json_file, a file-like object returning UTF-8
+    encoded bytes or unicode, and yield its items one at a time.
+
+    The file is read chunk_size bytes at a time, so only the item being
+    parsed needs to be held in memory. Raises ValueError if the file is not
+    valid JSON, or TypeError if it doesn't contain a list.
+    '''
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf8')()
+    state = {'buffer': u'', 'eof': False}
+
+    def read():
+        if state['eof']:
+            return False
+        data = json_file.read(chunk_size)
+        if isinstance(data, str):
+            decoded = utf8.decode(data, final=not data)
+            # a chunk may end in the middle of a multi-byte character
+            while data and not decoded:
+                data = json_file.read(chunk_size)
+                decoded = utf8.decode(data, final=not data)
+            data = decoded
+        if not data:
+            state['eof'] = True
+            return False
+        state['buffer'] += data
+        return True
+
+    def next_char(pos):
+        # returns the position of the next non-whitespace character
+        while True:
+            buffer = state['buffer']
+            while pos < len(buffer) and buffer[pos] in u' \t\n\r':
+                pos += 1
+            if pos < len(buffer) or not read():
+                return pos
+
+    pos = next_char(0)
+    if state['buffer'][pos:pos + 1] != u'[':
+        while read():
+            pass
+        value = json.loads(state['buffer'])
+        raise TypeError('Expected a JSON list, got %r' % (value,))
+
+    pos = next_char(pos + 1)
+    if state['buffer'][pos:pos + 1] == u']':
+        pos += 1
+    else:
+        while True:
+            while True:
+                buffer = state['buffer']
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    # the item may continue in the next chunk
+                    if not read():
+                        raise
+                else:
+                    # a number may continue in the next chunk (e.g. "1" of
+                    # "1.5"), so the item is only complete when it is
+                    # followed by one of the characters that can end it
+                    if (end < len(buffer) and buffer[end] in u' \t\n\r,]') \
+                            or not read():
+                        break
+            yield item
+            pos = next_char(end)
+            separator = state['buffer'][pos:pos + 1]
+            if separator == u']':
+                pos += 1
+                break
+            elif separator != u',':
+                raise ValueError('Expected , or ] at position %d' % pos)
+            pos = next_char(pos + 1)
+            # don't keep the items that have already been parsed in memory
+            if pos > chunk_size:
+                state['buffer'] = state['buffer'][pos:]
+                pos = 0
+
+    if next_char(pos) != len(state['buffer']):
+        raise ValueError('Extra data after the list at position %d' % pos)
+
+
 def unify_terms(search_string, max_length=200):
     if not search_string.strip() or search_string == '*:*':
         return ''
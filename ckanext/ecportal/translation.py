@@ -0,0 +1,148 @@
+import logging
+import sqlalchemy
+import pylons.config as config
+
+import ckan.model as model
+
+import ckanext.ecportal.cache as cache
+
+log = logging.getLogger(__name__)
+
+# the translations cached by translate() are discarded at least this often
+# (in seconds), to pick up changes made by other processes
+DEFAULT_MAX_AGE = 300
+
+
+class TermTranslations(object):
+    '''
+    In-memory copy of (part of) the term_translation table.
+
+    Rows are loaded in bulk with load() and looked up with show(), which
+    returns the same list of dicts as the term_translation_show action.
+    Terms that were not loaded up front are fetched with a single query
+    the first time they are asked for, and remembered afterwards (including
+    terms that have no translations at all).
+    '''
+
+    def __init__(self, lang_codes=None):
+        self.lang_codes = lang_codes
+        self._translations = {}
+        self._complete = False
+
+    def _query(self, terms=None):
+        table = model.term_translation_table
+        query = sqlalchemy.select([table.c.term,
+                                   table.c.term_translation,
+                                   table.c.lang_code])
+        if terms is not None:
+            query = query.where(table.c.term.in_(terms))
+        if self.lang_codes is not None:
+            query = query.where(table.c.lang_code.in_(self.lang_codes))
+        return model.Session.connection().execute(query)
+
+    def load(self, terms=None):
+        '''
+        Load the translations of terms with a single query.
+
+        If terms is None the whole table is loaded, and no further queries
+        are made by show(). The loaded translations are only added once the
+        query has returned, so that other threads calling show() never see
+        a term whose translations are still being loaded.
+        '''
+        loaded = {}
+        if terms is not None:
+            terms = list(set(terms))
+            if not terms:
+                return
+            for term in terms:
+                loaded[term] = []
+
+        count = 0
+        for term, term_translation, lang_code in self._query(terms):
+            loaded.setdefault(term, []).append({
+                'term': term,
+                'term_translation': term_translation,
+                'lang_code': lang_code
+            })
+            count += 1
+
+        if terms is None:
+            self._translations = loaded
+            self._complete = True
+        else:
+            self._translations.update(loaded)
+        log.debug('Loaded %d term translations', count)
+
+    def show(self, terms):
+        '''
+        Return the translations of terms, in the same form as the
+        term_translation_show action.
+        '''
+        terms = set(term for term in terms if isinstance(term, basestring))
+        if not self._complete:
+            missing = [term for term in terms
+                       if term not in self._translations]
+            if missing:
+                self.load(missing)
+
+        results = []
+        for term in terms:
+            results.extend(self._translations.get(term, []))
+        return results
+
+
+# TermTranslations of each (lang, fallback_lang) pair used by translate()
+_TRANSLATIONS_CACHE = None
+
+
+def _translations_cache():
+    global _TRANSLATIONS_CACHE
+    if _TRANSLATIONS_CACHE is None:
+        _TRANSLATIONS_CACHE = cache.TTLCache(int(config.get(
+            'ckan.ecportal.translations.max_age', DEFAULT_MAX_AGE)))
+    return _TRANSLATIONS_CACHE
+
+
+def _term_translations(lang_codes):
+    translations_cache = _translations_cache()
+    translations = translations_cache.get(lang_codes)
+    if translations is None:
+        translations = TermTranslations(list(lang_codes))
+        translations_cache.set(lang_codes, translations)
+    return translations
+
+
+def translate(terms, lang, fallback_lang):
+    '''
+    Return a dict mapping each of terms to its translation into lang, or
+    into fallback_lang if it has no translation into lang, or to the term
+    itself if it has neither.
+
+    The translations into both languages are fetched with a single query,
+    and cached by this process until invalidate() is called.
+    '''
+    translations = _term_translations((lang, fallback_lang))
+
+    term_translations = {}
+    fallbacks = {}
+    for translation in translations.show(terms):
+        if translation['lang_code'] == lang:
+            term_translations[translation['term']] = \
+                translation['term_translation']
+        else:
+            fallbacks[translation['term']] = translation['term_translation']
+
+    for term in terms:
+        if not term in term_translations:
+            term_translations[term] = fallbacks.get(term, term)
+
+    return term_translations
+
+
+def invalidate():
+    '''
+    Discard the translations cached by translate() in this process, called
+    whenever term translations are updated.
+    '''
+    if _TRANSLATIONS_CACHE is not None:
+        _TRANSLATIONS_CACHE.clear()
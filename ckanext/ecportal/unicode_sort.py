@@ -1,8 +1,72 @@
+import re
+import sys
 import unicodedata
 
+import ckanext.ecportal.cache as cache
+
 UNICODE_SORT = {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7, 8: 8, 9: 595, 10: 596, 11: 597, 12: 598, 13: 599, 14: 9, 15: 10, 16: 11, 17: 12, 18: 13, 19: 14, 20: 15, 21: 16, 22: 17, 23: 18, 24: 19, 25: 20, 26: 21, 27: 22, 28: 23, 29: 24, 30: 25, 31: 26, 32: 604, 33: 686, 34: 761, 35: 847, 36: 2435, 37: 848, 38: 845, 39: 754, 40: 768, 41: 817, 42: 839, 43: 1309, 44: 636, 45: 623, 46: 703, 47: 843, 48: 2473, 49: 2509, 50: 2588, 51: 2631, 52: 2672, 53: 2709, 54: 2747, 55: 2784, 56: 2821, 57: 2857, 58: 649, 59: 645, 60: 1315, 61: 1317, 62: 1321, 63: 693, 64: 838, 65: 2896, 66: 2991, 67: 3017, 68: 3052, 69: 3105, 70: 3191, 71: 3209, 72: 3248, 73: 3288, 74: 3355, 75: 3374, 76: 3400, 77: 3452, 78: 3474, 79: 3524, 80: 3629, 81: 3649, 82: 3661, 83: 3713, 84: 3761, 85: 3804, 86: 3898, 87: 3925, 88: 3948, 89: 3964, 90: 3998, 91: 820, 92: 844, 93: 821, 94: 959, 95: 621, 96: 953, 97: 2893, 98: 2989, 99: 3013, 100: 3047, 101: 3100, 102: 3189, 103: 3205, 104: 3244, 105: 3282, 106: 3352, 107: 3371, 108: 3395, 109: 3448, 110: 3471, 111: 3520, 112: 3627, 113: 3647, 114: 3657, 115: 3710, 116: 3758, 117: 3801, 118: 3894, 119: 3923, 120: 3944, 121: 3962, 122: 3995, 123: 822, 124: 1324, 125: 823, 126: 1326, 127: 32, 128: 32, 129: 32, 130: 32, 131: 32, 132: 32, 133: 600, 134: 33, 135: 34, 136: 35, 137: 36, 138: 37, 139: 38, 140: 39, 141: 40, 142: 41, 143: 42, 144: 43, 145: 44, 146: 45, 147: 46, 148: 47, 149: 48, 150: 49, 151: 50, 152: 51, 153: 52, 154: 53, 155: 54, 156: 55, 157: 56, 158: 57, 159: 58, 160: 617, 161: 689, 162: 2434, 163: 2436, 164: 2433, 165: 2437, 166: 1325, 167: 835, 168: 963, 169: 1155, 170: 2898, 171: 766, 172: 1323, 173: 59, 174: 1156, 175: 960, 176: 1044, 177: 1312, 178: 2591, 179: 2634, 180: 955, 181: 4271, 182: 836, 183: 716, 184: 970, 185: 2512, 186: 3526, 187: 767, 188: 2552, 189: 2550, 190: 2669, 191: 696, 192: 2905, 193: 2903, 194: 2917, 195: 2938, 196: 2934, 197: 2929, 198: 2967, 199: 3033, 200: 3114, 201: 3112, 202: 3118, 203: 3130, 204: 3299, 205: 3297, 206: 3303, 207: 3307, 208: 3074, 209: 3487, 210: 3533, 211: 3531, 212: 3537, 213: 3555, 214: 3549, 215: 1314, 216: 3567, 217: 3812, 218: 3810, 219: 3816, 220: 3822, 221: 3968, 222: 4040, 223: 3741, 224: 2904, 225: 2902, 226: 2916, 227: 2937, 228: 2933, 229: 2928, 230: 2965, 231: 3031, 232: 3113, 233: 3111, 234: 3117, 235: 3129, 236: 3298, 237: 3296, 238: 3302, 239: 3306, 240: 3072, 241: 3486, 242: 3532, 243: 3530, 244: 3536, 245: 3554, 246: 3548, 247: 1313, 248: 3566, 249: 3811, 250: 3809, 251: 3815, 252: 3821, 253: 3967, 254: 4039, 255: 3974, 256: 2946, 257: 2945, 258: 2907, 259: 2906, 260: 2944, 261: 2943, 262: 3024, 263: 3023, 264: 3026, 265: 3025, 266: 3030, 267: 3029, 268: 3028, 269: 3027, 270: 3059, 271: 3058, 272: 3071, 273: 3070, 274: 3142, 275: 3141, 276: 3116, 277: 3115, 278: 3134, 279: 3133, 280: 3140, 281: 3139, 282: 3128, 283: 3127, 284: 3218, 285: 3217, 286: 3216, 287: 3215, 288: 3222, 289: 3221, 290: 3224, 291: 3223, 292: 3257, 293: 3256, 294: 3273, 295: 3271, 296: 3311, 297: 3310, 298: 3316, 299: 3315, 300: 3301, 301: 3300, 302: 3314, 303: 3313, 304: 3312, 305: 3337, 306: 3332, 307: 3331, 308: 3360, 309: 3359, 310: 3385, 311: 3384, 312: 3656, 313: 3408, 314: 3407, 315: 3412, 316: 3411, 317: 3410, 318: 3409, 319: 3424, 320: 3423, 321: 3422, 322: 3421, 323: 3481, 324: 3480, 325: 3491, 326: 3490, 327: 3485, 328: 3484, 329: 4056, 330: 3518, 331: 3517, 332: 3575, 333: 3574, 334: 3535, 335: 3534, 336: 3553, 337: 3552, 338: 3603, 339: 3602, 340: 3670, 341: 3669, 342: 3676, 343: 3675, 344: 3672, 345: 3671, 346: 3718, 347: 3717, 348: 3722, 349: 3721, 350: 3730, 351: 3729, 352: 3724, 353: 3723, 354: 3772, 355: 3771, 356: 3767, 357: 3766, 358: 3790, 359: 3789, 360: 3834, 361: 3833, 362: 3840, 363: 3839, 364: 3814, 365: 3813, 366: 3820, 367: 3819, 368: 3832, 369: 3831, 370: 3838, 371: 3837, 372: 3934, 373: 3933, 374: 3972, 375: 3971, 376: 3975, 377: 4004, 378: 4003, 379: 4010, 380: 4009, 381: 4008, 382: 4007, 383: 3737, 384: 3003, 385: 3010, 386: 3012, 387: 3011, 388: 4050, 389: 4049, 390: 3610, 391: 3042, 392: 3041, 393: 3092, 394: 3094, 395: 3097, 396: 3096, 397: 4015, 398: 3166, 399: 3169, 400: 3174, 401: 3202, 402: 3201, 403: 3236, 404: 3240, 405: 3275, 406: 3349, 407: 3343, 408: 3393, 409: 3392, 410: 3436, 411: 3446, 412: 3885, 413: 3509, 414: 3511, 415: 3620, 416: 3587, 417: 3586, 418: 3243, 419: 3242, 420: 3644, 421: 3643, 422: 3690, 423: 4046, 424: 4045, 425: 3751, 426: 3754, 427: 3793, 428: 3796, 429: 3795, 430: 3798, 431: 3850, 432: 3849, 433: 3891, 434: 3916, 435: 3990, 436: 3989, 437: 4018, 438: 4017, 439: 4029, 440: 4035, 441: 4034, 442: 4037, 443: 4044, 444: 4048, 445: 4047, 446: 3785, 447: 4041, 448: 4069, 449: 4070, 450: 4071, 451: 4072, 452: 3084, 453: 3083, 454: 3082, 455: 3427, 456: 3426, 457: 3425, 458: 3500, 459: 3499, 460: 3498, 461: 2927, 462: 2926, 463: 3305, 464: 3304, 465: 3547, 466: 3546, 467: 3818, 468: 3817, 469: 3830, 470: 3829, 471: 3824, 472: 3823, 473: 3828, 474: 3827, 475: 3826, 476: 3825, 477: 3165, 478: 2936, 479: 2935, 480: 2942, 481: 2941, 482: 2972, 483: 2971, 484: 3233, 485: 3232, 486: 3220, 487: 3219, 488: 3383, 489: 3382, 490: 3571, 491: 3570, 492: 3573, 493: 3572, 494: 4032, 495: 4031, 496: 3361, 497: 3081, 498: 3080, 499: 3078, 500: 3214, 501: 3213, 502: 3276, 503: 4042, 504: 3483, 505: 3482, 506: 2932, 507: 2931, 508: 2970, 509: 2969, 510: 3569, 511: 3568, 512: 2950, 513: 2949, 514: 2952, 515: 2951, 516: 3150, 517: 3149, 518: 3152, 519: 3151, 520: 3320, 521: 3319, 522: 3322, 523: 3321, 524: 3583, 525: 3582, 526: 3585, 527: 3584, 528: 3678, 529: 3677, 530: 3680, 531: 3679, 532: 3846, 533: 3845, 534: 3848, 535: 3847, 536: 3736, 537: 3735, 538: 3776, 539: 3775, 540: 3994, 541: 3993, 542: 3259, 543: 3258, 544: 3512, 545: 3098, 546: 3624, 547: 3623, 548: 4022, 549: 4021, 550: 2940, 551: 2939, 552: 3136, 553: 3135, 554: 3551, 555: 3550, 556: 3561, 557: 3560, 558: 3563, 559: 3562, 560: 3565, 561: 3564, 562: 3981, 563: 3980, 564: 3444, 565: 3516, 566: 3799, 567: 3362, 568: 3077, 569: 3652, 570: 2977, 571: 3040, 572: 3039, 573: 3437, 574: 3791, 575: 3747, 576: 4027, 577: 4053, 578: 4052, 579: 3004, 580: 3876, 581: 3921, 582: 3163, 583: 3162, 584: 3365, 585: 3364, 586: 3655, 587: 3654, 588: 3694, 589: 3693, 590: 3988, 591: 3987, 592: 2982, 593: 2984, 594: 2987, 595: 3009, 596: 3609, 597: 3043, 598: 3091, 599: 3093, 600: 3178, 601: 3168, 602: 3179, 603: 3173, 604: 3180, 605: 3185, 606: 3186, 607: 3368, 608: 3235, 609: 3228, 610: 3230, 611: 3239, 612: 3188, 613: 3880, 614: 3277, 615: 3279, 616: 3342, 617: 3348, 618: 3338, 619: 3438, 620: 3439, 621: 3442, 622: 3445, 623: 3884, 624: 3888, 625: 3469, 626: 3508, 627: 3514, 628: 3502, 629: 3619, 630: 3606, 631: 3622, 632: 3645, 633: 3696, 634: 3699, 635: 3701, 636: 3703, 637: 3704, 638: 3705, 639: 3707, 640: 3688, 641: 3708, 642: 3745, 643: 3750, 644: 3370, 645: 3755, 646: 3757, 647: 3800, 648: 3797, 649: 3875, 650: 3890, 651: 3915, 652: 3920, 653: 3943, 654: 3447, 655: 3986, 656: 4023, 657: 4025, 658: 4028, 659: 4038, 660: 4051, 661: 4059, 662: 4068, 663: 4073, 664: 4074, 665: 3002, 666: 3187, 667: 3237, 668: 3274, 669: 3366, 670: 3394, 671: 3432, 672: 3653, 673: 4066, 674: 4067, 675: 3079, 676: 3086, 677: 3085, 678: 3786, 679: 3787, 680: 3781, 681: 3198, 682: 3430, 683: 3431, 684: 4075, 685: 4076, 686: 3882, 687: 3883, 688: 3253, 689: 3278, 690: 3357, 691: 3666, 692: 3697, 693: 3702, 694: 3709, 695: 3927, 696: 3966, 697: 982, 698: 985, 699: 3280, 700: 4055, 701: 3281, 702: 4058, 703: 4061, 704: 4054, 705: 4062, 706: 986, 707: 987, 708: 988, 709: 989, 710: 990, 711: 991, 712: 992, 713: 993, 714: 994, 715: 995, 716: 996, 717: 997, 718: 998, 719: 999, 720: 2426, 721: 2427, 722: 1000, 723: 1001, 724: 1002, 725: 1003, 726: 1004, 727: 1005, 728: 961, 729: 962, 730: 968, 731: 971, 732: 958, 733: 969, 734: 1006, 735: 1007, 736: 3241, 737: 3404, 738: 3715, 739: 3951, 740: 4060, 741: 1008, 742: 1009, 743: 1010, 744: 1011, 745: 1012, 746: 1013, 747: 1014, 748: 1015, 749: 1016, 750: 4057, 751: 1017, 752: 1018, 753: 1019, 754: 1020, 755: 1021, 756: 1022, 757: 1023, 758: 1024, 759: 1025, 760: 1026, 761: 1027, 762: 1028, 763: 1029, 764: 1030, 765: 1031, 766: 1032, 767: 1033, 768: 236, 769: 233, 770: 240, 771: 247, 772: 252, 773: 362, 774: 239, 775: 248, 776: 244, 777: 363, 778: 242, 779: 246, 780: 241, 781: 253, 782: 254, 783: 364, 784: 365, 785: 366, 786: 255, 787: 228, 788: 231, 789: 256, 790: 300, 791: 301, 792: 302, 793: 303, 794: 257, 795: 367, 796: 304, 797: 305, 798: 306, 799: 307, 800: 308, 801: 368, 802: 369, 803: 370, 804: 371, 805: 372, 806: 373, 807: 250, 808: 251, 809: 309, 810: 310, 811: 311, 812: 312, 813: 374, 814: 375, 815: 313, 816: 376, 817: 377, 818: 227, 819: 314, 820: 378, 821: 379, 822: 347, 823: 348, 824: 249, 825: 380, 826: 315, 827: 316, 828: 317, 829: 258, 830: 259, 831: 260, 832: 237, 833: 234, 834: 243, 835: 229, 836: 245, 837: 381, 838: 261, 839: 318, 840: 319, 841: 320, 842: 262, 843: 263, 844: 264, 845: 321, 846: 322, 847: 81, 848: 265, 849: 266, 850: 267, 851: 323, 852: 324, 853: 325, 854: 326, 855: 268, 856: 382, 857: 327, 858: 328, 859: 269, 860: 329, 861: 270, 862: 271, 863: 330, 864: 383, 865: 384, 866: 331, 867: 2894, 868: 3101, 869: 3283, 870: 3521, 871: 3802, 872: 3014, 873: 3048, 874: 3245, 875: 3449, 876: 3658, 877: 3759, 878: 3895, 879: 3945, 880: 4172, 881: 4171, 882: 4427, 883: 4426, 884: 983, 885: 984, 886: 4166, 887: 4165, 888: 8713, 889: 8714, 890: 4226, 891: 4325, 892: 4323, 893: 4327, 894: 646, 895: 8715, 896: 8716, 897: 8717, 898: 8718, 899: 8719, 900: 956, 901: 964, 902: 4113, 903: 717, 904: 4159, 905: 4209, 906: 4246, 907: 8720, 908: 4293, 909: 8721, 910: 4348, 911: 4414, 912: 4255, 913: 4078, 914: 4129, 915: 4134, 916: 4140, 917: 4144, 918: 4170, 919: 4174, 920: 4221, 921: 4227, 922: 4264, 923: 4268, 924: 4272, 925: 4274, 926: 4276, 927: 4278, 928: 4300, 929: 4311, 930: 8722, 931: 4320, 932: 4330, 933: 4332, 934: 4367, 935: 4371, 936: 4375, 937: 4378, 938: 4254, 939: 4357, 940: 4111, 941: 4157, 942: 4207, 943: 4244, 944: 4359, 945: 4077, 946: 4127, 947: 4132, 948: 4139, 949: 4142, 950: 4169, 951: 4173, 952: 4219, 953: 4224, 954: 4262, 955: 4267, 956: 4270, 957: 4273, 958: 4275, 959: 4277, 960: 4297, 961: 4309, 962: 4322, 963: 4318, 964: 4329, 965: 4331, 966: 4365, 967: 4370, 968: 4374, 969: 4377, 970: 4253, 971: 4356, 972: 4291, 973: 4346, 974: 4412, 975: 4266, 976: 4128, 977: 4220, 978: 4333, 979: 4350, 980: 4358, 981: 4366, 982: 4298, 983: 4265, 984: 4308, 985: 4307, 986: 4168, 987: 4167, 988: 4164, 989: 4163, 990: 4306, 991: 4305, 992: 4425, 993: 4424, 994: 4431, 995: 4430, 996: 4433, 997: 4432, 998: 4435, 999: 4434, 1000: 4437, 1001: 4436, 1002: 4439, 1003: 4438, 1004: 4441, 1005: 4440, 1006: 4443, 1007: 4442, 1008: 4263, 1009: 4310, 1010: 4319, 1011: 4261, 1012: 4222, 1013: 4143, 1014: 1303, 1015: 4429, 1016: 4428, 1017: 4321, 1018: 4304, 1019: 4303, 1020: 4317, 1021: 4326, 1022: 4324, 1023: 4328, 1024: 4487, 1025: 4489, 1026: 4477, 1027: 4481, 1028: 4493, 1029: 4511, 1030: 4527, 1031: 4529, 1032: 4533, 1033: 4560, 1034: 4583, 1035: 4621, 1036: 4623, 1037: 4519, 1038: 4629, 1039: 4681, 1040: 4445, 1041: 4457, 1042: 4459, 1043: 4461, 1044: 4473, 1045: 4485, 1046: 4495, 1047: 4503, 1048: 4517, 1049: 4531, 1050: 4535, 1051: 4551, 1052: 4566, 1053: 4570, 1054: 4587, 1055: 4595, 1056: 4603, 1057: 4609, 1058: 4615, 1059: 4625, 1060: 4641, 1061: 4643, 1062: 4663, 1063: 4667, 1064: 4683, 1065: 4685, 1066: 4687, 1067: 4689, 1068: 4693, 1069: 4699, 1070: 4703, 1071: 4705, 1072: 4444, 1073: 4456, 1074: 4458, 1075: 4460, 1076: 4472, 1077: 4484, 1078: 4494, 1079: 4502, 1080: 4516, 1081: 4530, 1082: 4534, 1083: 4550, 1084: 4565, 1085: 4569, 1086: 4586, 1087: 4594, 1088: 4602, 1089: 4608, 1090: 4614, 1091: 4624, 1092: 4640, 1093: 4642, 1094: 4662, 1095: 4666, 1096: 4682, 1097: 4684, 1098: 4686, 1099: 4688, 1100: 4692, 1101: 4698, 1102: 4702, 1103: 4704, 1104: 4486, 1105: 4488, 1106: 4476, 1107: 4480, 1108: 4492, 1109: 4510, 1110: 4526, 1111: 4528, 1112: 4532, 1113: 4559, 1114: 4582, 1115: 4620, 1116: 4622, 1117: 4518, 1118: 4628, 1119: 4680, 1120: 4655, 1121: 4654, 1122: 4697, 1123: 4696, 1124: 4709, 1125: 4708, 1126: 4711, 1127: 4710, 1128: 4715, 1129: 4714, 1130: 4713, 1131: 4712, 1132: 4717, 1133: 4716, 1134: 4719, 1135: 4718, 1136: 4721, 1137: 4720, 1138: 4723, 1139: 4722, 1140: 4725, 1141: 4724, 1142: 4727, 1143: 4726, 1144: 4639, 1145: 4638, 1146: 4661, 1147: 4660, 1148: 4659, 1149: 4658, 1150: 4657, 1151: 4656, 1152: 4601, 1153: 4600, 1154: 1047, 1155: 385, 1156: 272, 1157: 232, 1158: 230, 1159: 273, 1160: 82, 1161: 83, 1162: 4523, 1163: 4522, 1164: 4695, 1165: 4694, 1166: 4605, 1167: 4604, 1168: 4463, 1169: 4462, 1170: 4465, 1171: 4464, 1172: 4469, 1173: 4468, 1174: 4501, 1175: 4500, 1176: 4483, 1177: 4482, 1178: 4537, 1179: 4536, 1180: 4545, 1181: 4544, 1182: 4543, 1183: 4542, 1184: 4541, 1185: 4540, 1186: 4575, 1187: 4574, 1188: 4581, 1189: 4580, 1190: 4599, 1191: 4598, 1192: 4729, 1193: 4728, 1194: 4613, 1195: 4612, 1196: 4619, 1197: 4618, 1198: 4635, 1199: 4634, 1200: 4637, 1201: 4636, 1202: 4649, 1203: 4648, 1204: 4665, 1205: 4664, 1206: 4671, 1207: 4670, 1208: 4675, 1209: 4674, 1210: 4651, 1211: 4650, 1212: 4677, 1213: 4676, 1214: 4679, 1215: 4678, 1216: 4733, 1217: 4497, 1218: 4496, 1219: 4539, 1220: 4538, 1221: 4554, 1222: 4553, 1223: 4577, 1224: 4576, 1225: 4573, 1226: 4572, 1227: 4673, 1228: 4672, 1229: 4568, 1230: 4567, 1231: 4732, 1232: 4447, 1233: 4446, 1234: 4449, 1235: 4448, 1236: 4455, 1237: 4454, 1238: 4491, 1239: 4490, 1240: 4451, 1241: 4450, 1242: 4453, 1243: 4452, 1244: 4499, 1245: 4498, 1246: 4509, 1247: 4508, 1248: 4513, 1249: 4512, 1250: 4521, 1251: 4520, 1252: 4525, 1253: 4524, 1254: 4589, 1255: 4588, 1256: 4591, 1257: 4590, 1258: 4593, 1259: 4592, 1260: 4701, 1261: 4700, 1262: 4627, 1263: 4626, 1264: 4631, 1265: 4630, 1266: 4633, 1267: 4632, 1268: 4669, 1269: 4668, 1270: 4471, 1271: 4470, 1272: 4691, 1273: 4690, 1274: 4467, 1275: 4466, 1276: 4645, 1277: 4644, 1278: 4647, 1279: 4646, 1280: 4475, 1281: 4474, 1282: 4479, 1283: 4478, 1284: 4505, 1285: 4504, 1286: 4515, 1287: 4514, 1288: 4562, 1289: 4561, 1290: 4585, 1291: 4584, 1292: 4611, 1293: 4610, 1294: 4617, 1295: 4616, 1296: 4507, 1297: 4506, 1298: 4556, 1299: 4555, 1300: 4564, 1301: 4563, 1302: 4607, 1303: 4606, 1304: 4707, 1305: 4706, 1306: 4549, 1307: 4548, 1308: 4731, 1309: 4730, 1310: 4547, 1311: 4546, 1312: 4558, 1313: 4557, 1314: 4579, 1315: 4578, 1316: 4597, 1317: 4596, 1318: 4653, 1319: 4652, 1320: 8723, 1321: 8724, 1322: 8725, 1323: 8726, 1324: 8727, 1325: 8728, 1326: 8729, 1327: 8730, 1328: 8731, 1329: 4822, 1330: 4824, 1331: 4826, 1332: 4828, 1333: 4830, 1334: 4833, 1335: 4835, 1336: 4837, 1337: 4839, 1338: 4841, 1339: 4843, 1340: 4845, 1341: 4847, 1342: 4849, 1343: 4851, 1344: 4853, 1345: 4855, 1346: 4857, 1347: 4859, 1348: 4861, 1349: 4863, 1350: 4865, 1351: 4867, 1352: 4869, 1353: 4871, 1354: 4873, 1355: 4875, 1356: 4877, 1357: 4879, 1358: 4881, 1359: 4883, 1360: 4885, 1361: 4887, 1362: 4889, 1363: 4891, 1364: 4893, 1365: 4895, 1366: 4897, 1367: 8732, 1368: 8733, 1369: 4898, 1370: 877, 1371: 878, 1372: 690, 1373: 637, 1374: 697, 1375: 879, 1376: 8734, 1377: 4821, 1378: 4823, 1379: 4825, 1380: 4827, 1381: 4829, 1382: 4832, 1383: 4834, 1384: 4836, 1385: 4838, 1386: 4840, 1387: 4842, 1388: 4844, 1389: 4846, 1390: 4848, 1391: 4850, 1392: 4852, 1393: 4854, 1394: 4856, 1395: 4858, 1396: 4860, 1397: 4862, 1398: 4864, 1399: 4866, 1400: 4868, 1401: 4870, 1402: 4872, 1403: 4874, 1404: 4876, 1405: 4878, 1406: 4880, 1407: 4882, 1408: 4884, 1409: 4886, 1410: 4888, 1411: 4890, 1412: 4892, 1413: 4894, 1414: 4896, 1415: 4831, 1416: 8735, 1417: 650, 1418: 624, 1419: 8736, 1420: 8737, 1421: 8738, 1422: 8739, 1423: 2438, 1424: 8740, 1425: 84, 1426: 85, 1427: 86, 1428: 87, 1429: 88, 1430: 89, 1431: 90, 1432: 91, 1433: 92, 1434: 93, 1435: 94, 1436: 95, 1437: 96, 1438: 97, 1439: 98, 1440: 99, 1441: 100, 1442: 101, 1443: 102, 1444: 103, 1445: 104, 1446: 105, 1447: 106, 1448: 107, 1449: 108, 1450: 109, 1451: 110, 1452: 111, 1453: 112, 1454: 113, 1455: 114, 1456: 386, 1457: 387, 1458: 388, 1459: 389, 1460: 390, 1461: 391, 1462: 392, 1463: 393, 1464: 394, 1465: 396, 1466: 397, 1467: 398, 1468: 401, 1469: 115, 1470: 880, 1471: 402, 1472: 881, 1473: 400, 1474: 399, 1475: 882, 1476: 116, 1477: 117, 1478: 883, 1479: 395, 1480: 8741, 1481: 8742, 1482: 8743, 1483: 8744, 1484: 8745, 1485: 8746, 1486: 8747, 1487: 8748, 1488: 4899, 1489: 4901, 1490: 4903, 1491: 4905, 1492: 4907, 1493: 4908, 1494: 4911, 1495: 4912, 1496: 4913, 1497: 4914, 1498: 4917, 1499: 4916, 1500: 4918, 1501: 4920, 1502: 4919, 1503: 4922, 1504: 4921, 1505: 4923, 1506: 4924, 1507: 4926, 1508: 4925, 1509: 4928, 1510: 4927, 1511: 4929, 1512: 4930, 1513: 4931, 1514: 4932, 1515: 8749, 1516: 8750, 1517: 8751, 1518: 8752, 1519: 8753, 1520: 4909, 1521: 4910, 1522: 4915, 1523: 884, 1524: 885, 1525: 8754, 1526: 8755, 1527: 8756, 1528: 8757, 1529: 8758, 1530: 8759, 1531: 8760, 1532: 8761, 1533: 8762, 1534: 8763, 1535: 8764, 1536: 118, 1537: 119, 1538: 120, 1539: 121, 1540: 122, 1541: 8765, 1542: 1341, 1543: 1343, 1544: 1048, 1545: 851, 1546: 853, 1547: 2439, 1548: 638, 1549: 639, 1550: 1049, 1551: 1050, 1552: 123, 1553: 124, 1554: 125, 1555: 126, 1556: 127, 1557: 128, 1558: 129, 1559: 130, 1560: 131, 1561: 132, 1562: 133, 1563: 647, 1564: 8766, 1565: 8767, 1566: 651, 1567: 698, 1568: 5165, 1569: 4959, 1570: 4962, 1571: 4963, 1572: 4966, 1573: 4967, 1574: 4971, 1575: 4975, 1576: 4978, 1577: 4990, 1578: 4991, 1579: 4992, 1580: 4998, 1581: 5005, 1582: 5006, 1583: 5016, 1584: 5017, 1585: 5030, 1586: 5031, 1587: 5047, 1588: 5048, 1589: 5058, 1590: 5059, 1591: 5063, 1592: 5064, 1593: 5067, 1594: 5068, 1595: 5104, 1596: 5105, 1597: 5162, 1598: 5163, 1599: 5164, 1600: 134, 1601: 5074, 1602: 5085, 1603: 5089, 1604: 5108, 1605: 5115, 1606: 5120, 1607: 5129, 1608: 5137, 1609: 5153, 1610: 5154, 1611: 423, 1612: 426, 1613: 429, 1614: 432, 1615: 436, 1616: 439, 1617: 442, 1618: 443, 1619: 444, 1620: 445, 1621: 446, 1622: 448, 1623: 449, 1624: 450, 1625: 451, 1626: 452, 1627: 453, 1628: 454, 1629: 455, 1630: 456, 1631: 447, 1632: 2478, 1633: 2514, 1634: 2593, 1635: 2636, 1636: 2677, 1637: 2714, 1638: 2752, 1639: 2789, 1640: 2826, 1641: 2862, 1642: 849, 1643: 640, 1644: 641, 1645: 842, 1646: 4977, 1647: 5084, 1648: 464, 1649: 4965, 1650: 4964, 1651: 4968, 1652: 4960, 1653: 4976, 1654: 5139, 1655: 5144, 1656: 5156, 1657: 4993, 1658: 4994, 1659: 4979, 1660: 4995, 1661: 4996, 1662: 4980, 1663: 4997, 1664: 4981, 1665: 5007, 1666: 5008, 1667: 4999, 1668: 5000, 1669: 5009, 1670: 5001, 1671: 5003, 1672: 5018, 1673: 5019, 1674: 5020, 1675: 5021, 1676: 5022, 1677: 5023, 1678: 5024, 1679: 5025, 1680: 5026, 1681: 5032, 1682: 5033, 1683: 5034, 1684: 5035, 1685: 5036, 1686: 5037, 1687: 5038, 1688: 5039, 1689: 5040, 1690: 5049, 1691: 5050, 1692: 5051, 1693: 5060, 1694: 5061, 1695: 5065, 1696: 5069, 1697: 5075, 1698: 5076, 1699: 5077, 1700: 5078, 1701: 5080, 1702: 5081, 1703: 5086, 1704: 5087, 1705: 5090, 1706: 5091, 1707: 5092, 1708: 5093, 1709: 5095, 1710: 5096, 1711: 5097, 1712: 5098, 1713: 5099, 1714: 5100, 1715: 5101, 1716: 5102, 1717: 5109, 1718: 5110, 1719: 5111, 1720: 5112, 1721: 5125, 1722: 5121, 1723: 5122, 1724: 5123, 1725: 5124, 1726: 5130, 1727: 5002, 1728: 5136, 1729: 5131, 1730: 5132, 1731: 5133, 1732: 5140, 1733: 5141, 1734: 5142, 1735: 5143, 1736: 5145, 1737: 5146, 1738: 5147, 1739: 5148, 1740: 5157, 1741: 5158, 1742: 5159, 1743: 5149, 1744: 5160, 1745: 5161, 1746: 5169, 1747: 5170, 1748: 708, 1749: 5135, 1750: 135, 1751: 136, 1752: 137, 1753: 138, 1754: 139, 1755: 140, 1756: 141, 1757: 142, 1758: 1051, 1759: 143, 1760: 144, 1761: 145, 1762: 146, 1763: 147, 1764: 148, 1765: 5138, 1766: 5155, 1767: 149, 1768: 150, 1769: 1052, 1770: 151, 1771: 152, 1772: 153, 1773: 154, 1774: 5027, 1775: 5041, 1776: 2479, 1777: 2515, 1778: 2594, 1779: 2637, 1780: 2678, 1781: 2715, 1782: 2753, 1783: 2790, 1784: 2827, 1785: 2863, 1786: 5052, 1787: 5062, 1788: 5070, 1789: 4961, 1790: 5116, 1791: 5134, 1792: 736, 1793: 709, 1794: 710, 1795: 652, 1796: 653, 1797: 654, 1798: 655, 1799: 656, 1800: 657, 1801: 699, 1802: 886, 1803: 887, 1804: 888, 1805: 889, 1806: 8768, 1807: 60, 1808: 5173, 1809: 465, 1810: 5174, 1811: 5176, 1812: 5177, 1813: 5180, 1814: 5179, 1815: 5182, 1816: 5183, 1817: 5184, 1818: 5186, 1819: 5187, 1820: 5188, 1821: 5189, 1822: 5190, 1823: 5191, 1824: 5193, 1825: 5194, 1826: 5195, 1827: 5196, 1828: 5197, 1829: 5198, 1830: 5199, 1831: 5200, 1832: 5202, 1833: 5203, 1834: 5204, 1835: 5205, 1836: 5206, 1837: 5175, 1838: 5178, 1839: 5181, 1840: 466, 1841: 467, 1842: 468, 1843: 469, 1844: 470, 1845: 471, 1846: 472, 1847: 473, 1848: 474, 1849: 475, 1850: 476, 1851: 477, 1852: 478, 1853: 479, 1854: 480, 1855: 481, 1856: 155, 1857: 274, 1858: 332, 1859: 156, 1860: 157, 1861: 275, 1862: 333, 1863: 158, 1864: 159, 1865: 160, 1866: 161, 1867: 8769, 1868: 8770, 1869: 5185, 1870: 5192, 1871: 5201, 1872: 4982, 1873: 4983, 1874: 4984, 1875: 4985, 1876: 4986, 1877: 4987, 1878: 4989, 1879: 5010, 1880: 5011, 1881: 5028, 1882: 5029, 1883: 5042, 1884: 5053, 1885: 5071, 1886: 5072, 1887: 5073, 1888: 5082, 1889: 5083, 1890: 5103, 1891: 5106, 1892: 5107, 1893: 5117, 1894: 5118, 1895: 5126, 1896: 5127, 1897: 5128, 1898: 5113, 1899: 5043, 1900: 5044, 1901: 5054, 1902: 5012, 1903: 5013, 1904: 5055, 1905: 5045, 1906: 5014, 1907: 4969, 1908: 4970, 1909: 5166, 1910: 5167, 1911: 5168, 1912: 5150, 1913: 5151, 1914: 5171, 1915: 5172, 1916: 5015, 1917: 5056, 1918: 5057, 1919: 5094, 1920: 5232, 1921: 5235, 1922: 5236, 1923: 5237, 1924: 5239, 1925: 5240, 1926: 5241, 1927: 5242, 1928: 5245, 1929: 5247, 1930: 5248, 1931: 5249, 1932: 5251, 1933: 5255, 1934: 5256, 1935: 5258, 1936: 5259, 1937: 5263, 1938: 5264, 1939: 5265, 1940: 5266, 1941: 5267, 1942: 5268, 1943: 5269, 1944: 5252, 1945: 5233, 1946: 5234, 1947: 5250, 1948: 5238, 1949: 5260, 1950: 5261, 1951: 5262, 1952: 5253, 1953: 5254, 1954: 5243, 1955: 5244, 1956: 5257, 1957: 5246, 1958: 5271, 1959: 5272, 1960: 5273, 1961: 5274, 1962: 5275, 1963: 5276, 1964: 5277, 1965: 5278, 1966: 5279, 1967: 5280, 1968: 5281, 1969: 5270, 1970: 8771, 1971: 8772, 1972: 8773, 1973: 8774, 1974: 8775, 1975: 8776, 1976: 8777, 1977: 8778, 1978: 8779, 1979: 8780, 1980: 8781, 1981: 8782, 1982: 8783, 1983: 8784, 1984: 2480, 1985: 2516, 1986: 2595, 1987: 2638, 1988: 2679, 1989: 2716, 1990: 2754, 1991: 2791, 1992: 2828, 1993: 2864, 1994: 5282, 1995: 5283, 1996: 5284, 1997: 5285, 1998: 5286, 1999: 5287, 2000: 5288, 2001: 5289, 2002: 5290, 2003: 5291, 2004: 5292, 2005: 5293, 2006: 5294, 2007: 5296, 2008: 5298, 2009: 5299, 2010: 5301, 2011: 5302, 2012: 5303, 2013: 5304, 2014: 5305, 2015: 5306, 2016: 5307, 2017: 5308, 2018: 5309, 2019: 5310, 2020: 5311, 2021: 5312, 2022: 5313, 2023: 5314, 2024: 5295, 2025: 5297, 2026: 5300, 2027: 482, 2028: 483, 2029: 484, 2030: 485, 2031: 486, 2032: 487, 2033: 488, 2034: 489, 2035: 490, 2036: 5315, 2037: 5316, 2038: 1053, 2039: 737, 2040: 642, 2041: 691, 2042: 162, 2043: 8785, 2044: 8786, 2045: 8787, 2046: 8788, 2047: 8789, 2048: 4933, 2049: 4934, 2050: 4935, 2051: 4936, 2052: 4937, 2053: 4938, 2054: 4939, 2055: 4940, 2056: 4941, 2057: 4942, 2058: 4943, 2059: 4944, 2060: 4945, 2061: 4946, 2062: 4947, 2063: 4948, 2064: 4949, 2065: 4950, 2066: 4951, 2067: 4952, 2068: 4953, 2069: 4954, 2070: 4955, 2071: 4956, 2072: 420, 2073: 421, 2074: 4957, 2075: 4958, 2076: 403, 2077: 404, 2078: 405, 2079: 406, 2080: 407, 2081: 408, 2082: 409, 2083: 410, 2084: 411, 2085: 412, 2086: 413, 2087: 414, 2088: 415, 2089: 416, 2090: 417, 2091: 418, 2092: 419, 2093: 422, 2094: 8790, 2095: 8791, 2096: 658, 2097: 659, 2098: 660, 2099: 661, 2100: 662, 2101: 663, 2102: 664, 2103: 665, 2104: 666, 2105: 667, 2106: 668, 2107: 669, 2108: 670, 2109: 671, 2110: 672, 2111: 8792, 2112: 5207, 2113: 5208, 2114: 5209, 2115: 5210, 2116: 5211, 2117: 5212, 2118: 5213, 2119: 5214, 2120: 5215, 2121: 5216, 2122: 5217, 2123: 5218, 2124: 5219, 2125: 5220, 2126: 5221, 2127: 5222, 2128: 5223, 2129: 5224, 2130: 5225, 2131: 5226, 2132: 5227, 2133: 5228, 2134: 5229, 2135: 5230, 2136: 5231, 2137: 334, 2138: 335, 2139: 336, 2140: 8793, 2141: 8794, 2142: 890, 2143: 8795, 2144: 8796, 2145: 8797, 2146: 8798, 2147: 8799, 2148: 8800, 2149: 8801, 2150: 8802, 2151: 8803, 2152: 8804, 2153: 8805, 2154: 8806, 2155: 8807, 2156: 8808, 2157: 8809, 2158: 8810, 2159: 8811, 2160: 8812, 2161: 8813, 2162: 8814, 2163: 8815, 2164: 8816, 2165: 8817, 2166: 8818, 2167: 8819, 2168: 8820, 2169: 8821, 2170: 8822, 2171: 8823, 2172: 8824, 2173: 8825, 2174: 8826, 2175: 8827, 2176: 8828, 2177: 8829, 2178: 8830, 2179: 8831, 2180: 8832, 2181: 8833, 2182: 8834, 2183: 8835, 2184: 8836, 2185: 8837, 2186: 8838, 2187: 8839, 2188: 8840, 2189: 8841, 2190: 8842, 2191: 8843, 2192: 8844, 2193: 8845, 2194: 8846, 2195: 8847, 2196: 8848, 2197: 8849, 2198: 8850, 2199: 8851, 2200: 8852, 2201: 8853, 2202: 8854, 2203: 8855, 2204: 8856, 2205: 8857, 2206: 8858, 2207: 8859, 2208: 4988, 2209: 8860, 2210: 5004, 2211: 5066, 2212: 5079, 2213: 5088, 2214: 5114, 2215: 5119, 2216: 4972, 2217: 4973, 2218: 5046, 2219: 5152, 2220: 4974, 2221: 8861, 2222: 8862, 2223: 8863, 2224: 8864, 2225: 8865, 2226: 8866, 2227: 8867, 2228: 8868, 2229: 8869, 2230: 8870, 2231: 8871, 2232: 8872, 2233: 8873, 2234: 8874, 2235: 8875, 2236: 8876, 2237: 8877, 2238: 8878, 2239: 8879, 2240: 8880, 2241: 8881, 2242: 8882, 2243: 8883, 2244: 8884, 2245: 8885, 2246: 8886, 2247: 8887, 2248: 8888, 2249: 8889, 2250: 8890, 2251: 8891, 2252: 8892, 2253: 8893, 2254: 8894, 2255: 8895, 2256: 8896, 2257: 8897, 2258: 8898, 2259: 8899, 2260: 8900, 2261: 8901, 2262: 8902, 2263: 8903, 2264: 8904, 2265: 8905, 2266: 8906, 2267: 8907, 2268: 8908, 2269: 8909, 2270: 8910, 2271: 8911, 2272: 8912, 2273: 8913, 2274: 8914, 2275: 8915, 2276: 433, 2277: 437, 2278: 440, 2279: 425, 2280: 428, 2281: 431, 2282: 163, 2283: 164, 2284: 165, 2285: 166, 2286: 167, 2287: 168, 2288: 424, 2289: 427, 2290: 430, 2291: 169, 2292: 434, 2293: 435, 2294: 441, 2295: 457, 2296: 458, 2297: 462, 2298: 463, 2299: 460, 2300: 461, 2301: 459, 2302: 438, 2303: 8916, 2304: 503, 2305: 504, 2306: 512, 2307: 529, 2308: 5661, 2309: 5662, 2310: 5663, 2311: 5669, 2312: 5670, 2313: 5671, 2314: 5672, 2315: 5673, 2316: 5675, 2317: 5677, 2318: 5678, 2319: 5679, 2320: 5680, 2321: 5681, 2322: 5682, 2323: 5683, 2324: 5684, 2325: 5685, 2326: 5687, 2327: 5689, 2328: 5692, 2329: 5693, 2330: 5694, 2331: 5695, 2332: 5696, 2333: 5700, 2334: 5701, 2335: 5702, 2336: 5703, 2337: 5704, 2338: 5707, 2339: 5709, 2340: 5710, 2341: 5711, 2342: 5712, 2343: 5713, 2344: 5714, 2345: 5715, 2346: 5716, 2347: 5717, 2348: 5719, 2349: 5721, 2350: 5722, 2351: 5723, 2352: 5726, 2353: 5727, 2354: 5728, 2355: 5729, 2356: 5730, 2357: 5731, 2358: 5732, 2359: 5733, 2360: 5734, 2361: 5735, 2362: 5749, 2363: 5750, 2364: 494, 2365: 5736, 2366: 5748, 2367: 5754, 2368: 5755, 2369: 5756, 2370: 5757, 2371: 5758, 2372: 5759, 2373: 5762, 2374: 5764, 2375: 5765, 2376: 5767, 2377: 5768, 2378: 5769, 2379: 5770, 2380: 5771, 2381: 5772, 2382: 5766, 2383: 5751, 2384: 5659, 2385: 170, 2386: 171, 2387: 238, 2388: 235, 2389: 5763, 2390: 5752, 2391: 5753, 2392: 5686, 2393: 5688, 2394: 5690, 2395: 5697, 2396: 5705, 2397: 5708, 2398: 5718, 2399: 5724, 2400: 5674, 2401: 5676, 2402: 5760, 2403: 5761, 2404: 718, 2405: 719, 2406: 2481, 2407: 2518, 2408: 2597, 2409: 2640, 2410: 2681, 2411: 2718, 2412: 2756, 2413: 2793, 2414: 2830, 2415: 2866, 2416: 892, 2417: 2428, 2418: 5660, 2419: 5664, 2420: 5665, 2421: 5666, 2422: 5667, 2423: 5668, 2424: 8917, 2425: 5698, 2426: 5725, 2427: 5691, 2428: 5699, 2429: 5737, 2430: 5706, 2431: 5720, 2432: 8918, 2433: 505, 2434: 513, 2435: 530, 2436: 8919, 2437: 5773, 2438: 5774, 2439: 5775, 2440: 5776, 2441: 5777, 2442: 5778, 2443: 5779, 2444: 5781, 2445: 8920, 2446: 8921, 2447: 5783, 2448: 5784, 2449: 8922, 2450: 8923, 2451: 5785, 2452: 5786, 2453: 5787, 2454: 5788, 2455: 5789, 2456: 5790, 2457: 5791, 2458: 5792, 2459: 5793, 2460: 5794, 2461: 5795, 2462: 5796, 2463: 5797, 2464: 5798, 2465: 5799, 2466: 5801, 2467: 5803, 2468: 5804, 2469: 5806, 2470: 5807, 2471: 5808, 2472: 5809, 2473: 8924, 2474: 5810, 2475: 5811, 2476: 5812, 2477: 5813, 2478: 5814, 2479: 5815, 2480: 5817, 2481: 8925, 2482: 5819, 2483: 8926, 2484: 8927, 2485: 8928, 2486: 5821, 2487: 5822, 2488: 5823, 2489: 5824, 2490: 8929, 2491: 8930, 2492: 495, 2493: 5825, 2494: 5826, 2495: 5827, 2496: 5828, 2497: 5829, 2498: 5830, 2499: 5831, 2500: 5832, 2501: 8931, 2502: 8932, 2503: 5835, 2504: 5836, 2505: 8933, 2506: 8934, 2507: 5837, 2508: 5838, 2509: 5839, 2510: 5805, 2511: 8935, 2512: 8936, 2513: 8937, 2514: 8938, 2515: 8939, 2516: 8940, 2517: 8941, 2518: 8942, 2519: 5840, 2520: 8943, 2521: 8944, 2522: 8945, 2523: 8946, 2524: 5800, 2525: 5802, 2526: 8947, 2527: 5816, 2528: 5780, 2529: 5782, 2530: 5833, 2531: 5834, 2532: 8948, 2533: 8949, 2534: 2482, 2535: 2519, 2536: 2598, 2537: 2641, 2538: 2682, 2539: 2719, 2540: 2757, 2541: 2794, 2542: 2831, 2543: 2867, 2544: 5818, 2545: 5820, 2546: 2440, 2547: 2441, 2548: 2388, 2549: 2389, 2550: 2390, 2551: 2391, 2552: 2392, 2553: 2393, 2554: 1054, 2555: 2442, 2556: 8950, 2557: 8951, 2558: 8952, 2559: 8953, 2560: 8954, 2561: 506, 2562: 514, 2563: 531, 2564: 8955, 2565: 5846, 2566: 5847, 2567: 5851, 2568: 5852, 2569: 5843, 2570: 5844, 2571: 8956, 2572: 8957, 2573: 8958, 2574: 8959, 2575: 5853, 2576: 5848, 2577: 8960, 2578: 8961, 2579: 5845, 2580: 5849, 2581: 5858, 2582: 5859, 2583: 5861, 2584: 5863, 2585: 5864, 2586: 5865, 2587: 5866, 2588: 5867, 2589: 5869, 2590: 5870, 2591: 5871, 2592: 5872, 2593: 5873, 2594: 5874, 2595: 5875, 2596: 5876, 2597: 5877, 2598: 5878, 2599: 5879, 2600: 5880, 2601: 8962, 2602: 5881, 2603: 5882, 2604: 5884, 2605: 5885, 2606: 5886, 2607: 5887, 2608: 5889, 2609: 8963, 2610: 5890, 2611: 5891, 2612: 8964, 2613: 5892, 2614: 5855, 2615: 8965, 2616: 5854, 2617: 5856, 2618: 8966, 2619: 8967, 2620: 496, 2621: 8968, 2622: 5894, 2623: 5895, 2624: 5896, 2625: 5897, 2626: 5898, 2627: 8969, 2628: 8970, 2629: 8971, 2630: 8972, 2631: 5899, 2632: 5900, 2633: 8973, 2634: 8974, 2635: 5901, 2636: 5902, 2637: 5903, 2638: 8975, 2639: 8976, 2640: 8977, 2641: 5857, 2642: 8978, 2643: 8979, 2644: 8980, 2645: 8981, 2646: 8982, 2647: 8983, 2648: 8984, 2649: 5860, 2650: 5862, 2651: 5868, 2652: 5893, 2653: 8985, 2654: 5883, 2655: 8986, 2656: 8987, 2657: 8988, 2658: 8989, 2659: 8990, 2660: 8991, 2661: 8992, 2662: 2483, 2663: 2520, 2664: 2599, 2665: 2642, 2666: 2683, 2667: 2720, 2668: 2758, 2669: 2795, 2670: 2832, 2671: 2868, 2672: 545, 2673: 546, 2674: 5850, 2675: 5842, 2676: 5841, 2677: 5888, 2678: 8993, 2679: 8994, 2680: 8995, 2681: 8996, 2682: 8997, 2683: 8998, 2684: 8999, 2685: 9000, 2686: 9001, 2687: 9002, 2688: 9003, 2689: 507, 2690: 515, 2691: 532, 2692: 9004, 2693: 5905, 2694: 5906, 2695: 5907, 2696: 5908, 2697: 5909, 2698: 5910, 2699: 5911, 2700: 5913, 2701: 5915, 2702: 9005, 2703: 5916, 2704: 5917, 2705: 5918, 2706: 9006, 2707: 5919, 2708: 5920, 2709: 5921, 2710: 5922, 2711: 5923, 2712: 5924, 2713: 5925, 2714: 5926, 2715: 5927, 2716: 5928, 2717: 5929, 2718: 5930, 2719: 5931, 2720: 5932, 2721: 5933, 2722: 5934, 2723: 5935, 2724: 5936, 2725: 5937, 2726: 5938, 2727: 5939, 2728: 5940, 2729: 9007, 2730: 5941, 2731: 5942, 2732: 5943, 2733: 5944, 2734: 5945, 2735: 5946, 2736: 5947, 2737: 9008, 2738: 5948, 2739: 5954, 2740: 9009, 2741: 5949, 2742: 5950, 2743: 5951, 2744: 5952, 2745: 5953, 2746: 9010, 2747: 9011, 2748: 497, 2749: 5955, 2750: 5956, 2751: 5957, 2752: 5958, 2753: 5959, 2754: 5960, 2755: 5961, 2756: 5962, 2757: 5965, 2758: 9012, 2759: 5966, 2760: 5967, 2761: 5968, 2762: 9013, 2763: 5969, 2764: 5970, 2765: 5971, 2766: 9014, 2767: 9015, 2768: 5904, 2769: 9016, 2770: 9017, 2771: 9018, 2772: 9019, 2773: 9020, 2774: 9021, 2775: 9022, 2776: 9023, 2777: 9024, 2778: 9025, 2779: 9026, 2780: 9027, 2781: 9028, 2782: 9029, 2783: 9030, 2784: 5912, 2785: 5914, 2786: 5963, 2787: 5964, 2788: 9031, 2789: 9032, 2790: 2484, 2791: 2521, 2792: 2600, 2793: 2643, 2794: 2684, 2795: 2721, 2796: 2759, 2797: 2796, 2798: 2833, 2799: 2869, 2800: 893, 2801: 2443, 2802: 9033, 2803: 9034, 2804: 9035, 2805: 9036, 2806: 9037, 2807: 9038, 2808: 9039, 2809: 9040, 2810: 9041, 2811: 9042, 2812: 9043, 2813: 9044, 2814: 9045, 2815: 9046, 2816: 9047, 2817: 508, 2818: 516, 2819: 533, 2820: 9048, 2821: 5972, 2822: 5973, 2823: 5974, 2824: 5975, 2825: 5976, 2826: 5977, 2827: 5978, 2828: 5980, 2829: 9049, 2830: 9050, 2831: 5982, 2832: 5983, 2833: 9051, 2834: 9052, 2835: 5984, 2836: 5985, 2837: 5986, 2838: 5987, 2839: 5988, 2840: 5989, 2841: 5990, 2842: 5991, 2843: 5992, 2844: 5993, 2845: 5994, 2846: 5995, 2847: 5996, 2848: 5997, 2849: 5998, 2850: 6000, 2851: 6002, 2852: 6003, 2853: 6004, 2854: 6005, 2855: 6006, 2856: 6007, 2857: 9053, 2858: 6008, 2859: 6009, 2860: 6010, 2861: 6011, 2862: 6012, 2863: 6013, 2864: 6015, 2865: 9054, 2866: 6016, 2867: 6017, 2868: 9055, 2869: 6018, 2870: 6020, 2871: 6021, 2872: 6022, 2873: 6023, 2874: 9056, 2875: 9057, 2876: 498, 2877: 6024, 2878: 6025, 2879: 6026, 2880: 6027, 2881: 6028, 2882: 6029, 2883: 6030, 2884: 6031, 2885: 9058, 2886: 9059, 2887: 6034, 2888: 6035, 2889: 9060, 2890: 9061, 2891: 6036, 2892: 6037, 2893: 6038, 2894: 9062, 2895: 9063, 2896: 9064, 2897: 9065, 2898: 9066, 2899: 9067, 2900: 9068, 2901: 9069, 2902: 6039, 2903: 6040, 2904: 9070, 2905: 9071, 2906: 9072, 2907: 9073, 2908: 5999, 2909: 6001, 2910: 9074, 2911: 6014, 2912: 5979, 2913: 5981, 2914: 6032, 2915: 6033, 2916: 9075, 2917: 9076, 2918: 2485, 2919: 2522, 2920: 2601, 2921: 2644, 2922: 2685, 2923: 2722, 2924: 2760, 2925: 2797, 2926: 2834, 2927: 2870, 2928: 1055, 2929: 6019, 2930: 2394, 2931: 2395, 2932: 2396, 2933: 2397, 2934: 2398, 2935: 2399, 2936: 9077, 2937: 9078, 2938: 9079, 2939: 9080, 2940: 9081, 2941: 9082, 2942: 9083, 2943: 9084, 2944: 9085, 2945: 9086, 2946: 517, 2947: 6054, 2948: 9087, 2949: 6042, 2950: 6043, 2951: 6044, 2952: 6045, 2953: 6046, 2954: 6047, 2955: 9088, 2956: 9089, 2957: 9090, 2958: 6048, 2959: 6049, 2960: 6050, 2961: 9091, 2962: 6051, 2963: 6052, 2964: 6053, 2965: 6055, 2966: 9092, 2967: 9093, 2968: 9094, 2969: 6056, 2970: 6057, 2971: 9095, 2972: 6073, 2973: 9096, 2974: 6058, 2975: 6059, 2976: 9097, 2977: 9098, 2978: 9099, 2979: 6060, 2980: 6061, 2981: 9100, 2982: 9101, 2983: 9102, 2984: 6062, 2985: 6072, 2986: 6063, 2987: 9103, 2988: 9104, 2989: 9105, 2990: 6064, 2991: 6065, 2992: 6066, 2993: 6071, 2994: 6067, 2995: 6070, 2996: 6069, 2997: 6068, 2998: 6074, 2999: 6075, 3000: 6076, 3001: 6077, 3002: 9106, 3003: 9107, 3004: 9108, 3005: 9109, 3006: 6078, 3007: 6079, 3008: 6080, 3009: 6081, 3010: 6082, 3011: 9110, 3012: 9111, 3013: 9112, 3014: 6083, 3015: 6084, 3016: 6085, 3017: 9113, 3018: 6086, 3019: 6087, 3020: 6088, 3021: 6089, 3022: 9114, 3023: 9115, 3024: 6041, 3025: 9116, 3026: 9117, 3027: 9118, 3028: 9119, 3029: 9120, 3030: 9121, 3031: 6090, 3032: 9122, 3033: 9123, 3034: 9124, 3035: 9125, 3036: 9126, 3037: 9127, 3038: 9128, 3039: 9129, 3040: 9130, 3041: 9131, 3042: 9132, 3043: 9133, 3044: 9134, 3045: 9135, 3046: 2486, 3047: 2523, 3048: 2602, 3049: 2645, 3050: 2686, 3051: 2723, 3052: 2761, 3053: 2798, 3054: 2835, 3055: 2871, 3056: 2400, 3057: 2401, 3058: 2402, 3059: 1056, 3060: 1057, 3061: 1058, 3062: 1059, 3063: 1060, 3064: 1061, 3065: 2444, 3066: 1062, 3067: 9136, 3068: 9137, 3069: 9138, 3070: 9139, 3071: 9140, 3072: 9141, 3073: 509, 3074: 518, 3075: 534, 3076: 9142, 3077: 6091, 3078: 6092, 3079: 6093, 3080: 6094, 3081: 6095, 3082: 6096, 3083: 6097, 3084: 6099, 3085: 9143, 3086: 6101, 3087: 6102, 3088: 6103, 3089: 9144, 3090: 6104, 3091: 6105, 3092: 6106, 3093: 6107, 3094: 6108, 3095: 6109, 3096: 6110, 3097: 6111, 3098: 6112, 3099: 6114, 3100: 6115, 3101: 6117, 3102: 6118, 3103: 6119, 3104: 6120, 3105: 6121, 3106: 6122, 3107: 6123, 3108: 6124, 3109: 6125, 3110: 6126, 3111: 6127, 3112: 6128, 3113: 9145, 3114: 6129, 3115: 6130, 3116: 6131, 3117: 6132, 3118: 6133, 3119: 6134, 3120: 6135, 3121: 6136, 3122: 6137, 3123: 6143, 3124: 9146, 3125: 6138, 3126: 6139, 3127: 6140, 3128: 6141, 3129: 6142, 3130: 9147, 3131: 9148, 3132: 9149, 3133: 6144, 3134: 6145, 3135: 6146, 3136: 6147, 3137: 6148, 3138: 6149, 3139: 6150, 3140: 6151, 3141: 9150, 3142: 6154, 3143: 6155, 3144: 6156, 3145: 9151, 3146: 6157, 3147: 6158, 3148: 6159, 3149: 6160, 3150: 9152, 3151: 9153, 3152: 9154, 3153: 9155, 3154: 9156, 3155: 9157, 3156: 9158, 3157: 6161, 3158: 6162, 3159: 9159, 3160: 6113, 3161: 6116, 3162: 9160, 3163: 9161, 3164: 9162, 3165: 9163, 3166: 9164, 3167: 9165, 3168: 6098, 3169: 6100, 3170: 6152, 3171: 6153, 3172: 9166, 3173: 9167, 3174: 2487, 3175: 2524, 3176: 2603, 3177: 2646, 3178: 2687, 3179: 2724, 3180: 2762, 3181: 2799, 3182: 2836, 3183: 2872, 3184: 9168, 3185: 9169, 3186: 9170, 3187: 9171, 3188: 9172, 3189: 9173, 3190: 9174, 3191: 9175, 3192: 2488, 3193: 2525, 3194: 2604, 3195: 2647, 3196: 2526, 3197: 2605, 3198: 2648, 3199: 1063, 3200: 9176, 3201: 9177, 3202: 519, 3203: 535, 3204: 9178, 3205: 6163, 3206: 6164, 3207: 6165, 3208: 6166, 3209: 6167, 3210: 6168, 3211: 6169, 3212: 6171, 3213: 9179, 3214: 6173, 3215: 6174, 3216: 6175, 3217: 9180, 3218: 6176, 3219: 6177, 3220: 6178, 3221: 6179, 3222: 6180, 3223: 6181, 3224: 6182, 3225: 6183, 3226: 6184, 3227: 6185, 3228: 6186, 3229: 6187, 3230: 6188, 3231: 6189, 3232: 6190, 3233: 6191, 3234: 6192, 3235: 6193, 3236: 6194, 3237: 6195, 3238: 6196, 3239: 6197, 3240: 6198, 3241: 9181, 3242: 6199, 3243: 6200, 3244: 6201, 3245: 6202, 3246: 6203, 3247: 6204, 3248: 6205, 3249: 6206, 3250: 6207, 3251: 6213, 3252: 9182, 3253: 6208, 3254: 6209, 3255: 6210, 3256: 6211, 3257: 6212, 3258: 9183, 3259: 9184, 3260: 499, 3261: 6215, 3262: 6218, 3263: 6219, 3264: 6220, 3265: 6221, 3266: 6222, 3267: 6223, 3268: 6224, 3269: 9185, 3270: 6227, 3271: 6228, 3272: 6229, 3273: 9186, 3274: 6230, 3275: 6231, 3276: 6232, 3277: 6233, 3278: 9187, 3279: 9188, 3280: 9189, 3281: 9190, 3282: 9191, 3283: 9192, 3284: 9193, 3285: 6234, 3286: 6235, 3287: 9194, 3288: 9195, 3289: 9196, 3290: 9197, 3291: 9198, 3292: 9199, 3293: 9200, 3294: 6214, 3295: 9201, 3296: 6170, 3297: 6172, 3298: 6225, 3299: 6226, 3300: 9202, 3301: 9203, 3302: 2489, 3303: 2527, 3304: 2606, 3305: 2649, 3306: 2688, 3307: 2725, 3308: 2763, 3309: 2800, 3310: 2837, 3311: 2873, 3312: 9204, 3313: 6216, 3314: 6217, 3315: 9205, 3316: 9206, 3317: 9207, 3318: 9208, 3319: 9209, 3320: 9210, 3321: 9211, 3322: 9212, 3323: 9213, 3324: 9214, 3325: 9215, 3326: 9216, 3327: 9217, 3328: 9218, 3329: 9219, 3330: 520, 3331: 536, 3332: 9220, 3333: 6236, 3334: 6237, 3335: 6238, 3336: 6239, 3337: 6240, 3338: 6241, 3339: 6242, 3340: 6244, 3341: 9221, 3342: 6246, 3343: 6247, 3344: 6248, 3345: 9222, 3346: 6249, 3347: 6250, 3348: 6251, 3349: 6252, 3350: 6254, 3351: 6255, 3352: 6256, 3353: 6257, 3354: 6258, 3355: 6259, 3356: 6260, 3357: 6261, 3358: 6262, 3359: 6263, 3360: 6264, 3361: 6265, 3362: 6266, 3363: 6267, 3364: 6269, 3365: 6270, 3366: 6271, 3367: 6272, 3368: 6273, 3369: 6275, 3370: 6276, 3371: 6277, 3372: 6278, 3373: 6279, 3374: 6280, 3375: 6281, 3376: 6282, 3377: 6295, 3378: 6285, 3379: 6292, 3380: 6294, 3381: 6287, 3382: 6288, 3383: 6289, 3384: 6290, 3385: 6291, 3386: 6296, 3387: 9223, 3388: 9224, 3389: 6297, 3390: 6298, 3391: 6299, 3392: 6300, 3393: 6301, 3394: 6302, 3395: 6303, 3396: 6304, 3397: 9225, 3398: 6307, 3399: 6308, 3400: 6309, 3401: 9226, 3402: 6310, 3403: 6311, 3404: 6312, 3405: 6314, 3406: 6283, 3407: 9227, 3408: 9228, 3409: 9229, 3410: 9230, 3411: 9231, 3412: 9232, 3413: 9233, 3414: 9234, 3415: 6313, 3416: 9235, 3417: 9236, 3418: 9237, 3419: 9238, 3420: 9239, 3421: 9240, 3422: 9241, 3423: 9242, 3424: 6243, 3425: 6245, 3426: 6305, 3427: 6306, 3428: 9243, 3429: 9244, 3430: 2490, 3431: 2528, 3432: 2607, 3433: 2650, 3434: 2689, 3435: 2726, 3436: 2764, 3437: 2801, 3438: 2838, 3439: 2874, 3440: 2403, 3441: 2404, 3442: 2405, 3443: 2406, 3444: 2407, 3445: 2408, 3446: 9245, 3447: 9246, 3448: 9247, 3449: 1064, 3450: 6268, 3451: 6274, 3452: 6284, 3453: 6286, 3454: 6293, 3455: 6253, 3456: 9248, 3457: 9249, 3458: 521, 3459: 537, 3460: 9250, 3461: 6315, 3462: 6316, 3463: 6317, 3464: 6318, 3465: 6319, 3466: 6320, 3467: 6321, 3468: 6322, 3469: 6323, 3470: 6324, 3471: 6325, 3472: 6326, 3473: 6327, 3474: 6328, 3475: 6329, 3476: 6330, 3477: 6331, 3478: 6332, 3479: 9251, 3480: 9252, 3481: 9253, 3482: 6333, 3483: 6334, 3484: 6335, 3485: 6336, 3486: 6337, 3487: 6338, 3488: 6339, 3489: 6340, 3490: 6341, 3491: 6342, 3492: 6343, 3493: 6344, 3494: 6345, 3495: 6346, 3496: 6347, 3497: 6348, 3498: 6349, 3499: 6350, 3500: 6351, 3501: 6352, 3502: 6353, 3503: 6354, 3504: 6355, 3505: 6356, 3506: 9254, 3507: 6357, 3508: 6358, 3509: 6359, 3510: 6360, 3511: 6361, 3512: 6362, 3513: 6363, 3514: 6364, 3515: 6365, 3516: 9255, 3517: 6366, 3518: 9256, 3519: 9257, 3520: 6367, 3521: 6368, 3522: 6369, 3523: 6370, 3524: 6371, 3525: 6372, 3526: 6373, 3527: 9258, 3528: 9259, 3529: 9260, 3530: 6391, 3531: 9261, 3532: 9262, 3533: 9263, 3534: 9264, 3535: 6374, 3536: 6375, 3537: 6376, 3538: 6377, 3539: 6378, 3540: 6379, 3541: 9265, 3542: 6380, 3543: 9266, 3544: 6381, 3545: 6385, 3546: 6386, 3547: 6387, 3548: 6388, 3549: 6389, 3550: 6390, 3551: 6383, 3552: 9267, 3553: 9268, 3554: 9269, 3555: 9270, 3556: 9271, 3557: 9272, 3558: 9273, 3559: 9274, 3560: 9275, 3561: 9276, 3562: 9277, 3563: 9278, 3564: 9279, 3565: 9280, 3566: 9281, 3567: 9282, 3568: 9283, 3569: 9284, 3570: 6382, 3571: 6384, 3572: 894, 3573: 9285, 3574: 9286, 3575: 9287, 3576: 9288, 3577: 9289, 3578: 9290, 3579: 9291, 3580: 9292, 3581: 9293, 3582: 9294, 3583: 9295, 3584: 9296, 3585: 6443, 3586: 6444, 3587: 6445, 3588: 6446, 3589: 6447, 3590: 6448, 3591: 6449, 3592: 6450, 3593: 6451, 3594: 6452, 3595: 6453, 3596: 6454, 3597: 6455, 3598: 6456, 3599: 6457, 3600: 6458, 3601: 6459, 3602: 6460, 3603: 6461, 3604: 6462, 3605: 6463, 3606: 6464, 3607: 6465, 3608: 6466, 3609: 6467, 3610: 6468, 3611: 6469, 3612: 6470, 3613: 6471, 3614: 6472, 3615: 6473, 3616: 6474, 3617: 6475, 3618: 6476, 3619: 6477, 3620: 6478, 3621: 6479, 3622: 6480, 3623: 6481, 3624: 6482, 3625: 6483, 3626: 6484, 3627: 6485, 3628: 6486, 3629: 6487, 3630: 6488, 3631: 6489, 3632: 6490, 3633: 6491, 3634: 6492, 3635: 6493, 3636: 6494, 3637: 6495, 3638: 6496, 3639: 6497, 3640: 6498, 3641: 6499, 3642: 6500, 3643: 9297, 3644: 9298, 3645: 9299, 3646: 9300, 3647: 2445, 3648: 6501, 3649: 6502, 3650: 6503, 3651: 6504, 3652: 6505, 3653: 6506, 3654: 2429, 3655: 550, 3656: 551, 3657: 552, 3658: 553, 3659: 554, 3660: 555, 3661: 556, 3662: 549, 3663: 895, 3664: 2495, 3665: 2534, 3666: 2612, 3667: 2655, 3668: 2694, 3669: 2731, 3670: 2769, 3671: 2806, 3672: 2843, 3673: 2879, 3674: 896, 3675: 897, 3676: 9301, 3677: 9302, 3678: 9303, 3679: 9304, 3680: 9305, 3681: 9306, 3682: 9307, 3683: 9308, 3684: 9309, 3685: 9310, 3686: 9311, 3687: 9312, 3688: 9313, 3689: 9314, 3690: 9315, 3691: 9316, 3692: 9317, 3693: 9318, 3694: 9319, 3695: 9320, 3696: 9321, 3697: 9322, 3698: 9323, 3699: 9324, 3700: 9325, 3701: 9326, 3702: 9327, 3703: 9328, 3704: 9329, 3705: 9330, 3706: 9331, 3707: 9332, 3708: 9333, 3709: 9334, 3710: 9335, 3711: 9336, 3712: 9337, 3713: 6508, 3714: 6509, 3715: 9338, 3716: 6510, 3717: 9339, 3718: 9340, 3719: 6511, 3720: 6512, 3721: 9341, 3722: 6514, 3723: 9342, 3724: 9343, 3725: 6516, 3726: 9344, 3727: 9345, 3728: 9346, 3729: 9347, 3730: 9348, 3731: 9349, 3732: 6517, 3733: 6518, 3734: 6519, 3735: 6520, 3736: 9350, 3737: 6521, 3738: 6522, 3739: 6523, 3740: 6524, 3741: 6525, 3742: 6526, 3743: 6527, 3744: 9351, 3745: 6528, 3746: 6529, 3747: 6530, 3748: 9352, 3749: 6531, 3750: 9353, 3751: 6532, 3752: 9354, 3753: 9355, 3754: 6513, 3755: 6533, 3756: 9356, 3757: 6536, 3758: 6537, 3759: 6538, 3760: 6539, 3761: 6540, 3762: 6541, 3763: 6542, 3764: 6543, 3765: 6544, 3766: 6545, 3767: 6546, 3768: 6547, 3769: 6548, 3770: 9357, 3771: 6549, 3772: 6550, 3773: 6551, 3774: 9358, 3775: 9359, 3776: 6552, 3777: 6553, 3778: 6554, 3779: 6555, 3780: 6556, 3781: 9360, 3782: 2430, 3783: 9361, 3784: 557, 3785: 558, 3786: 559, 3787: 560, 3788: 561, 3789: 562, 3790: 9362, 3791: 9363, 3792: 2496, 3793: 2535, 3794: 2613, 3795: 2656, 3796: 2695, 3797: 2732, 3798: 2770, 3799: 2807, 3800: 2844, 3801: 2880, 3802: 9364, 3803: 9365, 3804: 6534, 3805: 6535, 3806: 6507, 3807: 6515, 3808: 9366, 3809: 9367, 3810: 9368, 3811: 9369, 3812: 9370, 3813: 9371, 3814: 9372, 3815: 9373, 3816: 9374, 3817: 9375, 3818: 9376, 3819: 9377, 3820: 9378, 3821: 9379, 3822: 9380, 3823: 9381, 3824: 9382, 3825: 9383, 3826: 9384, 3827: 9385, 3828: 9386, 3829: 9387, 3830: 9388, 3831: 9389, 3832: 9390, 3833: 9391, 3834: 9392, 3835: 9393, 3836: 9394, 3837: 9395, 3838: 9396, 3839: 9397, 3840: 6644, 3841: 1065, 3842: 1066, 3843: 1067, 3844: 898, 3845: 899, 3846: 900, 3847: 901, 3848: 902, 3849: 903, 3850: 904, 3851: 907, 3852: 908, 3853: 909, 3854: 910, 3855: 911, 3856: 912, 3857: 913, 3858: 914, 3859: 1068, 3860: 680, 3861: 1069, 3862: 1070, 3863: 1071, 3864: 172, 3865: 173, 3866: 1072, 3867: 1073, 3868: 1074, 3869: 1075, 3870: 1076, 3871: 1077, 3872: 2497, 3873: 2536, 3874: 2614, 3875: 2657, 3876: 2696, 3877: 2733, 3878: 2771, 3879: 2808, 3880: 2845, 3881: 2881, 3882: 2537, 3883: 2615, 3884: 2658, 3885: 2697, 3886: 2734, 3887: 2772, 3888: 2809, 3889: 2846, 3890: 2882, 3891: 2498, 3892: 1078, 3893: 174, 3894: 1079, 3895: 175, 3896: 1080, 3897: 563, 3898: 824, 3899: 825, 3900: 826, 3901: 827, 3902: 176, 3903: 177, 3904: 6557, 3905: 6562, 3906: 6564, 3907: 6565, 3908: 6568, 3909: 6570, 3910: 6572, 3911: 6574, 3912: 9398, 3913: 6576, 3914: 6578, 3915: 6580, 3916: 6582, 3917: 6583, 3918: 6586, 3919: 6588, 3920: 6590, 3921: 6592, 3922: 6593, 3923: 6596, 3924: 6598, 3925: 6600, 3926: 6602, 3927: 6603, 3928: 6606, 3929: 6608, 3930: 6610, 3931: 6612, 3932: 6613, 3933: 6616, 3934: 6619, 3935: 6621, 3936: 6623, 3937: 6625, 3938: 6628, 3939: 6633, 3940: 6635, 3941: 6637, 3942: 6639, 3943: 6641, 3944: 6643, 3945: 6558, 3946: 6629, 3947: 6561, 3948: 6632, 3949: 9399, 3950: 9400, 3951: 9401, 3952: 9402, 3953: 6654, 3954: 6655, 3955: 6656, 3956: 6659, 3957: 6660, 3958: 6661, 3959: 6662, 3960: 6663, 3961: 6664, 3962: 6665, 3963: 6666, 3964: 6667, 3965: 6668, 3966: 522, 3967: 538, 3968: 6657, 3969: 6658, 3970: 178, 3971: 179, 3972: 6669, 3973: 915, 3974: 180, 3975: 181, 3976: 6646, 3977: 6648, 3978: 6652, 3979: 6653, 3980: 6650, 3981: 6647, 3982: 6649, 3983: 6651, 3984: 6559, 3985: 6563, 3986: 6566, 3987: 6567, 3988: 6569, 3989: 6571, 3990: 6573, 3991: 6575, 3992: 9403, 3993: 6577, 3994: 6579, 3995: 6581, 3996: 6584, 3997: 6585, 3998: 6587, 3999: 6589, 4000: 6591, 4001: 6594, 4002: 6595, 4003: 6597, 4004: 6599, 4005: 6601, 4006: 6604, 4007: 6605, 4008: 6607, 4009: 6609, 4010: 6611, 4011: 6614, 4012: 6615, 4013: 6617, 4014: 6620, 4015: 6622, 4016: 6624, 4017: 6626, 4018: 6630, 4019: 6634, 4020: 6636, 4021: 6638, 4022: 6640, 4023: 6642, 4024: 6645, 4025: 6560, 4026: 6618, 4027: 6627, 4028: 6631, 4029: 9404, 4030: 1081, 4031: 1082, 4032: 1083, 4033: 1084, 4034: 1085, 4035: 1086, 4036: 1087, 4037: 1088, 4038: 182, 4039: 1089, 4040: 1090, 4041: 1091, 4042: 1092, 4043: 1093, 4044: 1094, 4045: 9405, 4046: 1095, 4047: 1096, 4048: 905, 4049: 906, 4050: 916, 4051: 917, 4052: 918, 4053: 1097, 4054: 1098, 4055: 1099, 4056: 1100, 4057: 919, 4058: 920, 4059: 9406, 4060: 9407, 4061: 9408, 4062: 9409, 4063: 9410, 4064: 9411, 4065: 9412, 4066: 9413, 4067: 9414, 4068: 9415, 4069: 9416, 4070: 9417, 4071: 9418, 4072: 9419, 4073: 9420, 4074: 9421, 4075: 9422, 4076: 9423, 4077: 9424, 4078: 9425, 4079: 9426, 4080: 9427, 4081: 9428, 4082: 9429, 4083: 9430, 4084: 9431, 4085: 9432, 4086: 9433, 4087: 9434, 4088: 9435, 4089: 9436, 4090: 9437, 4091: 9438, 4092: 9439, 4093: 9440, 4094: 9441, 4095: 9442, 4096: 6936, 4097: 6938, 4098: 6940, 4099: 6942, 4100: 6943, 4101: 6945, 4102: 6947, 4103: 6948, 4104: 6950, 4105: 6953, 4106: 6955, 4107: 6956, 4108: 6957, 4109: 6958, 4110: 6959, 4111: 6960, 4112: 6962, 4113: 6963, 4114: 6964, 4115: 6966, 4116: 6967, 4117: 6970, 4118: 6971, 4119: 6975, 4120: 6977, 4121: 6978, 4122: 6980, 4123: 6982, 4124: 6984, 4125: 6986, 4126: 6993, 4127: 6995, 4128: 6998, 4129: 7004, 4130: 7005, 4131: 7006, 4132: 7007, 4133: 7008, 4134: 7009, 4135: 7014, 4136: 7015, 4137: 7016, 4138: 7017, 4139: 7019, 4140: 7018, 4141: 7023, 4142: 7025, 4143: 7027, 4144: 7030, 4145: 7035, 4146: 7039, 4147: 7026, 4148: 7041, 4149: 7037, 4150: 523, 4151: 564, 4152: 539, 4153: 7046, 4154: 7047, 4155: 6981, 4156: 6983, 4157: 6987, 4158: 6997, 4159: 6994, 4160: 2500, 4161: 2539, 4162: 2617, 4163: 2660, 4164: 2699, 4165: 2736, 4166: 2774, 4167: 2811, 4168: 2848, 4169: 2884, 4170: 724, 4171: 725, 4172: 924, 4173: 925, 4174: 926, 4175: 927, 4176: 6990, 4177: 6991, 4178: 7010, 4179: 7011, 4180: 7012, 4181: 7013, 4182: 7031, 4183: 7032, 4184: 7033, 4185: 7034, 4186: 6944, 4187: 6951, 4188: 6999, 4189: 7000, 4190: 6969, 4191: 6979, 4192: 6985, 4193: 6952, 4194: 7042, 4195: 7048, 4196: 7049, 4197: 6992, 4198: 7003, 4199: 7043, 4200: 7044, 4201: 7050, 4202: 7051, 4203: 7052, 4204: 7053, 4205: 7054, 4206: 6961, 4207: 7001, 4208: 7002, 4209: 7024, 4210: 7021, 4211: 7028, 4212: 7029, 4213: 6937, 4214: 6939, 4215: 6941, 4216: 6946, 4217: 6949, 4218: 6954, 4219: 6965, 4220: 6968, 4221: 6972, 4222: 6973, 4223: 6976, 4224: 6989, 4225: 6996, 4226: 6988, 4227: 7020, 4228: 7036, 4229: 7038, 4230: 7045, 4231: 7055, 4232: 7057, 4233: 7059, 4234: 7060, 4235: 7056, 4236: 7058, 4237: 565, 4238: 6974, 4239: 7061, 4240: 2501, 4241: 2540, 4242: 2618, 4243: 2661, 4244: 2700, 4245: 2737, 4246: 2775, 4247: 2812, 4248: 2849, 4249: 2885, 4250: 7062, 4251: 7063, 4252: 7022, 4253: 7040, 4254: 1102, 4255: 1103, 4256: 4735, 4257: 4737, 4258: 4739, 4259: 4741, 4260: 4743, 4261: 4745, 4262: 4747, 4263: 4751, 4264: 4753, 4265: 4755, 4266: 4757, 4267: 4759, 4268: 4762, 4269: 4766, 4270: 4768, 4271: 4770, 4272: 4772, 4273: 4774, 4274: 4776, 4275: 4780, 4276: 4782, 4277: 4784, 4278: 4786, 4279: 4788, 4280: 4790, 4281: 4792, 4282: 4794, 4283: 4796, 4284: 4798, 4285: 4800, 4286: 4802, 4287: 4806, 4288: 4808, 4289: 4749, 4290: 4764, 4291: 4778, 4292: 4804, 4293: 4810, 4294: 9443, 4295: 4813, 4296: 9444, 4297: 9445, 4298: 9446, 4299: 9447, 4300: 9448, 4301: 4818, 4302: 9449, 4303: 9450, 4304: 4734, 4305: 4736, 4306: 4738, 4307: 4740, 4308: 4742, 4309: 4744, 4310: 4746, 4311: 4750, 4312: 4752, 4313: 4754, 4314: 4756, 4315: 4758, 4316: 4760, 4317: 4765, 4318: 4767, 4319: 4769, 4320: 4771, 4321: 4773, 4322: 4775, 4323: 4779, 4324: 4781, 4325: 4783, 4326: 4785, 4327: 4787, 4328: 4789, 4329: 4791, 4330: 4793, 4331: 4795, 4332: 4797, 4333: 4799, 4334: 4801, 4335: 4805, 4336: 4807, 4337: 4748, 4338: 4763, 4339: 4777, 4340: 4803, 4341: 4809, 4342: 4811, 4343: 4812, 4344: 4814, 4345: 4815, 4346: 4816, 4347: 738, 4348: 4761, 4349: 4817, 4350: 4819, 4351: 4820, 4352: 8457, 4353: 8458, 4354: 8459, 4355: 8460, 4356: 8461, 4357: 8462, 4358: 8463, 4359: 8464, 4360: 8465, 4361: 8466, 4362: 8467, 4363: 8468, 4364: 8469, 4365: 8470, 4366: 8471, 4367: 8472, 4368: 8473, 4369: 8474, 4370: 8475, 4371: 8476, 4372: 8477, 4373: 8478, 4374: 8479, 4375: 8480, 4376: 8481, 4377: 8482, 4378: 8483, 4379: 8484, 4380: 8485, 4381: 8486, 4382: 8487, 4383: 8488, 4384: 8489, 4385: 8490, 4386: 8491, 4387: 8492, 4388: 8493, 4389: 8494, 4390: 8495, 4391: 8496, 4392: 8497, 4393: 8498, 4394: 8499, 4395: 8500, 4396: 8501, 4397: 8502, 4398: 8503, 4399: 8504, 4400: 8505, 4401: 8506, 4402: 8507, 4403: 8508, 4404: 8509, 4405: 8510, 4406: 8511, 4407: 8512, 4408: 8513, 4409: 8514, 4410: 8515, 4411: 8516, 4412: 8517, 4413: 8518, 4414: 8519, 4415: 8520, 4416: 8521, 4417: 8522, 4418: 8523, 4419: 8524, 4420: 8525, 4421: 8526, 4422: 8527, 4423: 8528, 4424: 8529, 4425: 8530, 4426: 8531, 4427: 8532, 4428: 8533, 4429: 8534, 4430: 8535, 4431: 8536, 4432: 8537, 4433: 8538, 4434: 8539, 4435: 8540, 4436: 8541, 4437: 8542, 4438: 8543, 4439: 8544, 4440: 8545, 4441: 8546, 4442: 8547, 4443: 8548, 4444: 8549, 4445: 8550, 4446: 8551, 4447: 8552, 4448: 8553, 4449: 8554, 4450: 8555, 4451: 8556, 4452: 8557, 4453: 8558, 4454: 8559, 4455: 8560, 4456: 8561, 4457: 8562, 4458: 8563, 4459: 8564, 4460: 8565, 4461: 8566, 4462: 8567, 4463: 8568, 4464: 8569, 4465: 8570, 4466: 8571, 4467: 8572, 4468: 8573, 4469: 8574, 4470: 8575, 4471: 8576, 4472: 8577, 4473: 8578, 4474: 8579, 4475: 8580, 4476: 8581, 4477: 8582, 4478: 8583, 4479: 8584, 4480: 8585, 4481: 8586, 4482: 8587, 4483: 8588, 4484: 8589, 4485: 8590, 4486: 8591, 4487: 8592, 4488: 8593, 4489: 8594, 4490: 8595, 4491: 8596, 4492: 8597, 4493: 8598, 4494: 8599, 4495: 8600, 4496: 8601, 4497: 8602, 4498: 8603, 4499: 8604, 4500: 8605, 4501: 8606, 4502: 8607, 4503: 8608, 4504: 8609, 4505: 8610, 4506: 8611, 4507: 8612, 4508: 8613, 4509: 8614, 4510: 8615, 4511: 8616, 4512: 8617, 4513: 8618, 4514: 8619, 4515: 8620, 4516: 8621, 4517: 8622, 4518: 8623, 4519: 8624, 4520: 8625, 4521: 8626, 4522: 8627, 4523: 8628, 4524: 8629, 4525: 8630, 4526: 8631, 4527: 8632, 4528: 8633, 4529: 8634, 4530: 8635, 4531: 8636, 4532: 8637, 4533: 8638, 4534: 8639, 4535: 8640, 4536: 8641, 4537: 8642, 4538: 8643, 4539: 8644, 4540: 8645, 4541: 8646, 4542: 8647, 4543: 8648, 4544: 8649, 4545: 8650, 4546: 8651, 4547: 8652, 4548: 8653, 4549: 8654, 4550: 8655, 4551: 8656, 4552: 8657, 4553: 8658, 4554: 8659, 4555: 8660, 4556: 8661, 4557: 8662, 4558: 8663, 4559: 8664, 4560: 8665, 4561: 8666, 4562: 8667, 4563: 8668, 4564: 8669, 4565: 8670, 4566: 8671, 4567: 8672, 4568: 8673, 4569: 8674, 4570: 8675, 4571: 8676, 4572: 8677, 4573: 8678, 4574: 8679, 4575: 8680, 4576: 8681, 4577: 8682, 4578: 8683, 4579: 8684, 4580: 8685, 4581: 8686, 4582: 8687, 4583: 8688, 4584: 8689, 4585: 8690, 4586: 8691, 4587: 8692, 4588: 8693, 4589: 8694, 4590: 8695, 4591: 8696, 4592: 8697, 4593: 8698, 4594: 8699, 4595: 8700, 4596: 8701, 4597: 8702, 4598: 8703, 4599: 8704, 4600: 8705, 4601: 8706, 4602: 8707, 4603: 8708, 4604: 8709, 4605: 8710, 4606: 8711, 4607: 8712, 4608: 5317, 4609: 5318, 4610: 5319, 4611: 5320, 4612: 5321, 4613: 5322, 4614: 5323, 4615: 5324, 4616: 5325, 4617: 5326, 4618: 5327, 4619: 5328, 4620: 5329, 4621: 5330, 4622: 5331, 4623: 5332, 4624: 5333, 4625: 5334, 4626: 5335, 4627: 5336, 4628: 5337, 4629: 5338, 4630: 5339, 4631: 5340, 4632: 5341, 4633: 5342, 4634: 5343, 4635: 5344, 4636: 5345, 4637: 5346, 4638: 5347, 4639: 5348, 4640: 5353, 4641: 5354, 4642: 5355, 4643: 5356, 4644: 5357, 4645: 5358, 4646: 5359, 4647: 5360, 4648: 5361, 4649: 5362, 4650: 5363, 4651: 5364, 4652: 5365, 4653: 5366, 4654: 5367, 4655: 5368, 4656: 5369, 4657: 5370, 4658: 5371, 4659: 5372, 4660: 5373, 4661: 5374, 4662: 5375, 4663: 5376, 4664: 5377, 4665: 5378, 4666: 5379, 4667: 5380, 4668: 5381, 4669: 5382, 4670: 5383, 4671: 5384, 4672: 5385, 4673: 5386, 4674: 5387, 4675: 5388, 4676: 5389, 4677: 5390, 4678: 5391, 4679: 5392, 4680: 5393, 4681: 9451, 4682: 5394, 4683: 5395, 4684: 5396, 4685: 5397, 4686: 9452, 4687: 9453, 4688: 5398, 4689: 5399, 4690: 5400, 4691: 5401, 4692: 5402, 4693: 5403, 4694: 5404, 4695: 9454, 4696: 5405, 4697: 9455, 4698: 5406, 4699: 5407, 4700: 5408, 4701: 5409, 4702: 9456, 4703: 9457, 4704: 5410, 4705: 5411, 4706: 5412, 4707: 5413, 4708: 5414, 4709: 5415, 4710: 5416, 4711: 5417, 4712: 5422, 4713: 5423, 4714: 5424, 4715: 5425, 4716: 5426, 4717: 5427, 4718: 5428, 4719: 5429, 4720: 5430, 4721: 5431, 4722: 5432, 4723: 5433, 4724: 5434, 4725: 5435, 4726: 5436, 4727: 5437, 4728: 5438, 4729: 5439, 4730: 5440, 4731: 5441, 4732: 5442, 4733: 5443, 4734: 5444, 4735: 5445, 4736: 5446, 4737: 5447, 4738: 5448, 4739: 5449, 4740: 5450, 4741: 5451, 4742: 5452, 4743: 5453, 4744: 5454, 4745: 9458, 4746: 5455, 4747: 5456, 4748: 5457, 4749: 5458, 4750: 9459, 4751: 9460, 4752: 5459, 4753: 5460, 4754: 5461, 4755: 5462, 4756: 5463, 4757: 5464, 4758: 5465, 4759: 5466, 4760: 5467, 4761: 5468, 4762: 5469, 4763: 5470, 4764: 5471, 4765: 5472, 4766: 5473, 4767: 5474, 4768: 5475, 4769: 5476, 4770: 5477, 4771: 5478, 4772: 5479, 4773: 5480, 4774: 5481, 4775: 5482, 4776: 5483, 4777: 5484, 4778: 5485, 4779: 5486, 4780: 5487, 4781: 5488, 4782: 5489, 4783: 5490, 4784: 5491, 4785: 9461, 4786: 5492, 4787: 5493, 4788: 5494, 4789: 5495, 4790: 9462, 4791: 9463, 4792: 5496, 4793: 5497, 4794: 5498, 4795: 5499, 4796: 5500, 4797: 5501, 4798: 5502, 4799: 9464, 4800: 5503, 4801: 9465, 4802: 5504, 4803: 5505, 4804: 5506, 4805: 5507, 4806: 9466, 4807: 9467, 4808: 5508, 4809: 5509, 4810: 5510, 4811: 5511, 4812: 5512, 4813: 5513, 4814: 5514, 4815: 5515, 4816: 5516, 4817: 5517, 4818: 5518, 4819: 5519, 4820: 5520, 4821: 5521, 4822: 5522, 4823: 9468, 4824: 5523, 4825: 5524, 4826: 5525, 4827: 5526, 4828: 5527, 4829: 5528, 4830: 5529, 4831: 5530, 4832: 5531, 4833: 5532, 4834: 5533, 4835: 5534, 4836: 5535, 4837: 5536, 4838: 5537, 4839: 5538, 4840: 5539, 4841: 5540, 4842: 5541, 4843: 5542, 4844: 5543, 4845: 5544, 4846: 5545, 4847: 5546, 4848: 5547, 4849: 5548, 4850: 5549, 4851: 5550, 4852: 5551, 4853: 5552, 4854: 5553, 4855: 5554, 4856: 5555, 4857: 5556, 4858: 5557, 4859: 5558, 4860: 5559, 4861: 5560, 4862: 5561, 4863: 5562, 4864: 5563, 4865: 5564, 4866: 5565, 4867: 5566, 4868: 5567, 4869: 5568, 4870: 5569, 4871: 5570, 4872: 5571, 4873: 5572, 4874: 5573, 4875: 5574, 4876: 5575, 4877: 5576, 4878: 5577, 4879: 5578, 4880: 5579, 4881: 9469, 4882: 5580, 4883: 5581, 4884: 5582, 4885: 5583, 4886: 9470, 4887: 9471, 4888: 5584, 4889: 5585, 4890: 5586, 4891: 5587, 4892: 5588, 4893: 5589, 4894: 5590, 4895: 5591, 4896: 5592, 4897: 5593, 4898: 5594, 4899: 5595, 4900: 5596, 4901: 5597, 4902: 5598, 4903: 5599, 4904: 5600, 4905: 5601, 4906: 5602, 4907: 5603, 4908: 5604, 4909: 5605, 4910: 5606, 4911: 5607, 4912: 5608, 4913: 5609, 4914: 5610, 4915: 5611, 4916: 5612, 4917: 5613, 4918: 5614, 4919: 5615, 4920: 5616, 4921: 5617, 4922: 5618, 4923: 5619, 4924: 5620, 4925: 5621, 4926: 5622, 4927: 5623, 4928: 5624, 4929: 5625, 4930: 5626, 4931: 5627, 4932: 5628, 4933: 5629, 4934: 5630, 4935: 5631, 4936: 5632, 4937: 5633, 4938: 5634, 4939: 5635, 4940: 5636, 4941: 5637, 4942: 5638, 4943: 5639, 4944: 5644, 4945: 5645, 4946: 5646, 4947: 5647, 4948: 5648, 4949: 5649, 4950: 5650, 4951: 5651, 4952: 5656, 4953: 5657, 4954: 5658, 4955: 9472, 4956: 9473, 4957: 493, 4958: 492, 4959: 491, 4960: 739, 4961: 673, 4962: 711, 4963: 674, 4964: 675, 4965: 676, 4966: 677, 4967: 700, 4968: 740, 4969: 2517, 4970: 2596, 4971: 2639, 4972: 2680, 4973: 2717, 4974: 2755, 4975: 2792, 4976: 2829, 4977: 2865, 4978: 2409, 4979: 2410, 4980: 2411, 4981: 2412, 4982: 2413, 4983: 2414, 4984: 2415, 4985: 2416, 4986: 2417, 4987: 2418, 4988: 2419, 4989: 9474, 4990: 9475, 4991: 9476, 4992: 5349, 4993: 5350, 4994: 5351, 4995: 5352, 4996: 5418, 4997: 5419, 4998: 5420, 4999: 5421, 5000: 5640, 5001: 5641, 5002: 5642, 5003: 5643, 5004: 5652, 5005: 5653, 5006: 5654, 5007: 5655, 5008: 1034, 5009: 1035, 5010: 1036, 5011: 1037, 5012: 1038, 5013: 1039, 5014: 1040, 5015: 1041, 5016: 1042, 5017: 1043, 5018: 9477, 5019: 9478, 5020: 9479, 5021: 9480, 5022: 9481, 5023: 9482, 5024: 7561, 5025: 7562, 5026: 7563, 5027: 7564, 5028: 7565, 5029: 7566, 5030: 7567, 5031: 7568, 5032: 7569, 5033: 7570, 5034: 7571, 5035: 7572, 5036: 7573, 5037: 7574, 5038: 7575, 5039: 7576, 5040: 7577, 5041: 7578, 5042: 7579, 5043: 7580, 5044: 7581, 5045: 7582, 5046: 7583, 5047: 7584, 5048: 7585, 5049: 7586, 5050: 7587, 5051: 7588, 5052: 7589, 5053: 7590, 5054: 7591, 5055: 7592, 5056: 7593, 5057: 7594, 5058: 7595, 5059: 7596, 5060: 7597, 5061: 7598, 5062: 7599, 5063: 7600, 5064: 7601, 5065: 7602, 5066: 7603, 5067: 7604, 5068: 7605, 5069: 7606, 5070: 7607, 5071: 7608, 5072: 7609, 5073: 7610, 5074: 7611, 5075: 7612, 5076: 7613, 5077: 7614, 5078: 7615, 5079: 7616, 5080: 7617, 5081: 7618, 5082: 7619, 5083: 7620, 5084: 7621, 5085: 7622, 5086: 7623, 5087: 7624, 5088: 7625, 5089: 7626, 5090: 7627, 5091: 7628, 5092: 7629, 5093: 7630, 5094: 7631, 5095: 7632, 5096: 7633, 5097: 7634, 5098: 7635, 5099: 7636, 5100: 7637, 5101: 7638, 5102: 7639, 5103: 7640, 5104: 7641, 5105: 7642, 5106: 7643, 5107: 7644, 5108: 7645, 5109: 9483, 5110: 9484, 5111: 9485, 5112: 9486, 5113: 9487, 5114: 9488, 5115: 9489, 5116: 9490, 5117: 9491, 5118: 9492, 5119: 9493, 5120: 625, 5121: 7646, 5122: 7647, 5123: 7648, 5124: 7649, 5125: 7650, 5126: 7651, 5127: 7652, 5128: 7653, 5129: 7654, 5130: 7655, 5131: 7656, 5132: 7657, 5133: 7658, 5134: 7659, 5135: 7660, 5136: 7661, 5137: 7662, 5138: 7663, 5139: 7664, 5140: 7665, 5141: 7666, 5142: 7667, 5143: 7668, 5144: 7669, 5145: 7670, 5146: 7671, 5147: 7672, 5148: 7673, 5149: 7674, 5150: 7675, 5151: 7676, 5152: 7677, 5153: 7678, 5154: 7679, 5155: 7680, 5156: 7681, 5157: 7682, 5158: 7683, 5159: 7684, 5160: 7685, 5161: 7686, 5162: 7687, 5163: 7688, 5164: 7689, 5165: 7690, 5166: 7691, 5167: 7692, 5168: 7693, 5169: 7694, 5170: 7695, 5171: 7696, 5172: 7697, 5173: 7698, 5174: 7699, 5175: 7700, 5176: 7701, 5177: 7702, 5178: 7703, 5179: 7704, 5180: 7705, 5181: 7706, 5182: 7707, 5183: 7708, 5184: 7709, 5185: 7710, 5186: 7711, 5187: 7712, 5188: 7713, 5189: 7714, 5190: 7715, 5191: 7716, 5192: 7717, 5193: 7718, 5194: 7719, 5195: 7720, 5196: 7721, 5197: 7722, 5198: 7723, 5199: 7724, 5200: 7725, 5201: 7726, 5202: 7727, 5203: 7728, 5204: 7729, 5205: 7730, 5206: 7731, 5207: 7732, 5208: 7733, 5209: 7734, 5210: 7735, 5211: 7736, 5212: 7737, 5213: 7738, 5214: 7739, 5215: 7740, 5216: 7741, 5217: 7742, 5218: 7743, 5219: 7744, 5220: 7745, 5221: 7746, 5222: 7747, 5223: 7748, 5224: 7749, 5225: 7750, 5226: 7751, 5227: 7752, 5228: 7753, 5229: 7754, 5230: 7755, 5231: 7756, 5232: 7757, 5233: 7758, 5234: 7759, 5235: 7760, 5236: 7761, 5237: 7762, 5238: 7763, 5239: 7764, 5240: 7765, 5241: 7766, 5242: 7767, 5243: 7768, 5244: 7769, 5245: 7770, 5246: 7771, 5247: 7772, 5248: 7773, 5249: 7774, 5250: 7775, 5251: 7776, 5252: 7777, 5253: 7778, 5254: 7779, 5255: 7780, 5256: 7781, 5257: 7782, 5258: 7783, 5259: 7784, 5260: 7785, 5261: 7786, 5262: 7787, 5263: 7788, 5264: 7789, 5265: 7790, 5266: 7791, 5267: 7792, 5268: 7793, 5269: 7794, 5270: 7795, 5271: 7796, 5272: 7797, 5273: 7798, 5274: 7799, 5275: 7800, 5276: 7801, 5277: 7802, 5278: 7803, 5279: 7804, 5280: 7805, 5281: 7806, 5282: 7807, 5283: 7808, 5284: 7809, 5285: 7810, 5286: 7811, 5287: 7812, 5288: 7813, 5289: 7814, 5290: 7815, 5291: 7816, 5292: 7817, 5293: 7818, 5294: 7819, 5295: 7820, 5296: 7821, 5297: 7822, 5298: 7823, 5299: 7824, 5300: 7825, 5301: 7826, 5302: 7827, 5303: 7828, 5304: 7829, 5305: 7830, 5306: 7831, 5307: 7832, 5308: 7833, 5309: 7834, 5310: 7835, 5311: 7836, 5312: 7837, 5313: 7838, 5314: 7839, 5315: 7840, 5316: 7841, 5317: 7842, 5318: 7843, 5319: 7844, 5320: 7845, 5321: 7846, 5322: 7847, 5323: 7848, 5324: 7849, 5325: 7850, 5326: 7851, 5327: 7852, 5328: 7853, 5329: 7854, 5330: 7855, 5331: 7856, 5332: 7857, 5333: 7858, 5334: 7859, 5335: 7860, 5336: 7861, 5337: 7862, 5338: 7863, 5339: 7864, 5340: 7865, 5341: 7866, 5342: 7867, 5343: 7868, 5344: 7869, 5345: 7870, 5346: 7871, 5347: 7872, 5348: 7873, 5349: 7874, 5350: 7875, 5351: 7876, 5352: 7877, 5353: 7878, 5354: 7879, 5355: 7880, 5356: 7881, 5357: 7882, 5358: 7883, 5359: 7884, 5360: 7885, 5361: 7886, 5362: 7887, 5363: 7888, 5364: 7889, 5365: 7890, 5366: 7891, 5367: 7892, 5368: 7893, 5369: 7894, 5370: 7895, 5371: 7896, 5372: 7897, 5373: 7898, 5374: 7899, 5375: 7900, 5376: 7901, 5377: 7902, 5378: 7903, 5379: 7904, 5380: 7905, 5381: 7906, 5382: 7907, 5383: 7908, 5384: 7909, 5385: 7910, 5386: 7911, 5387: 7912, 5388: 7913, 5389: 7914, 5390: 7915, 5391: 7916, 5392: 7917, 5393: 7918, 5394: 7919, 5395: 7920, 5396: 7921, 5397: 7922, 5398: 7923, 5399: 7924, 5400: 7925, 5401: 7926, 5402: 7927, 5403: 7928, 5404: 7929, 5405: 7930, 5406: 7931, 5407: 7932, 5408: 7933, 5409: 7934, 5410: 7935, 5411: 7936, 5412: 7937, 5413: 7938, 5414: 7939, 5415: 7940, 5416: 7941, 5417: 7942, 5418: 7943, 5419: 7944, 5420: 7945, 5421: 7946, 5422: 7947, 5423: 7948, 5424: 7949, 5425: 7950, 5426: 7951, 5427: 7952, 5428: 7953, 5429: 7954, 5430: 7955, 5431: 7956, 5432: 7957, 5433: 7958, 5434: 7959, 5435: 7960, 5436: 7961, 5437: 7962, 5438: 7963, 5439: 7964, 5440: 7965, 5441: 7966, 5442: 7967, 5443: 7968, 5444: 7969, 5445: 7970, 5446: 7971, 5447: 7972, 5448: 7973, 5449: 7974, 5450: 7975, 5451: 7976, 5452: 7977, 5453: 7978, 5454: 7979, 5455: 7980, 5456: 7981, 5457: 7982, 5458: 7983, 5459: 7984, 5460: 7985, 5461: 7986, 5462: 7987, 5463: 7988, 5464: 7989, 5465: 7990, 5466: 7991, 5467: 7992, 5468: 7993, 5469: 7994, 5470: 7995, 5471: 7996, 5472: 7997, 5473: 7998, 5474: 7999, 5475: 8000, 5476: 8001, 5477: 8002, 5478: 8003, 5479: 8004, 5480: 8005, 5481: 8006, 5482: 8007, 5483: 8008, 5484: 8009, 5485: 8010, 5486: 8011, 5487: 8012, 5488: 8013, 5489: 8014, 5490: 8015, 5491: 8016, 5492: 8017, 5493: 8018, 5494: 8019, 5495: 8020, 5496: 8021, 5497: 8022, 5498: 8023, 5499: 8024, 5500: 8075, 5501: 8025, 5502: 8027, 5503: 8028, 5504: 8029, 5505: 8030, 5506: 8031, 5507: 8032, 5508: 8033, 5509: 8034, 5510: 8035, 5511: 8036, 5512: 8037, 5513: 8038, 5514: 8039, 5515: 8040, 5516: 8041, 5517: 8042, 5518: 8044, 5519: 8045, 5520: 8046, 5521: 8047, 5522: 8048, 5523: 8049, 5524: 8050, 5525: 8051, 5526: 8058, 5527: 8059, 5528: 8060, 5529: 8061, 5530: 8062, 5531: 8063, 5532: 8064, 5533: 8065, 5534: 8066, 5535: 8067, 5536: 8068, 5537: 8069, 5538: 8070, 5539: 8071, 5540: 8072, 5541: 8073, 5542: 8074, 5543: 8076, 5544: 8077, 5545: 8078, 5546: 8079, 5547: 8080, 5548: 8081, 5549: 8082, 5550: 8083, 5551: 8084, 5552: 8085, 5553: 8086, 5554: 8087, 5555: 8088, 5556: 8089, 5557: 8090, 5558: 8091, 5559: 8092, 5560: 8093, 5561: 8094, 5562: 8095, 5563: 8096, 5564: 8097, 5565: 8098, 5566: 8099, 5567: 8100, 5568: 8101, 5569: 8102, 5570: 8103, 5571: 8104, 5572: 8105, 5573: 8106, 5574: 8107, 5575: 8108, 5576: 8109, 5577: 8110, 5578: 8111, 5579: 8112, 5580: 8113, 5581: 8114, 5582: 8115, 5583: 8116, 5584: 8117, 5585: 8118, 5586: 8119, 5587: 8120, 5588: 8121, 5589: 8122, 5590: 8123, 5591: 8124, 5592: 8125, 5593: 8126, 5594: 8127, 5595: 8128, 5596: 8129, 5597: 8130, 5598: 8131, 5599: 8132, 5600: 8133, 5601: 8134, 5602: 8135, 5603: 8136, 5604: 8137, 5605: 8138, 5606: 8139, 5607: 8140, 5608: 8141, 5609: 8142, 5610: 8143, 5611: 8144, 5612: 8145, 5613: 8146, 5614: 8147, 5615: 8148, 5616: 8149, 5617: 8150, 5618: 8151, 5619: 8152, 5620: 8153, 5621: 8154, 5622: 8155, 5623: 8156, 5624: 8157, 5625: 8158, 5626: 8159, 5627: 8160, 5628: 8161, 5629: 8162, 5630: 8163, 5631: 8164, 5632: 8165, 5633: 8166, 5634: 8167, 5635: 8168, 5636: 8169, 5637: 8170, 5638: 8171, 5639: 8172, 5640: 8173, 5641: 8174, 5642: 8175, 5643: 8176, 5644: 8177, 5645: 8178, 5646: 8179, 5647: 8180, 5648: 8181, 5649: 8182, 5650: 8183, 5651: 8184, 5652: 8185, 5653: 8186, 5654: 8187, 5655: 8188, 5656: 8189, 5657: 8190, 5658: 8191, 5659: 8192, 5660: 8193, 5661: 8194, 5662: 8195, 5663: 8196, 5664: 8197, 5665: 8198, 5666: 8199, 5667: 8200, 5668: 8201, 5669: 8202, 5670: 8203, 5671: 8204, 5672: 8205, 5673: 8206, 5674: 8207, 5675: 8208, 5676: 8209, 5677: 8210, 5678: 8211, 5679: 8212, 5680: 8213, 5681: 8214, 5682: 8215, 5683: 8216, 5684: 8217, 5685: 8218, 5686: 8219, 5687: 8220, 5688: 8221, 5689: 8222, 5690: 8223, 5691: 8224, 5692: 8225, 5693: 8226, 5694: 8227, 5695: 8228, 5696: 8229, 5697: 8230, 5698: 8231, 5699: 8232, 5700: 8233, 5701: 8234, 5702: 8235, 5703: 8236, 5704: 8237, 5705: 8238, 5706: 8239, 5707: 8240, 5708: 8241, 5709: 8242, 5710: 8243, 5711: 8244, 5712: 8245, 5713: 8246, 5714: 8247, 5715: 8248, 5716: 8249, 5717: 8250, 5718: 8251, 5719: 8252, 5720: 8253, 5721: 8254, 5722: 8255, 5723: 8256, 5724: 8257, 5725: 8258, 5726: 8259, 5727: 8260, 5728: 8261, 5729: 8262, 5730: 8263, 5731: 8264, 5732: 8265, 5733: 8266, 5734: 8267, 5735: 8268, 5736: 8269, 5737: 8270, 5738: 8271, 5739: 8272, 5740: 8273, 5741: 940, 5742: 714, 5743: 8026, 5744: 8043, 5745: 8052, 5746: 8053, 5747: 8054, 5748: 8055, 5749: 8056, 5750: 8057, 5751: 8274, 5752: 8275, 5753: 8276, 5754: 8277, 5755: 8278, 5756: 8279, 5757: 8280, 5758: 8281, 5759: 8282, 5760: 605, 5761: 8353, 5762: 8354, 5763: 8355, 5764: 8356, 5765: 8357, 5766: 8358, 5767: 8359, 5768: 8360, 5769: 8361, 5770: 8362, 5771: 8363, 5772: 8364, 5773: 8365, 5774: 8366, 5775: 8367, 5776: 8368, 5777: 8369, 5778: 8370, 5779: 8371, 5780: 8372, 5781: 8373, 5782: 8374, 5783: 8375, 5784: 8376, 5785: 8377, 5786: 8378, 5787: 828, 5788: 829, 5789: 9494, 5790: 9495, 5791: 9496, 5792: 8379, 5793: 8380, 5794: 8381, 5795: 8446, 5796: 8382, 5797: 8383, 5798: 8384, 5799: 8385, 5800: 8387, 5801: 8388, 5802: 8444, 5803: 8445, 5804: 8389, 5805: 8390, 5806: 8391, 5807: 8392, 5808: 8393, 5809: 8394, 5810: 8395, 5811: 8396, 5812: 8397, 5813: 8398, 5814: 8399, 5815: 8400, 5816: 8449, 5817: 8401, 5818: 8403, 5819: 8404, 5820: 8405, 5821: 8406, 5822: 8407, 5823: 8408, 5824: 8409, 5825: 8410, 5826: 8411, 5827: 8412, 5828: 8413, 5829: 8414, 5830: 8415, 5831: 8417, 5832: 8418, 5833: 8420, 5834: 8421, 5835: 8422, 5836: 8424, 5837: 8425, 5838: 8426, 5839: 8427, 5840: 8428, 5841: 8429, 5842: 8430, 5843: 8431, 5844: 8432, 5845: 8419, 5846: 8433, 5847: 8434, 5848: 8435, 5849: 8436, 5850: 8438, 5851: 8439, 5852: 8440, 5853: 8441, 5854: 8442, 5855: 8443, 5856: 8447, 5857: 8451, 5858: 8452, 5859: 8448, 5860: 8450, 5861: 8453, 5862: 8454, 5863: 8455, 5864: 8456, 5865: 8402, 5866: 8423, 5867: 683, 5868: 684, 5869: 685, 5870: 8416, 5871: 8437, 5872: 8386, 5873: 9497, 5874: 9498, 5875: 9499, 5876: 9500, 5877: 9501, 5878: 9502, 5879: 9503, 5880: 9504, 5881: 9505, 5882: 9506, 5883: 9507, 5884: 9508, 5885: 9509, 5886: 9510, 5887: 9511, 5888: 6778, 5889: 6779, 5890: 6780, 5891: 6781, 5892: 6782, 5893: 6783, 5894: 6784, 5895: 6785, 5896: 6786, 5897: 6787, 5898: 6788, 5899: 6789, 5900: 6790, 5901: 9512, 5902: 6791, 5903: 6792, 5904: 6793, 5905: 6794, 5906: 6795, 5907: 6796, 5908: 6797, 5909: 9513, 5910: 9514, 5911: 9515, 5912: 9516, 5913: 9517, 5914: 9518, 5915: 9519, 5916: 9520, 5917: 9521, 5918: 9522, 5919: 9523, 5920: 6798, 5921: 6799, 5922: 6800, 5923: 6801, 5924: 6802, 5925: 6803, 5926: 6804, 5927: 6805, 5928: 6806, 5929: 6807, 5930: 6808, 5931: 6809, 5932: 6810, 5933: 6811, 5934: 6812, 5935: 6813, 5936: 6814, 5937: 6815, 5938: 6816, 5939: 6817, 5940: 6818, 5941: 722, 5942: 723, 5943: 9524, 5944: 9525, 5945: 9526, 5946: 9527, 5947: 9528, 5948: 9529, 5949: 9530, 5950: 9531, 5951: 9532, 5952: 6819, 5953: 6820, 5954: 6821, 5955: 6822, 5956: 6823, 5957: 6824, 5958: 6825, 5959: 6826, 5960: 6827, 5961: 6828, 5962: 6829, 5963: 6830, 5964: 6831, 5965: 6832, 5966: 6833, 5967: 6834, 5968: 6835, 5969: 6836, 5970: 6837, 5971: 6838, 5972: 9533, 5973: 9534, 5974: 9535, 5975: 9536, 5976: 9537, 5977: 9538, 5978: 9539, 5979: 9540, 5980: 9541, 5981: 9542, 5982: 9543, 5983: 9544, 5984: 6839, 5985: 6840, 5986: 6841, 5987: 6842, 5988: 6843, 5989: 6844, 5990: 6845, 5991: 6846, 5992: 6847, 5993: 6848, 5994: 6849, 5995: 6850, 5996: 6851, 5997: 9545, 5998: 6852, 5999: 6853, 6000: 6854, 6001: 9546, 6002: 6855, 6003: 6856, 6004: 9547, 6005: 9548, 6006: 9549, 6007: 9550, 6008: 9551, 6009: 9552, 6010: 9553, 6011: 9554, 6012: 9555, 6013: 9556, 6014: 9557, 6015: 9558, 6016: 7064, 6017: 7065, 6018: 7066, 6019: 7067, 6020: 7068, 6021: 7069, 6022: 7070, 6023: 7071, 6024: 7072, 6025: 7073, 6026: 7074, 6027: 7075, 6028: 7076, 6029: 7077, 6030: 7078, 6031: 7079, 6032: 7080, 6033: 7081, 6034: 7082, 6035: 7083, 6036: 7084, 6037: 7085, 6038: 7086, 6039: 7087, 6040: 7088, 6041: 7089, 6042: 7090, 6043: 7091, 6044: 7092, 6045: 7093, 6046: 7094, 6047: 7095, 6048: 7096, 6049: 7097, 6050: 7098, 6051: 7100, 6052: 7101, 6053: 7102, 6054: 7103, 6055: 7104, 6056: 7105, 6057: 7106, 6058: 7107, 6059: 7108, 6060: 7109, 6061: 7110, 6062: 7111, 6063: 7112, 6064: 7113, 6065: 7114, 6066: 7115, 6067: 7116, 6068: 183, 6069: 184, 6070: 7117, 6071: 7118, 6072: 7119, 6073: 7120, 6074: 7121, 6075: 7122, 6076: 7123, 6077: 7124, 6078: 7125, 6079: 7126, 6080: 7127, 6081: 7128, 6082: 7129, 6083: 7130, 6084: 7131, 6085: 7132, 6086: 524, 6087: 540, 6088: 566, 6089: 567, 6090: 568, 6091: 276, 6092: 277, 6093: 278, 6094: 279, 6095: 280, 6096: 281, 6097: 282, 6098: 7133, 6099: 185, 6100: 726, 6101: 727, 6102: 681, 6103: 2431, 6104: 928, 6105: 929, 6106: 930, 6107: 2446, 6108: 7099, 6109: 283, 6110: 9559, 6111: 9560, 6112: 2502, 6113: 2541, 6114: 2619, 6115: 2662, 6116: 2701, 6117: 2738, 6118: 2776, 6119: 2813, 6120: 2850, 6121: 2886, 6122: 9561, 6123: 9562, 6124: 9563, 6125: 9564, 6126: 9565, 6127: 9566, 6128: 2503, 6129: 2542, 6130: 2620, 6131: 2663, 6132: 2702, 6133: 2739, 6134: 2777, 6135: 2814, 6136: 2851, 6137: 2887, 6138: 9567, 6139: 9568, 6140: 9569, 6141: 9570, 6142: 9571, 6143: 9572, 6144: 891, 6145: 707, 6146: 643, 6147: 712, 6148: 678, 6149: 679, 6150: 627, 6151: 628, 6152: 644, 6153: 713, 6154: 186, 6155: 61, 6156: 62, 6157: 63, 6158: 601, 6159: 9573, 6160: 2506, 6161: 2545, 6162: 2623, 6163: 2666, 6164: 2705, 6165: 2742, 6166: 2780, 6167: 2817, 6168: 2854, 6169: 2890, 6170: 9574, 6171: 9575, 6172: 9576, 6173: 9577, 6174: 9578, 6175: 9579, 6176: 7402, 6177: 7404, 6178: 7407, 6179: 7413, 6180: 7415, 6181: 7418, 6182: 7420, 6183: 7423, 6184: 7424, 6185: 7425, 6186: 7430, 6187: 7432, 6188: 7435, 6189: 7437, 6190: 7442, 6191: 7444, 6192: 7445, 6193: 7446, 6194: 7453, 6195: 7456, 6196: 7459, 6197: 7464, 6198: 7468, 6199: 7471, 6200: 7473, 6201: 7475, 6202: 7478, 6203: 7483, 6204: 7484, 6205: 7487, 6206: 7491, 6207: 7494, 6208: 7495, 6209: 7496, 6210: 7497, 6211: 7401, 6212: 7405, 6213: 7408, 6214: 7414, 6215: 7416, 6216: 7419, 6217: 7421, 6218: 7426, 6219: 7431, 6220: 7433, 6221: 7436, 6222: 7438, 6223: 7443, 6224: 7454, 6225: 7457, 6226: 7460, 6227: 7465, 6228: 7485, 6229: 7469, 6230: 7474, 6231: 7479, 6232: 7489, 6233: 7492, 6234: 7498, 6235: 7499, 6236: 7462, 6237: 7406, 6238: 7409, 6239: 7412, 6240: 7422, 6241: 7417, 6242: 7427, 6243: 7480, 6244: 7439, 6245: 7441, 6246: 7434, 6247: 7447, 6248: 7455, 6249: 7458, 6250: 7466, 6251: 7476, 6252: 7490, 6253: 7493, 6254: 7486, 6255: 7488, 6256: 7500, 6257: 7461, 6258: 7470, 6259: 7410, 6260: 7481, 6261: 7472, 6262: 7477, 6263: 7467, 6264: 9580, 6265: 9581, 6266: 9582, 6267: 9583, 6268: 9584, 6269: 9585, 6270: 9586, 6271: 9587, 6272: 7394, 6273: 7395, 6274: 7396, 6275: 7397, 6276: 7398, 6277: 7399, 6278: 7400, 6279: 7403, 6280: 7411, 6281: 7482, 6282: 7428, 6283: 7463, 6284: 7501, 6285: 7503, 6286: 7504, 6287: 7506, 6288: 7507, 6289: 7510, 6290: 7512, 6291: 7513, 6292: 7515, 6293: 7517, 6294: 7519, 6295: 7520, 6296: 7508, 6297: 7518, 6298: 7440, 6299: 7429, 6300: 7448, 6301: 7449, 6302: 7502, 6303: 7505, 6304: 7509, 6305: 7511, 6306: 7450, 6307: 7516, 6308: 7451, 6309: 7452, 6310: 7521, 6311: 7522, 6312: 7514, 6313: 7524, 6314: 7523, 6315: 9588, 6316: 9589, 6317: 9590, 6318: 9591, 6319: 9592, 6320: 8283, 6321: 8284, 6322: 8285, 6323: 8286, 6324: 8287, 6325: 8288, 6326: 8289, 6327: 8290, 6328: 8291, 6329: 8292, 6330: 8293, 6331: 8294, 6332: 8295, 6333: 8296, 6334: 8297, 6335: 8298, 6336: 8299, 6337: 8300, 6338: 8301, 6339: 8302, 6340: 8303, 6341: 8304, 6342: 8305, 6343: 8306, 6344: 8307, 6345: 8308, 6346: 8309, 6347: 8310, 6348: 8311, 6349: 8312, 6350: 8313, 6351: 8314, 6352: 8315, 6353: 8316, 6354: 8317, 6355: 8318, 6356: 8319, 6357: 8320, 6358: 8321, 6359: 8322, 6360: 8323, 6361: 8324, 6362: 8325, 6363: 8326, 6364: 8327, 6365: 8328, 6366: 8329, 6367: 8330, 6368: 8331, 6369: 8332, 6370: 8333, 6371: 8334, 6372: 8335, 6373: 8336, 6374: 8337, 6375: 8338, 6376: 8339, 6377: 8340, 6378: 8341, 6379: 8342, 6380: 8343, 6381: 8344, 6382: 8345, 6383: 8346, 6384: 8347, 6385: 8348, 6386: 8349, 6387: 8350, 6388: 8351, 6389: 8352, 6390: 9593, 6391: 9594, 6392: 9595, 6393: 9596, 6394: 9597, 6395: 9598, 6396: 9599, 6397: 9600, 6398: 9601, 6399: 9602, 6400: 6728, 6401: 6729, 6402: 6730, 6403: 6731, 6404: 6732, 6405: 6733, 6406: 6734, 6407: 6735, 6408: 6736, 6409: 6737, 6410: 6738, 6411: 6739, 6412: 6740, 6413: 6741, 6414: 6742, 6415: 6743, 6416: 6744, 6417: 6745, 6418: 6746, 6419: 6747, 6420: 6748, 6421: 6749, 6422: 6750, 6423: 6751, 6424: 6752, 6425: 6753, 6426: 6754, 6427: 6755, 6428: 6756, 6429: 9603, 6430: 9604, 6431: 9605, 6432: 6757, 6433: 6758, 6434: 6759, 6435: 6760, 6436: 6761, 6437: 6762, 6438: 6763, 6439: 6764, 6440: 6765, 6441: 6766, 6442: 6767, 6443: 6768, 6444: 9606, 6445: 9607, 6446: 9608, 6447: 9609, 6448: 6769, 6449: 6770, 6450: 6771, 6451: 6772, 6452: 6773, 6453: 6774, 6454: 6775, 6455: 6776, 6456: 6777, 6457: 577, 6458: 578, 6459: 579, 6460: 9610, 6461: 9611, 6462: 9612, 6463: 9613, 6464: 1101, 6465: 9614, 6466: 9615, 6467: 9616, 6468: 692, 6469: 701, 6470: 2491, 6471: 2529, 6472: 2608, 6473: 2651, 6474: 2690, 6475: 2727, 6476: 2765, 6477: 2802, 6478: 2839, 6479: 2875, 6480: 7134, 6481: 7135, 6482: 7136, 6483: 7137, 6484: 7138, 6485: 7139, 6486: 7140, 6487: 7141, 6488: 7142, 6489: 7143, 6490: 7144, 6491: 7145, 6492: 7146, 6493: 7147, 6494: 7148, 6495: 7149, 6496: 7150, 6497: 7151, 6498: 7152, 6499: 7153, 6500: 7154, 6501: 7155, 6502: 7156, 6503: 7157, 6504: 7158, 6505: 7159, 6506: 7160, 6507: 7161, 6508: 7162, 6509: 7163, 6510: 9617, 6511: 9618, 6512: 7164, 6513: 7165, 6514: 7166, 6515: 7167, 6516: 7168, 6517: 9619, 6518: 9620, 6519: 9621, 6520: 9622, 6521: 9623, 6522: 9624, 6523: 9625, 6524: 9626, 6525: 9627, 6526: 9628, 6527: 9629, 6528: 7169, 6529: 7170, 6530: 7171, 6531: 7172, 6532: 7173, 6533: 7174, 6534: 7175, 6535: 7176, 6536: 7177, 6537: 7178, 6538: 7179, 6539: 7180, 6540: 7181, 6541: 7182, 6542: 7183, 6543: 7184, 6544: 7185, 6545: 7186, 6546: 7187, 6547: 7188, 6548: 7189, 6549: 7190, 6550: 7191, 6551: 7192, 6552: 7193, 6553: 7194, 6554: 7195, 6555: 7196, 6556: 7197, 6557: 7200, 6558: 7201, 6559: 7202, 6560: 7203, 6561: 7204, 6562: 7205, 6563: 7206, 6564: 7207, 6565: 7208, 6566: 7209, 6567: 7210, 6568: 7211, 6569: 7212, 6570: 7213, 6571: 7214, 6572: 9630, 6573: 9631, 6574: 9632, 6575: 9633, 6576: 7215, 6577: 7216, 6578: 7217, 6579: 7218, 6580: 7219, 6581: 7220, 6582: 7221, 6583: 7222, 6584: 7223, 6585: 7224, 6586: 7225, 6587: 7226, 6588: 7227, 6589: 7228, 6590: 7229, 6591: 7230, 6592: 7231, 6593: 7232, 6594: 7233, 6595: 7234, 6596: 7235, 6597: 7236, 6598: 7237, 6599: 7238, 6600: 7239, 6601: 7240, 6602: 9634, 6603: 9635, 6604: 9636, 6605: 9637, 6606: 9638, 6607: 9639, 6608: 2492, 6609: 2530, 6610: 2609, 6611: 2652, 6612: 2691, 6613: 2728, 6614: 2766, 6615: 2803, 6616: 2840, 6617: 2876, 6618: 2531, 6619: 9640, 6620: 9641, 6621: 9642, 6622: 7198, 6623: 7199, 6624: 1104, 6625: 1105, 6626: 1106, 6627: 1107, 6628: 1108, 6629: 1109, 6630: 1110, 6631: 1111, 6632: 1112, 6633: 1113, 6634: 1114, 6635: 1115, 6636: 1116, 6637: 1117, 6638: 1118, 6639: 1119, 6640: 1120, 6641: 1121, 6642: 1122, 6643: 1123, 6644: 1124, 6645: 1125, 6646: 1126, 6647: 1127, 6648: 1128, 6649: 1129, 6650: 1130, 6651: 1131, 6652: 1132, 6653: 1133, 6654: 1134, 6655: 1135, 6656: 6857, 6657: 6858, 6658: 6859, 6659: 6860, 6660: 6861, 6661: 6862, 6662: 6863, 6663: 6864, 6664: 6865, 6665: 6866, 6666: 6867, 6667: 6868, 6668: 6869, 6669: 6870, 6670: 6871, 6671: 6872, 6672: 6873, 6673: 6874, 6674: 6875, 6675: 6876, 6676: 6877, 6677: 6878, 6678: 6879, 6679: 6880, 6680: 6881, 6681: 6882, 6682: 6883, 6683: 6884, 6684: 9643, 6685: 9644, 6686: 741, 6687: 742, 6688: 7241, 6689: 7242, 6690: 7243, 6691: 7244, 6692: 7245, 6693: 7246, 6694: 7247, 6695: 7250, 6696: 7251, 6697: 7252, 6698: 7253, 6699: 7254, 6700: 7255, 6701: 7256, 6702: 7257, 6703: 7258, 6704: 7259, 6705: 7260, 6706: 7261, 6707: 7262, 6708: 7263, 6709: 7264, 6710: 7265, 6711: 7266, 6712: 7267, 6713: 7268, 6714: 7269, 6715: 7270, 6716: 7273, 6717: 7274, 6718: 7275, 6719: 7276, 6720: 7277, 6721: 7278, 6722: 7279, 6723: 7280, 6724: 7281, 6725: 7282, 6726: 7283, 6727: 7285, 6728: 7286, 6729: 7287, 6730: 7288, 6731: 7289, 6732: 7290, 6733: 7299, 6734: 7300, 6735: 7301, 6736: 7302, 6737: 7303, 6738: 7304, 6739: 7291, 6740: 7284, 6741: 7293, 6742: 7294, 6743: 7295, 6744: 7248, 6745: 7249, 6746: 7271, 6747: 7272, 6748: 7296, 6749: 7297, 6750: 7298, 6751: 9645, 6752: 7323, 6753: 7305, 6754: 7307, 6755: 7308, 6756: 7309, 6757: 7310, 6758: 7311, 6759: 7312, 6760: 7313, 6761: 7314, 6762: 7315, 6763: 7292, 6764: 7306, 6765: 7322, 6766: 7316, 6767: 7317, 6768: 7319, 6769: 7320, 6770: 7321, 6771: 7318, 6772: 525, 6773: 569, 6774: 570, 6775: 571, 6776: 572, 6777: 573, 6778: 574, 6779: 575, 6780: 576, 6781: 9646, 6782: 9647, 6783: 187, 6784: 2493, 6785: 2532, 6786: 2610, 6787: 2653, 6788: 2692, 6789: 2729, 6790: 2767, 6791: 2804, 6792: 2841, 6793: 2877, 6794: 9648, 6795: 9649, 6796: 9650, 6797: 9651, 6798: 9652, 6799: 9653, 6800: 2494, 6801: 2533, 6802: 2611, 6803: 2654, 6804: 2693, 6805: 2730, 6806: 2768, 6807: 2805, 6808: 2842, 6809: 2878, 6810: 9654, 6811: 9655, 6812: 9656, 6813: 9657, 6814: 9658, 6815: 9659, 6816: 931, 6817: 932, 6818: 933, 6819: 934, 6820: 935, 6821: 936, 6822: 937, 6823: 2432, 6824: 728, 6825: 729, 6826: 730, 6827: 731, 6828: 938, 6829: 939, 6830: 9660, 6831: 9661, 6832: 9662, 6833: 9663, 6834: 9664, 6835: 9665, 6836: 9666, 6837: 9667, 6838: 9668, 6839: 9669, 6840: 9670, 6841: 9671, 6842: 9672, 6843: 9673, 6844: 9674, 6845: 9675, 6846: 9676, 6847: 9677, 6848: 9678, 6849: 9679, 6850: 9680, 6851: 9681, 6852: 9682, 6853: 9683, 6854: 9684, 6855: 9685, 6856: 9686, 6857: 9687, 6858: 9688, 6859: 9689, 6860: 9690, 6861: 9691, 6862: 9692, 6863: 9693, 6864: 9694, 6865: 9695, 6866: 9696, 6867: 9697, 6868: 9698, 6869: 9699, 6870: 9700, 6871: 9701, 6872: 9702, 6873: 9703, 6874: 9704, 6875: 9705, 6876: 9706, 6877: 9707, 6878: 9708, 6879: 9709, 6880: 9710, 6881: 9711, 6882: 9712, 6883: 9713, 6884: 9714, 6885: 9715, 6886: 9716, 6887: 9717, 6888: 9718, 6889: 9719, 6890: 9720, 6891: 9721, 6892: 9722, 6893: 9723, 6894: 9724, 6895: 9725, 6896: 9726, 6897: 9727, 6898: 9728, 6899: 9729, 6900: 9730, 6901: 9731, 6902: 9732, 6903: 9733, 6904: 9734, 6905: 9735, 6906: 9736, 6907: 9737, 6908: 9738, 6909: 9739, 6910: 9740, 6911: 9741, 6912: 510, 6913: 511, 6914: 526, 6915: 547, 6916: 541, 6917: 7324, 6918: 7325, 6919: 7326, 6920: 7327, 6921: 7328, 6922: 7329, 6923: 7330, 6924: 7331, 6925: 7332, 6926: 7333, 6927: 7334, 6928: 7335, 6929: 7336, 6930: 7337, 6931: 7338, 6932: 7341, 6933: 7342, 6934: 7343, 6935: 7344, 6936: 7345, 6937: 7346, 6938: 7347, 6939: 7348, 6940: 7349, 6941: 7350, 6942: 7351, 6943: 7352, 6944: 7353, 6945: 7354, 6946: 7355, 6947: 7357, 6948: 7358, 6949: 7359, 6950: 7360, 6951: 7361, 6952: 7363, 6953: 7364, 6954: 7365, 6955: 7366, 6956: 7367, 6957: 7368, 6958: 7369, 6959: 7370, 6960: 7372, 6961: 7373, 6962: 7374, 6963: 7377, 6964: 500, 6965: 7378, 6966: 7379, 6967: 7380, 6968: 7381, 6969: 7382, 6970: 7383, 6971: 7384, 6972: 7385, 6973: 7386, 6974: 7387, 6975: 7388, 6976: 7389, 6977: 7390, 6978: 7391, 6979: 7392, 6980: 7393, 6981: 7339, 6982: 7340, 6983: 7356, 6984: 7362, 6985: 7371, 6986: 7375, 6987: 7376, 6988: 9742, 6989: 9743, 6990: 9744, 6991: 9745, 6992: 2504, 6993: 2543, 6994: 2621, 6995: 2664, 6996: 2703, 6997: 2740, 6998: 2778, 6999: 2815, 7000: 2852, 7001: 2888, 7002: 743, 7003: 744, 7004: 715, 7005: 682, 7006: 732, 7007: 733, 7008: 626, 7009: 1136, 7010: 1137, 7011: 1138, 7012: 1139, 7013: 1140, 7014: 1141, 7015: 1142, 7016: 1143, 7017: 1144, 7018: 1145, 7019: 188, 7020: 189, 7021: 190, 7022: 191, 7023: 192, 7024: 193, 7025: 194, 7026: 195, 7027: 196, 7028: 1146, 7029: 1147, 7030: 1148, 7031: 1149, 7032: 1150, 7033: 1151, 7034: 1152, 7035: 1153, 7036: 1154, 7037: 9746, 7038: 9747, 7039: 9748, 7040: 527, 7041: 548, 7042: 542, 7043: 6392, 7044: 6394, 7045: 6395, 7046: 6396, 7047: 6397, 7048: 6398, 7049: 6399, 7050: 6400, 7051: 6403, 7052: 6404, 7053: 6405, 7054: 6406, 7055: 6407, 7056: 6408, 7057: 6409, 7058: 6410, 7059: 6411, 7060: 6412, 7061: 6413, 7062: 6414, 7063: 6415, 7064: 6416, 7065: 6418, 7066: 6421, 7067: 6423, 7068: 6426, 7069: 6429, 7070: 6431, 7071: 6432, 7072: 6434, 7073: 6422, 7074: 6424, 7075: 6427, 7076: 6435, 7077: 6436, 7078: 6437, 7079: 6438, 7080: 6439, 7081: 6440, 7082: 6441, 7083: 6442, 7084: 6420, 7085: 6430, 7086: 6402, 7087: 6433, 7088: 2505, 7089: 2544, 7090: 2622, 7091: 2665, 7092: 2704, 7093: 2741, 7094: 2779, 7095: 2816, 7096: 2853, 7097: 2889, 7098: 6393, 7099: 6425, 7100: 6428, 7101: 6417, 7102: 6401, 7103: 6419, 7104: 6885, 7105: 6886, 7106: 6887, 7107: 6888, 7108: 6889, 7109: 6890, 7110: 6891, 7111: 6892, 7112: 6893, 7113: 6894, 7114: 6895, 7115: 6896, 7116: 6897, 7117: 6898, 7118: 6899, 7119: 6900, 7120: 6901, 7121: 6902, 7122: 6903, 7123: 6904, 7124: 6905, 7125: 6906, 7126: 6907, 7127: 6908, 7128: 6909, 7129: 6910, 7130: 6911, 7131: 6912, 7132: 6913, 7133: 6914, 7134: 6915, 7135: 6916, 7136: 6917, 7137: 6918, 7138: 6919, 7139: 6920, 7140: 6921, 7141: 6922, 7142: 501, 7143: 6923, 7144: 6924, 7145: 6925, 7146: 6926, 7147: 6927, 7148: 6928, 7149: 6929, 7150: 6930, 7151: 6931, 7152: 6932, 7153: 6933, 7154: 6934, 7155: 6935, 7156: 9749, 7157: 9750, 7158: 9751, 7159: 9752, 7160: 9753, 7161: 9754, 7162: 9755, 7163: 9756, 7164: 949, 7165: 950, 7166: 951, 7167: 952, 7168: 6670, 7169: 6671, 7170: 6672, 7171: 6673, 7172: 6674, 7173: 6675, 7174: 6676, 7175: 6677, 7176: 6678, 7177: 6679, 7178: 6683, 7179: 6684, 7180: 6685, 7181: 6686, 7182: 6687, 7183: 6688, 7184: 6689, 7185: 6690, 7186: 6691, 7187: 6692, 7188: 6693, 7189: 6694, 7190: 6695, 7191: 6696, 7192: 6697, 7193: 6698, 7194: 6699, 7195: 6701, 7196: 6703, 7197: 6704, 7198: 6705, 7199: 6706, 7200: 6707, 7201: 6708, 7202: 6709, 7203: 6710, 7204: 6700, 7205: 6702, 7206: 6712, 7207: 6713, 7208: 6714, 7209: 6715, 7210: 6716, 7211: 6717, 7212: 6718, 7213: 6719, 7214: 6720, 7215: 6721, 7216: 6722, 7217: 6723, 7218: 6724, 7219: 6725, 7220: 6726, 7221: 6727, 7222: 6711, 7223: 502, 7224: 9757, 7225: 9758, 7226: 9759, 7227: 720, 7228: 721, 7229: 921, 7230: 922, 7231: 923, 7232: 2499, 7233: 2538, 7234: 2616, 7235: 2659, 7236: 2698, 7237: 2735, 7238: 2773, 7239: 2810, 7240: 2847, 7241: 2883, 7242: 9760, 7243: 9761, 7244: 9762, 7245: 6680, 7246: 6681, 7247: 6682, 7248: 2507, 7249: 2546, 7250: 2624, 7251: 2667, 7252: 2706, 7253: 2743, 7254: 2781, 7255: 2818, 7256: 2855, 7257: 2891, 7258: 7525, 7259: 7526, 7260: 7527, 7261: 7528, 7262: 7529, 7263: 7530, 7264: 7531, 7265: 7532, 7266: 7533, 7267: 7534, 7268: 7535, 7269: 7536, 7270: 7537, 7271: 7538, 7272: 7539, 7273: 7540, 7274: 7541, 7275: 7542, 7276: 7543, 7277: 7544, 7278: 7545, 7279: 7546, 7280: 7547, 7281: 7548, 7282: 7549, 7283: 7550, 7284: 7551, 7285: 7552, 7286: 7553, 7287: 7554, 7288: 7555, 7289: 7556, 7290: 7557, 7291: 7558, 7292: 7559, 7293: 7560, 7294: 734, 7295: 735, 7296: 9763, 7297: 9764, 7298: 9765, 7299: 9766, 7300: 9767, 7301: 9768, 7302: 9769, 7303: 9770, 7304: 9771, 7305: 9772, 7306: 9773, 7307: 9774, 7308: 9775, 7309: 9776, 7310: 9777, 7311: 9778, 7312: 9779, 7313: 9780, 7314: 9781, 7315: 9782, 7316: 9783, 7317: 9784, 7318: 9785, 7319: 9786, 7320: 9787, 7321: 9788, 7322: 9789, 7323: 9790, 7324: 9791, 7325: 9792, 7326: 9793, 7327: 9794, 7328: 9795, 7329: 9796, 7330: 9797, 7331: 9798, 7332: 9799, 7333: 9800, 7334: 9801, 7335: 9802, 7336: 9803, 7337: 9804, 7338: 9805, 7339: 9806, 7340: 9807, 7341: 9808, 7342: 9809, 7343: 9810, 7344: 9811, 7345: 9812, 7346: 9813, 7347: 9814, 7348: 9815, 7349: 9816, 7350: 9817, 7351: 9818, 7352: 9819, 7353: 9820, 7354: 9821, 7355: 9822, 7356: 9823, 7357: 9824, 7358: 9825, 7359: 9826, 7360: 941, 7361: 942, 7362: 943, 7363: 944, 7364: 945, 7365: 946, 7366: 947, 7367: 948, 7368: 9827, 7369: 9828, 7370: 9829, 7371: 9830, 7372: 9831, 7373: 9832, 7374: 9833, 7375: 9834, 7376: 197, 7377: 198, 7378: 199, 7379: 200, 7380: 201, 7381: 202, 7382: 203, 7383: 204, 7384: 205, 7385: 206, 7386: 207, 7387: 208, 7388: 209, 7389: 210, 7390: 211, 7391: 212, 7392: 213, 7393: 214, 7394: 215, 7395: 216, 7396: 217, 7397: 218, 7398: 219, 7399: 220, 7400: 221, 7401: 5738, 7402: 5739, 7403: 5740, 7404: 5741, 7405: 528, 7406: 5742, 7407: 5743, 7408: 5744, 7409: 5745, 7410: 543, 7411: 544, 7412: 222, 7413: 5746, 7414: 5747, 7415: 9835, 7416: 9836, 7417: 9837, 7418: 9838, 7419: 9839, 7420: 9840, 7421: 9841, 7422: 9842, 7423: 9843, 7424: 2976, 7425: 2979, 7426: 2980, 7427: 3006, 7428: 3038, 7429: 3087, 7430: 3088, 7431: 3161, 7432: 3183, 7433: 3340, 7434: 3363, 7435: 3390, 7436: 3435, 7437: 3465, 7438: 3506, 7439: 3604, 7440: 3612, 7441: 3605, 7442: 3613, 7443: 3608, 7444: 3607, 7445: 3626, 7446: 3615, 7447: 3617, 7448: 3639, 7449: 3692, 7450: 3698, 7451: 3788, 7452: 3869, 7453: 3871, 7454: 3873, 7455: 3887, 7456: 3913, 7457: 3942, 7458: 4016, 7459: 4033, 7460: 4063, 7461: 4064, 7462: 4138, 7463: 4269, 7464: 4302, 7465: 4316, 7466: 4376, 7467: 4552, 7468: 2901, 7469: 2968, 7470: 2995, 7471: 3005, 7472: 3057, 7473: 3110, 7474: 3167, 7475: 3212, 7476: 3255, 7477: 3295, 7478: 3358, 7479: 3379, 7480: 3406, 7481: 3458, 7482: 3479, 7483: 3505, 7484: 3529, 7485: 3625, 7486: 3634, 7487: 3668, 7488: 3765, 7489: 3808, 7490: 3928, 7491: 2899, 7492: 2983, 7493: 2985, 7494: 2981, 7495: 2994, 7496: 3056, 7497: 3108, 7498: 3170, 7499: 3176, 7500: 3184, 7501: 3211, 7502: 3341, 7503: 3377, 7504: 3456, 7505: 3519, 7506: 3527, 7507: 3611, 7508: 3616, 7509: 3618, 7510: 3632, 7511: 3763, 7512: 3806, 7513: 3872, 7514: 3886, 7515: 3901, 7516: 4065, 7517: 4130, 7518: 4136, 7519: 4141, 7520: 4368, 7521: 4372, 7522: 3294, 7523: 3667, 7524: 3807, 7525: 3902, 7526: 4131, 7527: 4137, 7528: 4312, 7529: 4369, 7530: 4373, 7531: 3874, 7532: 3007, 7533: 3089, 7534: 3199, 7535: 3467, 7536: 3507, 7537: 3641, 7538: 3695, 7539: 3706, 7540: 3743, 7541: 3792, 7542: 4019, 7543: 3238, 7544: 4571, 7545: 3227, 7546: 3783, 7547: 3345, 7548: 3351, 7549: 3640, 7550: 3878, 7551: 3893, 7552: 3008, 7553: 3090, 7554: 3200, 7555: 3234, 7556: 3391, 7557: 3440, 7558: 3468, 7559: 3513, 7560: 3642, 7561: 3700, 7562: 3744, 7563: 3753, 7564: 3914, 7565: 3961, 7566: 4020, 7567: 2978, 7568: 2986, 7569: 3095, 7570: 3164, 7571: 3177, 7572: 3182, 7573: 3172, 7574: 3347, 7575: 3614, 7576: 3756, 7577: 3879, 7578: 4036, 7579: 2988, 7580: 3022, 7581: 3044, 7582: 3075, 7583: 3181, 7584: 3194, 7585: 3369, 7586: 3229, 7587: 3881, 7588: 3344, 7589: 3350, 7590: 3339, 7591: 3346, 7592: 3367, 7593: 3443, 7594: 3441, 7595: 3434, 7596: 3470, 7597: 3889, 7598: 3510, 7599: 3515, 7600: 3504, 7601: 3621, 7602: 3646, 7603: 3746, 7604: 3752, 7605: 3794, 7606: 3877, 7607: 3892, 7608: 3870, 7609: 3917, 7610: 3922, 7611: 4002, 7612: 4024, 7613: 4026, 7614: 4030, 7615: 4223, 7616: 284, 7617: 285, 7618: 337, 7619: 286, 7620: 287, 7621: 288, 7622: 289, 7623: 290, 7624: 291, 7625: 292, 7626: 3659, 7627: 293, 7628: 294, 7629: 295, 7630: 296, 7631: 338, 7632: 339, 7633: 297, 7634: 4043, 7635: 2961, 7636: 2966, 7637: 2973, 7638: 2974, 7639: 3032, 7640: 3076, 7641: 3073, 7642: 3206, 7643: 3231, 7644: 3372, 7645: 3396, 7646: 3433, 7647: 3466, 7648: 3472, 7649: 3503, 7650: 3689, 7651: 3691, 7652: 3711, 7653: 3738, 7654: 3996, 7655: 9844, 7656: 9845, 7657: 9846, 7658: 9847, 7659: 9848, 7660: 9849, 7661: 9850, 7662: 9851, 7663: 9852, 7664: 9853, 7665: 9854, 7666: 9855, 7667: 9856, 7668: 9857, 7669: 9858, 7670: 9859, 7671: 9860, 7672: 9861, 7673: 9862, 7674: 9863, 7675: 9864, 7676: 340, 7677: 341, 7678: 298, 7679: 342, 7680: 2960, 7681: 2959, 7682: 2997, 7683: 2996, 7684: 2999, 7685: 2998, 7686: 3001, 7687: 3000, 7688: 3035, 7689: 3034, 7690: 3061, 7691: 3060, 7692: 3065, 7693: 3064, 7694: 3069, 7695: 3068, 7696: 3063, 7697: 3062, 7698: 3067, 7699: 3066, 7700: 3146, 7701: 3145, 7702: 3144, 7703: 3143, 7704: 3158, 7705: 3157, 7706: 3160, 7707: 3159, 7708: 3138, 7709: 3137, 7710: 3196, 7711: 3195, 7712: 3226, 7713: 3225, 7714: 3263, 7715: 3262, 7716: 3267, 7717: 3266, 7718: 3261, 7719: 3260, 7720: 3265, 7721: 3264, 7722: 3269, 7723: 3268, 7724: 3326, 7725: 3325, 7726: 3309, 7727: 3308, 7728: 3381, 7729: 3380, 7730: 3387, 7731: 3386, 7732: 3389, 7733: 3388, 7734: 3414, 7735: 3413, 7736: 3416, 7737: 3415, 7738: 3420, 7739: 3419, 7740: 3418, 7741: 3417, 7742: 3460, 7743: 3459, 7744: 3462, 7745: 3461, 7746: 3464, 7747: 3463, 7748: 3489, 7749: 3488, 7750: 3493, 7751: 3492, 7752: 3497, 7753: 3496, 7754: 3495, 7755: 3494, 7756: 3557, 7757: 3556, 7758: 3559, 7759: 3558, 7760: 3579, 7761: 3578, 7762: 3577, 7763: 3576, 7764: 3636, 7765: 3635, 7766: 3638, 7767: 3637, 7768: 3674, 7769: 3673, 7770: 3682, 7771: 3681, 7772: 3684, 7773: 3683, 7774: 3686, 7775: 3685, 7776: 3728, 7777: 3727, 7778: 3732, 7779: 3731, 7780: 3720, 7781: 3719, 7782: 3726, 7783: 3725, 7784: 3734, 7785: 3733, 7786: 3770, 7787: 3769, 7788: 3774, 7789: 3773, 7790: 3780, 7791: 3779, 7792: 3778, 7793: 3777, 7794: 3864, 7795: 3863, 7796: 3868, 7797: 3867, 7798: 3866, 7799: 3865, 7800: 3836, 7801: 3835, 7802: 3842, 7803: 3841, 7804: 3904, 7805: 3903, 7806: 3906, 7807: 3905, 7808: 3932, 7809: 3931, 7810: 3930, 7811: 3929, 7812: 3937, 7813: 3936, 7814: 3939, 7815: 3938, 7816: 3941, 7817: 3940, 7818: 3956, 7819: 3955, 7820: 3954, 7821: 3953, 7822: 3979, 7823: 3978, 7824: 4006, 7825: 4005, 7826: 4012, 7827: 4011, 7828: 4014, 7829: 4013, 7830: 3270, 7831: 3768, 7832: 3935, 7833: 3973, 7834: 2975, 7835: 3739, 7836: 3748, 7837: 3749, 7838: 3742, 7839: 3099, 7840: 2954, 7841: 2953, 7842: 2948, 7843: 2947, 7844: 2919, 7845: 2918, 7846: 2921, 7847: 2920, 7848: 2925, 7849: 2924, 7850: 2923, 7851: 2922, 7852: 2958, 7853: 2957, 7854: 2909, 7855: 2908, 7856: 2911, 7857: 2910, 7858: 2915, 7859: 2914, 7860: 2913, 7861: 2912, 7862: 2956, 7863: 2955, 7864: 3154, 7865: 3153, 7866: 3148, 7867: 3147, 7868: 3132, 7869: 3131, 7870: 3120, 7871: 3119, 7872: 3122, 7873: 3121, 7874: 3126, 7875: 3125, 7876: 3124, 7877: 3123, 7878: 3156, 7879: 3155, 7880: 3318, 7881: 3317, 7882: 3324, 7883: 3323, 7884: 3599, 7885: 3598, 7886: 3581, 7887: 3580, 7888: 3539, 7889: 3538, 7890: 3541, 7891: 3540, 7892: 3545, 7893: 3544, 7894: 3543, 7895: 3542, 7896: 3601, 7897: 3600, 7898: 3589, 7899: 3588, 7900: 3591, 7901: 3590, 7902: 3595, 7903: 3594, 7904: 3593, 7905: 3592, 7906: 3597, 7907: 3596, 7908: 3862, 7909: 3861, 7910: 3844, 7911: 3843, 7912: 3852, 7913: 3851, 7914: 3854, 7915: 3853, 7916: 3858, 7917: 3857, 7918: 3856, 7919: 3855, 7920: 3860, 7921: 3859, 7922: 3970, 7923: 3969, 7924: 3985, 7925: 3984, 7926: 3983, 7927: 3982, 7928: 3977, 7929: 3976, 7930: 3429, 7931: 3428, 7932: 3919, 7933: 3918, 7934: 3992, 7935: 3991, 7936: 4079, 7937: 4095, 7938: 4085, 7939: 4101, 7940: 4081, 7941: 4097, 7942: 4089, 7943: 4105, 7944: 4080, 7945: 4096, 7946: 4086, 7947: 4102, 7948: 4082, 7949: 4098, 7950: 4090, 7951: 4106, 7952: 4145, 7953: 4151, 7954: 4149, 7955: 4155, 7956: 4147, 7957: 4153, 7958: 9865, 7959: 9866, 7960: 4146, 7961: 4152, 7962: 4150, 7963: 4156, 7964: 4148, 7965: 4154, 7966: 9867, 7967: 9868, 7968: 4175, 7969: 4191, 7970: 4181, 7971: 4197, 7972: 4177, 7973: 4193, 7974: 4185, 7975: 4201, 7976: 4176, 7977: 4192, 7978: 4182, 7979: 4198, 7980: 4178, 7981: 4194, 7982: 4186, 7983: 4202, 7984: 4228, 7985: 4236, 7986: 4232, 7987: 4240, 7988: 4230, 7989: 4238, 7990: 4234, 7991: 4242, 7992: 4229, 7993: 4237, 7994: 4233, 7995: 4241, 7996: 4231, 7997: 4239, 7998: 4235, 7999: 4243, 8000: 4279, 8001: 4285, 8002: 4283, 8003: 4289, 8004: 4281, 8005: 4287, 8006: 9869, 8007: 9870, 8008: 4280, 8009: 4286, 8010: 4284, 8011: 4290, 8012: 4282, 8013: 4288, 8014: 9871, 8015: 9872, 8016: 4334, 8017: 4338, 8018: 4336, 8019: 4342, 8020: 4335, 8021: 4340, 8022: 4337, 8023: 4344, 8024: 9873, 8025: 4339, 8026: 9874, 8027: 4343, 8028: 9875, 8029: 4341, 8030: 9876, 8031: 4345, 8032: 4380, 8033: 4396, 8034: 4386, 8035: 4402, 8036: 4382, 8037: 4398, 8038: 4390, 8039: 4406, 8040: 4381, 8041: 4397, 8042: 4387, 8043: 4403, 8044: 4383, 8045: 4399, 8046: 4391, 8047: 4407, 8048: 4116, 8049: 4112, 8050: 4161, 8051: 4158, 8052: 4212, 8053: 4208, 8054: 4248, 8055: 4245, 8056: 4295, 8057: 4292, 8058: 4351, 8059: 4347, 8060: 4417, 8061: 4413, 8062: 9877, 8063: 9878, 8064: 4093, 8065: 4109, 8066: 4087, 8067: 4103, 8068: 4083, 8069: 4099, 8070: 4091, 8071: 4107, 8072: 4094, 8073: 4110, 8074: 4088, 8075: 4104, 8076: 4084, 8077: 4100, 8078: 4092, 8079: 4108, 8080: 4189, 8081: 4205, 8082: 4183, 8083: 4199, 8084: 4179, 8085: 4195, 8086: 4187, 8087: 4203, 8088: 4190, 8089: 4206, 8090: 4184, 8091: 4200, 8092: 4180, 8093: 4196, 8094: 4188, 8095: 4204, 8096: 4394, 8097: 4410, 8098: 4388, 8099: 4404, 8100: 4384, 8101: 4400, 8102: 4392, 8103: 4408, 8104: 4395, 8105: 4411, 8106: 4389, 8107: 4405, 8108: 4385, 8109: 4401, 8110: 4393, 8111: 4409, 8112: 4119, 8113: 4123, 8114: 4118, 8115: 4125, 8116: 4115, 8117: 9879, 8118: 4121, 8119: 4122, 8120: 4120, 8121: 4124, 8122: 4117, 8123: 4114, 8124: 4126, 8125: 972, 8126: 4225, 8127: 973, 8128: 981, 8129: 967, 8130: 4214, 8131: 4217, 8132: 4211, 8133: 9880, 8134: 4215, 8135: 4216, 8136: 4162, 8137: 4160, 8138: 4213, 8139: 4210, 8140: 4218, 8141: 975, 8142: 974, 8143: 976, 8144: 4250, 8145: 4259, 8146: 4257, 8147: 4256, 8148: 9881, 8149: 9882, 8150: 4252, 8151: 4258, 8152: 4251, 8153: 4260, 8154: 4249, 8155: 4247, 8156: 9883, 8157: 979, 8158: 978, 8159: 980, 8160: 4353, 8161: 4363, 8162: 4361, 8163: 4360, 8164: 4313, 8165: 4314, 8166: 4355, 8167: 4362, 8168: 4354, 8169: 4364, 8170: 4352, 8171: 4349, 8172: 4315, 8173: 966, 8174: 965, 8175: 954, 8176: 9884, 8177: 9885, 8178: 4419, 8179: 4422, 8180: 4416, 8181: 9886, 8182: 4420, 8183: 4421, 8184: 4296, 8185: 4294, 8186: 4418, 8187: 4415, 8188: 4423, 8189: 957, 8190: 977, 8191: 9887, 8192: 606, 8193: 607, 8194: 608, 8195: 609, 8196: 610, 8197: 611, 8198: 612, 8199: 618, 8200: 613, 8201: 614, 8202: 615, 8203: 64, 8204: 65, 8205: 66, 8206: 67, 8207: 68, 8208: 629, 8209: 630, 8210: 631, 8211: 632, 8212: 633, 8213: 634, 8214: 834, 8215: 622, 8216: 755, 8217: 756, 8218: 757, 8219: 758, 8220: 762, 8221: 763, 8222: 764, 8223: 765, 8224: 854, 8225: 855, 8226: 856, 8227: 857, 8228: 704, 8229: 705, 8230: 706, 8231: 858, 8232: 602, 8233: 603, 8234: 69, 8235: 70, 8236: 71, 8237: 72, 8238: 73, 8239: 619, 8240: 850, 8241: 852, 8242: 862, 8243: 863, 8244: 864, 8245: 866, 8246: 867, 8247: 868, 8248: 869, 8249: 759, 8250: 760, 8251: 870, 8252: 687, 8253: 702, 8254: 620, 8255: 871, 8256: 873, 8257: 875, 8258: 876, 8259: 859, 8260: 1334, 8261: 830, 8262: 831, 8263: 695, 8264: 694, 8265: 688, 8266: 846, 8267: 837, 8268: 860, 8269: 861, 8270: 840, 8271: 648, 8272: 874, 8273: 841, 8274: 1330, 8275: 635, 8276: 872, 8277: 745, 8278: 746, 8279: 865, 8280: 747, 8281: 748, 8282: 749, 8283: 750, 8284: 751, 8285: 752, 8286: 753, 8287: 616, 8288: 74, 8289: 223, 8290: 224, 8291: 225, 8292: 226, 8293: 9888, 8294: 9889, 8295: 9890, 8296: 9891, 8297: 9892, 8298: 75, 8299: 76, 8300: 77, 8301: 78, 8302: 79, 8303: 80, 8304: 2476, 8305: 3293, 8306: 9893, 8307: 9894, 8308: 2675, 8309: 2712, 8310: 2750, 8311: 2787, 8312: 2824, 8313: 2860, 8314: 1310, 8315: 1328, 8316: 1318, 8317: 769, 8318: 818, 8319: 3477, 8320: 2477, 8321: 2513, 8322: 2592, 8323: 2635, 8324: 2676, 8325: 2713, 8326: 2751, 8327: 2788, 8328: 2825, 8329: 2861, 8330: 1311, 8331: 1329, 8332: 1319, 8333: 770, 8334: 819, 8335: 9895, 8336: 2900, 8337: 3109, 8338: 3528, 8339: 3952, 8340: 3171, 8341: 3254, 8342: 3378, 8343: 3405, 8344: 3457, 8345: 3478, 8346: 3633, 8347: 3716, 8348: 3764, 8349: 9896, 8350: 9897, 8351: 9898, 8352: 2447, 8353: 2448, 8354: 2449, 8355: 2450, 8356: 2451, 8357: 2452, 8358: 2453, 8359: 2454, 8360: 3687, 8361: 2455, 8362: 2456, 8363: 2457, 8364: 2458, 8365: 2459, 8366: 2460, 8367: 2461, 8368: 2462, 8369: 2463, 8370: 2464, 8371: 2465, 8372: 2466, 8373: 2467, 8374: 2468, 8375: 2469, 8376: 2470, 8377: 2471, 8378: 2472, 8379: 9899, 8380: 9900, 8381: 9901, 8382: 9902, 8383: 9903, 8384: 9904, 8385: 9905, 8386: 9906, 8387: 9907, 8388: 9908, 8389: 9909, 8390: 9910, 8391: 9911, 8392: 9912, 8393: 9913, 8394: 9914, 8395: 9915, 8396: 9916, 8397: 9917, 8398: 9918, 8399: 9919, 8400: 580, 8401: 581, 8402: 582, 8403: 583, 8404: 584, 8405: 585, 8406: 586, 8407: 587, 8408: 349, 8409: 350, 8410: 351, 8411: 588, 8412: 589, 8413: 355, 8414: 356, 8415: 357, 8416: 358, 8417: 590, 8418: 359, 8419: 360, 8420: 361, 8421: 352, 8422: 591, 8423: 592, 8424: 593, 8425: 594, 8426: 353, 8427: 354, 8428: 343, 8429: 344, 8430: 345, 8431: 346, 8432: 299, 8433: 9920, 8434: 9921, 8435: 9922, 8436: 9923, 8437: 9924, 8438: 9925, 8439: 9926, 8440: 9927, 8441: 9928, 8442: 9929, 8443: 9930, 8444: 9931, 8445: 9932, 8446: 9933, 8447: 9934, 8448: 2962, 8449: 2963, 8450: 3019, 8451: 1045, 8452: 1157, 8453: 3036, 8454: 3037, 8455: 3175, 8456: 1158, 8457: 1046, 8458: 3207, 8459: 3249, 8460: 3250, 8461: 3251, 8462: 3246, 8463: 3272, 8464: 3290, 8465: 3291, 8466: 3402, 8467: 3398, 8468: 1159, 8469: 3475, 8470: 3501, 8471: 1160, 8472: 1161, 8473: 3630, 8474: 3650, 8475: 3662, 8476: 3663, 8477: 3664, 8478: 1162, 8479: 1163, 8480: 3740, 8481: 3782, 8482: 3784, 8483: 1164, 8484: 3999, 8485: 1165, 8486: 4379, 8487: 1166, 8488: 4000, 8489: 1167, 8490: 3375, 8491: 2930, 8492: 2992, 8493: 3020, 8494: 1168, 8495: 3102, 8496: 3106, 8497: 3192, 8498: 3204, 8499: 3454, 8500: 3522, 8501: 4900, 8502: 4902, 8503: 4904, 8504: 4906, 8505: 3285, 8506: 1169, 8507: 3197, 8508: 4299, 8509: 4133, 8510: 4135, 8511: 4301, 8512: 1308, 8513: 1170, 8514: 1171, 8515: 1172, 8516: 1173, 8517: 3054, 8518: 3050, 8519: 3103, 8520: 3286, 8521: 3353, 8522: 1174, 8523: 1509, 8524: 1175, 8525: 2964, 8526: 3203, 8527: 1176, 8528: 2555, 8529: 2557, 8530: 2549, 8531: 2551, 8532: 2626, 8533: 2553, 8534: 2627, 8535: 2670, 8536: 2708, 8537: 2554, 8538: 2745, 8539: 2556, 8540: 2671, 8541: 2746, 8542: 2820, 8543: 2548, 8544: 3289, 8545: 3328, 8546: 3330, 8547: 3334, 8548: 3899, 8549: 3908, 8550: 3910, 8551: 3912, 8552: 3336, 8553: 3949, 8554: 3958, 8555: 3960, 8556: 3401, 8557: 3018, 8558: 3053, 8559: 3453, 8560: 3284, 8561: 3327, 8562: 3329, 8563: 3333, 8564: 3896, 8565: 3907, 8566: 3909, 8567: 3911, 8568: 3335, 8569: 3946, 8570: 3957, 8571: 3959, 8572: 3397, 8573: 3015, 8574: 3049, 8575: 3450, 8576: 2420, 8577: 2421, 8578: 2422, 8579: 3046, 8580: 3045, 8581: 2782, 8582: 2423, 8583: 2424, 8584: 2425, 8585: 2508, 8586: 9935, 8587: 9936, 8588: 9937, 8589: 9938, 8590: 9939, 8591: 9940, 8592: 1177, 8593: 1181, 8594: 1179, 8595: 1182, 8596: 1183, 8597: 1185, 8598: 1186, 8599: 1187, 8600: 1188, 8601: 1189, 8602: 1178, 8603: 1180, 8604: 1190, 8605: 1191, 8606: 1192, 8607: 1193, 8608: 1194, 8609: 1195, 8610: 1196, 8611: 1197, 8612: 1198, 8613: 1199, 8614: 1200, 8615: 1201, 8616: 1202, 8617: 1203, 8618: 1204, 8619: 1205, 8620: 1206, 8621: 1207, 8622: 1184, 8623: 1208, 8624: 1209, 8625: 1210, 8626: 1211, 8627: 1212, 8628: 1213, 8629: 1214, 8630: 1215, 8631: 1216, 8632: 1217, 8633: 1218, 8634: 1219, 8635: 1220, 8636: 1221, 8637: 1222, 8638: 1223, 8639: 1224, 8640: 1225, 8641: 1226, 8642: 1227, 8643: 1228, 8644: 1229, 8645: 1230, 8646: 1231, 8647: 1232, 8648: 1233, 8649: 1234, 8650: 1235, 8651: 1236, 8652: 1237, 8653: 1239, 8654: 1245, 8655: 1242, 8656: 1238, 8657: 1240, 8658: 1241, 8659: 1243, 8660: 1244, 8661: 1246, 8662: 1247, 8663: 1248, 8664: 1249, 8665: 1250, 8666: 1251, 8667: 1252, 8668: 1253, 8669: 1254, 8670: 1255, 8671: 1256, 8672: 1257, 8673: 1258, 8674: 1259, 8675: 1260, 8676: 1261, 8677: 1262, 8678: 1263, 8679: 1264, 8680: 1265, 8681: 1266, 8682: 1267, 8683: 1268, 8684: 1269, 8685: 1270, 8686: 1271, 8687: 1272, 8688: 1273, 8689: 1274, 8690: 1275, 8691: 1276, 8692: 1277, 8693: 1278, 8694: 1279, 8695: 1280, 8696: 1281, 8697: 1282, 8698: 1283, 8699: 1284, 8700: 1285, 8701: 1286, 8702: 1287, 8703: 1288, 8704: 1289, 8705: 1290, 8706: 1291, 8707: 1292, 8708: 1293, 8709: 1294, 8710: 1295, 8711: 1296, 8712: 1297, 8713: 1298, 8714: 1299, 8715: 1300, 8716: 1301, 8717: 1302, 8718: 1304, 8719: 1305, 8720: 1306, 8721: 1307, 8722: 1327, 8723: 1331, 8724: 1332, 8725: 1333, 8726: 1335, 8727: 1336, 8728: 1337, 8729: 1338, 8730: 1339, 8731: 1340, 8732: 1342, 8733: 1344, 8734: 1345, 8735: 1346, 8736: 1347, 8737: 1348, 8738: 1349, 8739: 1350, 8740: 1351, 8741: 1352, 8742: 1353, 8743: 1354, 8744: 1355, 8745: 1356, 8746: 1357, 8747: 1358, 8748: 1359, 8749: 1360, 8750: 1361, 8751: 1362, 8752: 1363, 8753: 1364, 8754: 1365, 8755: 1366, 8756: 1367, 8757: 1368, 8758: 1369, 8759: 1370, 8760: 1371, 8761: 1372, 8762: 1373, 8763: 1374, 8764: 1375, 8765: 1377, 8766: 1378, 8767: 1379, 8768: 1380, 8769: 1376, 8770: 1381, 8771: 1382, 8772: 1383, 8773: 1384, 8774: 1386, 8775: 1385, 8776: 1387, 8777: 1388, 8778: 1389, 8779: 1390, 8780: 1391, 8781: 1392, 8782: 1394, 8783: 1395, 8784: 1396, 8785: 1397, 8786: 1398, 8787: 1399, 8788: 1400, 8789: 1401, 8790: 1402, 8791: 1403, 8792: 1404, 8793: 1405, 8794: 1406, 8795: 1407, 8796: 1408, 8797: 1409, 8798: 1410, 8799: 1411, 8800: 1320, 8801: 1412, 8802: 1413, 8803: 1414, 8804: 1415, 8805: 1417, 8806: 1419, 8807: 1420, 8808: 1421, 8809: 1422, 8810: 1423, 8811: 1424, 8812: 1425, 8813: 1393, 8814: 1316, 8815: 1322, 8816: 1416, 8817: 1418, 8818: 1426, 8819: 1428, 8820: 1427, 8821: 1429, 8822: 1430, 8823: 1432, 8824: 1431, 8825: 1433, 8826: 1434, 8827: 1436, 8828: 1438, 8829: 1440, 8830: 1442, 8831: 1443, 8832: 1435, 8833: 1437, 8834: 1444, 8835: 1446, 8836: 1445, 8837: 1447, 8838: 1448, 8839: 1450, 8840: 1449, 8841: 1451, 8842: 1452, 8843: 1453, 8844: 1454, 8845: 1455, 8846: 1456, 8847: 1457, 8848: 1458, 8849: 1459, 8850: 1461, 8851: 1463, 8852: 1464, 8853: 1465, 8854: 1466, 8855: 1467, 8856: 1468, 8857: 1469, 8858: 1470, 8859: 1471, 8860: 1472, 8861: 1473, 8862: 1474, 8863: 1475, 8864: 1476, 8865: 1477, 8866: 1478, 8867: 1480, 8868: 1481, 8869: 1482, 8870: 1483, 8871: 1484, 8872: 1485, 8873: 1487, 8874: 1489, 8875: 1490, 8876: 1479, 8877: 1486, 8878: 1488, 8879: 1491, 8880: 1492, 8881: 1493, 8882: 1494, 8883: 1496, 8884: 1498, 8885: 1500, 8886: 1502, 8887: 1503, 8888: 1504, 8889: 1505, 8890: 1506, 8891: 1507, 8892: 1508, 8893: 1510, 8894: 1511, 8895: 1512, 8896: 1513, 8897: 1514, 8898: 1515, 8899: 1516, 8900: 1517, 8901: 1518, 8902: 1519, 8903: 1520, 8904: 1521, 8905: 1522, 8906: 1523, 8907: 1524, 8908: 1525, 8909: 1526, 8910: 1527, 8911: 1528, 8912: 1529, 8913: 1530, 8914: 1531, 8915: 1532, 8916: 1533, 8917: 1534, 8918: 1535, 8919: 1536, 8920: 1537, 8921: 1538, 8922: 1539, 8923: 1540, 8924: 1541, 8925: 1542, 8926: 1543, 8927: 1544, 8928: 1439, 8929: 1441, 8930: 1460, 8931: 1462, 8932: 1545, 8933: 1546, 8934: 1547, 8935: 1548, 8936: 1549, 8937: 1550, 8938: 1495, 8939: 1497, 8940: 1499, 8941: 1501, 8942: 1551, 8943: 1552, 8944: 1553, 8945: 1554, 8946: 1555, 8947: 1556, 8948: 1557, 8949: 1558, 8950: 1559, 8951: 1560, 8952: 1561, 8953: 1562, 8954: 1563, 8955: 1564, 8956: 1565, 8957: 1566, 8958: 1567, 8959: 1568, 8960: 1569, 8961: 1570, 8962: 1571, 8963: 1572, 8964: 1573, 8965: 1574, 8966: 1575, 8967: 1576, 8968: 1577, 8969: 1578, 8970: 1579, 8971: 1580, 8972: 1581, 8973: 1582, 8974: 1583, 8975: 1584, 8976: 1585, 8977: 1586, 8978: 1587, 8979: 1588, 8980: 1589, 8981: 1590, 8982: 1591, 8983: 1592, 8984: 1593, 8985: 1594, 8986: 1595, 8987: 1596, 8988: 1597, 8989: 1598, 8990: 1599, 8991: 1600, 8992: 1601, 8993: 1602, 8994: 1603, 8995: 1604, 8996: 1605, 8997: 1606, 8998: 1607, 8999: 1608, 9000: 1609, 9001: 832, 9002: 833, 9003: 1610, 9004: 1611, 9005: 1612, 9006: 1613, 9007: 1614, 9008: 1615, 9009: 1616, 9010: 1617, 9011: 1618, 9012: 1619, 9013: 1620, 9014: 1621, 9015: 1622, 9016: 1623, 9017: 1624, 9018: 1625, 9019: 1626, 9020: 1627, 9021: 1628, 9022: 1629, 9023: 1630, 9024: 1631, 9025: 1632, 9026: 1633, 9027: 1634, 9028: 1635, 9029: 1636, 9030: 1637, 9031: 1638, 9032: 1639, 9033: 1640, 9034: 1641, 9035: 1642, 9036: 1643, 9037: 1644, 9038: 1645, 9039: 1646, 9040: 1647, 9041: 1648, 9042: 1649, 9043: 1650, 9044: 1651, 9045: 1652, 9046: 1653, 9047: 1654, 9048: 1655, 9049: 1656, 9050: 1657, 9051: 1658, 9052: 1659, 9053: 1660, 9054: 1661, 9055: 1662, 9056: 1663, 9057: 1664, 9058: 1665, 9059: 1666, 9060: 1667, 9061: 1668, 9062: 1669, 9063: 1670, 9064: 1671, 9065: 1672, 9066: 1673, 9067: 1674, 9068: 1675, 9069: 1676, 9070: 1677, 9071: 1678, 9072: 1679, 9073: 1680, 9074: 1681, 9075: 1682, 9076: 1683, 9077: 1684, 9078: 1685, 9079: 1686, 9080: 1687, 9081: 1688, 9082: 1689, 9083: 1690, 9084: 1691, 9085: 1692, 9086: 1693, 9087: 1694, 9088: 1695, 9089: 1696, 9090: 1697, 9091: 1698, 9092: 1699, 9093: 1700, 9094: 1701, 9095: 1702, 9096: 1703, 9097: 1704, 9098: 1705, 9099: 1706, 9100: 1707, 9101: 1708, 9102: 1709, 9103: 1710, 9104: 1711, 9105: 1712, 9106: 1713, 9107: 1714, 9108: 1715, 9109: 1716, 9110: 1717, 9111: 1718, 9112: 1719, 9113: 1720, 9114: 1721, 9115: 1722, 9116: 1723, 9117: 1724, 9118: 1725, 9119: 1726, 9120: 1727, 9121: 1728, 9122: 1729, 9123: 1730, 9124: 1731, 9125: 1732, 9126: 1733, 9127: 1734, 9128: 1735, 9129: 1736, 9130: 1737, 9131: 1738, 9132: 1739, 9133: 1740, 9134: 1741, 9135: 1742, 9136: 1743, 9137: 1744, 9138: 1745, 9139: 1746, 9140: 1747, 9141: 1748, 9142: 1749, 9143: 1750, 9144: 1751, 9145: 1752, 9146: 1753, 9147: 1754, 9148: 1755, 9149: 1756, 9150: 1757, 9151: 1758, 9152: 1759, 9153: 1760, 9154: 1761, 9155: 1762, 9156: 1763, 9157: 1764, 9158: 1765, 9159: 1766, 9160: 1767, 9161: 1768, 9162: 1769, 9163: 1770, 9164: 1771, 9165: 1772, 9166: 1773, 9167: 1774, 9168: 1775, 9169: 1776, 9170: 1777, 9171: 1778, 9172: 1779, 9173: 1780, 9174: 1781, 9175: 1782, 9176: 1783, 9177: 1784, 9178: 1785, 9179: 1786, 9180: 1787, 9181: 1788, 9182: 1789, 9183: 1790, 9184: 1791, 9185: 1792, 9186: 1793, 9187: 1794, 9188: 1795, 9189: 1796, 9190: 1797, 9191: 1798, 9192: 1799, 9193: 1800, 9194: 1801, 9195: 1802, 9196: 1803, 9197: 1804, 9198: 1805, 9199: 1806, 9200: 1807, 9201: 1808, 9202: 1809, 9203: 1810, 9204: 9941, 9205: 9942, 9206: 9943, 9207: 9944, 9208: 9945, 9209: 9946, 9210: 9947, 9211: 9948, 9212: 9949, 9213: 9950, 9214: 9951, 9215: 9952, 9216: 1811, 9217: 1812, 9218: 1813, 9219: 1814, 9220: 1815, 9221: 1816, 9222: 1817, 9223: 1818, 9224: 1819, 9225: 1820, 9226: 1821, 9227: 1822, 9228: 1823, 9229: 1824, 9230: 1825, 9231: 1826, 9232: 1827, 9233: 1828, 9234: 1829, 9235: 1830, 9236: 1831, 9237: 1832, 9238: 1833, 9239: 1834, 9240: 1835, 9241: 1836, 9242: 1837, 9243: 1838, 9244: 1839, 9245: 1840, 9246: 1841, 9247: 1842, 9248: 1843, 9249: 1844, 9250: 1845, 9251: 1846, 9252: 1847, 9253: 1848, 9254: 1849, 9255: 9953, 9256: 9954, 9257: 9955, 9258: 9956, 9259: 9957, 9260: 9958, 9261: 9959, 9262: 9960, 9263: 9961, 9264: 9962, 9265: 9963, 9266: 9964, 9267: 9965, 9268: 9966, 9269: 9967, 9270: 9968, 9271: 9969, 9272: 9970, 9273: 9971, 9274: 9972, 9275: 9973, 9276: 9974, 9277: 9975, 9278: 9976, 9279: 9977, 9280: 1850, 9281: 1851, 9282: 1852, 9283: 1853, 9284: 1854, 9285: 1855, 9286: 1856, 9287: 1857, 9288: 1858, 9289: 1859, 9290: 1860, 9291: 9978, 9292: 9979, 9293: 9980, 9294: 9981, 9295: 9982, 9296: 9983, 9297: 9984, 9298: 9985, 9299: 9986, 9300: 9987, 9301: 9988, 9302: 9989, 9303: 9990, 9304: 9991, 9305: 9992, 9306: 9993, 9307: 9994, 9308: 9995, 9309: 9996, 9310: 9997, 9311: 9998, 9312: 2510, 9313: 2589, 9314: 2632, 9315: 2673, 9316: 2710, 9317: 2748, 9318: 2785, 9319: 2822, 9320: 2858, 9321: 2558, 9322: 2561, 9323: 2564, 9324: 2567, 9325: 2570, 9326: 2573, 9327: 2576, 9328: 2579, 9329: 2582, 9330: 2585, 9331: 2628, 9332: 771, 9333: 782, 9334: 784, 9335: 785, 9336: 786, 9337: 787, 9338: 788, 9339: 789, 9340: 790, 9341: 772, 9342: 773, 9343: 774, 9344: 775, 9345: 776, 9346: 777, 9347: 778, 9348: 779, 9349: 780, 9350: 781, 9351: 783, 9352: 2547, 9353: 2625, 9354: 2668, 9355: 2707, 9356: 2744, 9357: 2783, 9358: 2819, 9359: 2856, 9360: 2892, 9361: 2560, 9362: 2563, 9363: 2566, 9364: 2569, 9365: 2572, 9366: 2575, 9367: 2578, 9368: 2581, 9369: 2584, 9370: 2587, 9371: 2630, 9372: 791, 9373: 792, 9374: 793, 9375: 794, 9376: 795, 9377: 796, 9378: 797, 9379: 798, 9380: 799, 9381: 800, 9382: 801, 9383: 802, 9384: 803, 9385: 804, 9386: 805, 9387: 806, 9388: 807, 9389: 808, 9390: 809, 9391: 810, 9392: 811, 9393: 812, 9394: 813, 9395: 814, 9396: 815, 9397: 816, 9398: 2897, 9399: 2993, 9400: 3021, 9401: 3055, 9402: 3107, 9403: 3193, 9404: 3210, 9405: 3252, 9406: 3292, 9407: 3356, 9408: 3376, 9409: 3403, 9410: 3455, 9411: 3476, 9412: 3525, 9413: 3631, 9414: 3651, 9415: 3665, 9416: 3714, 9417: 3762, 9418: 3805, 9419: 3900, 9420: 3926, 9421: 3950, 9422: 3965, 9423: 4001, 9424: 2895, 9425: 2990, 9426: 3016, 9427: 3051, 9428: 3104, 9429: 3190, 9430: 3208, 9431: 3247, 9432: 3287, 9433: 3354, 9434: 3373, 9435: 3399, 9436: 3451, 9437: 3473, 9438: 3523, 9439: 3628, 9440: 3648, 9441: 3660, 9442: 3712, 9443: 3760, 9444: 3803, 9445: 3897, 9446: 3924, 9447: 3947, 9448: 3963, 9449: 3997, 9450: 2474, 9451: 2562, 9452: 2565, 9453: 2568, 9454: 2571, 9455: 2574, 9456: 2577, 9457: 2580, 9458: 2583, 9459: 2586, 9460: 2629, 9461: 2511, 9462: 2590, 9463: 2633, 9464: 2674, 9465: 2711, 9466: 2749, 9467: 2786, 9468: 2823, 9469: 2859, 9470: 2559, 9471: 2475, 9472: 1861, 9473: 1862, 9474: 1863, 9475: 1864, 9476: 1865, 9477: 1866, 9478: 1867, 9479: 1868, 9480: 1869, 9481: 1870, 9482: 1871, 9483: 1872, 9484: 1873, 9485: 1874, 9486: 1875, 9487: 1876, 9488: 1877, 9489: 1878, 9490: 1879, 9491: 1880, 9492: 1881, 9493: 1882, 9494: 1883, 9495: 1884, 9496: 1885, 9497: 1886, 9498: 1887, 9499: 1888, 9500: 1889, 9501: 1890, 9502: 1891, 9503: 1892, 9504: 1893, 9505: 1894, 9506: 1895, 9507: 1896, 9508: 1897, 9509: 1898, 9510: 1899, 9511: 1900, 9512: 1901, 9513: 1902, 9514: 1903, 9515: 1904, 9516: 1905, 9517: 1906, 9518: 1907, 9519: 1908, 9520: 1909, 9521: 1910, 9522: 1911, 9523: 1912, 9524: 1913, 9525: 1914, 9526: 1915, 9527: 1916, 9528: 1917, 9529: 1918, 9530: 1919, 9531: 1920, 9532: 1921, 9533: 1922, 9534: 1923, 9535: 1924, 9536: 1925, 9537: 1926, 9538: 1927, 9539: 1928, 9540: 1929, 9541: 1930, 9542: 1931, 9543: 1932, 9544: 1933, 9545: 1934, 9546: 1935, 9547: 1936, 9548: 1937, 9549: 1938, 9550: 1939, 9551: 1940, 9552: 1941, 9553: 1942, 9554: 1943, 9555: 1944, 9556: 1945, 9557: 1946, 9558: 1947, 9559: 1948, 9560: 1949, 9561: 1950, 9562: 1951, 9563: 1952, 9564: 1953, 9565: 1954, 9566: 1955, 9567: 1956, 9568: 1957, 9569: 1958, 9570: 1959, 9571: 1960, 9572: 1961, 9573: 1962, 9574: 1963, 9575: 1964, 9576: 1965, 9577: 1966, 9578: 1967, 9579: 1968, 9580: 1969, 9581: 1970, 9582: 1971, 9583: 1972, 9584: 1973, 9585: 1974, 9586: 1975, 9587: 1976, 9588: 1977, 9589: 1978, 9590: 1979, 9591: 1980, 9592: 1981, 9593: 1982, 9594: 1983, 9595: 1984, 9596: 1985, 9597: 1986, 9598: 1987, 9599: 1988, 9600: 1989, 9601: 1990, 9602: 1991, 9603: 1992, 9604: 1993, 9605: 1994, 9606: 1995, 9607: 1996, 9608: 1997, 9609: 1998, 9610: 1999, 9611: 2000, 9612: 2001, 9613: 2002, 9614: 2003, 9615: 2004, 9616: 2005, 9617: 2006, 9618: 2007, 9619: 2008, 9620: 2009, 9621: 2010, 9622: 2011, 9623: 2012, 9624: 2013, 9625: 2014, 9626: 2015, 9627: 2016, 9628: 2017, 9629: 2018, 9630: 2019, 9631: 2020, 9632: 2021, 9633: 2022, 9634: 2023, 9635: 2024, 9636: 2025, 9637: 2026, 9638: 2027, 9639: 2028, 9640: 2029, 9641: 2030, 9642: 2031, 9643: 2032, 9644: 2033, 9645: 2034, 9646: 2035, 9647: 2036, 9648: 2037, 9649: 2038, 9650: 2039, 9651: 2040, 9652: 2041, 9653: 2042, 9654: 2043, 9655: 2044, 9656: 2045, 9657: 2046, 9658: 2047, 9659: 2048, 9660: 2049, 9661: 2050, 9662: 2051, 9663: 2052, 9664: 2053, 9665: 2054, 9666: 2055, 9667: 2056, 9668: 2057, 9669: 2058, 9670: 2059, 9671: 2060, 9672: 2061, 9673: 2062, 9674: 2063, 9675: 2064, 9676: 2065, 9677: 2066, 9678: 2067, 9679: 2068, 9680: 2069, 9681: 2070, 9682: 2071, 9683: 2072, 9684: 2073, 9685: 2074, 9686: 2075, 9687: 2076, 9688: 2077, 9689: 2078, 9690: 2079, 9691: 2080, 9692: 2081, 9693: 2082, 9694: 2083, 9695: 2084, 9696: 2085, 9697: 2086, 9698: 2087, 9699: 2088, 9700: 2089, 9701: 2090, 9702: 2091, 9703: 2092, 9704: 2093, 9705: 2094, 9706: 2095, 9707: 2096, 9708: 2097, 9709: 2098, 9710: 2099, 9711: 2100, 9712: 2101, 9713: 2102, 9714: 2103, 9715: 2104, 9716: 2105, 9717: 2106, 9718: 2107, 9719: 2108, 9720: 2109, 9721: 2110, 9722: 2111, 9723: 2112, 9724: 2113, 9725: 2114, 9726: 2115, 9727: 2116, 9728: 2117, 9729: 2118, 9730: 2119, 9731: 2120, 9732: 2121, 9733: 2122, 9734: 2123, 9735: 2124, 9736: 2125, 9737: 2126, 9738: 2127, 9739: 2128, 9740: 2129, 9741: 2130, 9742: 2131, 9743: 2132, 9744: 2133, 9745: 2134, 9746: 2135, 9747: 2136, 9748: 2137, 9749: 2138, 9750: 2139, 9751: 2140, 9752: 2141, 9753: 2142, 9754: 2143, 9755: 2144, 9756: 2145, 9757: 2146, 9758: 2147, 9759: 2148, 9760: 2149, 9761: 2150, 9762: 2151, 9763: 2152, 9764: 2153, 9765: 2154, 9766: 2155, 9767: 2156, 9768: 2157, 9769: 2158, 9770: 2159, 9771: 2160, 9772: 2161, 9773: 2162, 9774: 2163, 9775: 2164, 9776: 2377, 9777: 2378, 9778: 2379, 9779: 2380, 9780: 2381, 9781: 2382, 9782: 2383, 9783: 2384, 9784: 2165, 9785: 2166, 9786: 2167, 9787: 2168, 9788: 2169, 9789: 2170, 9790: 2171, 9791: 2172, 9792: 2173, 9793: 2174, 9794: 2175, 9795: 2176, 9796: 2177, 9797: 2178, 9798: 2179, 9799: 2180, 9800: 2181, 9801: 2182, 9802: 2183, 9803: 2184, 9804: 2185, 9805: 2186, 9806: 2187, 9807: 2188, 9808: 2189, 9809: 2190, 9810: 2191, 9811: 2192, 9812: 2193, 9813: 2194, 9814: 2195, 9815: 2196, 9816: 2197, 9817: 2198, 9818: 2199, 9819: 2200, 9820: 2201, 9821: 2202, 9822: 2203, 9823: 2204, 9824: 2205, 9825: 2206, 9826: 2207, 9827: 2208, 9828: 2209, 9829: 2210, 9830: 2211, 9831: 2212, 9832: 2213, 9833: 2214, 9834: 2215, 9835: 2216, 9836: 2217, 9837: 2385, 9838: 2386, 9839: 2387, 9840: 2218, 9841: 2219, 9842: 2220, 9843: 2221, 9844: 2222, 9845: 2223, 9846: 2224, 9847: 2225, 9848: 2226, 9849: 2227, 9850: 2228, 9851: 2229, 9852: 2230, 9853: 2231, 9854: 2232, 9855: 2233, 9856: 2234, 9857: 2235, 9858: 2236, 9859: 2237, 9860: 2238, 9861: 2239, 9862: 2240, 9863: 2241, 9864: 2242, 9865: 2243, 9866: 2371, 9867: 2372, 9868: 2373, 9869: 2374, 9870: 2375, 9871: 2376, 9872: 2244, 9873: 2245, 9874: 2246, 9875: 2247, 9876: 2248, 9877: 2249, 9878: 2250, 9879: 2251, 9880: 2252, 9881: 2253, 9882: 2254, 9883: 2255, 9884: 2256, 9885: 2257, 9886: 2258, 9887: 2259, 9888: 2260, 9889: 2261, 9890: 2262, 9891: 2263, 9892: 2264, 9893: 2265, 9894: 2266, 9895: 2267, 9896: 2268, 9897: 2269, 9898: 2270, 9899: 2271, 9900: 2272, 9901: 2273, 9902: 2274, 9903: 2275, 9904: 2276, 9905: 2277, 9906: 2278, 9907: 2279, 9908: 2280, 9909: 2281, 9910: 2282, 9911: 2283, 9912: 2284, 9913: 2285, 9914: 2286, 9915: 2287, 9916: 2288, 9917: 2289, 9918: 2290, 9919: 2291, 9920: 2292, 9921: 2293, 9922: 2294, 9923: 2295, 9924: 2296, 9925: 2297, 9926: 2298, 9927: 2299, 9928: 2300, 9929: 2301, 9930: 2302, 9931: 2303, 9932: 2304, 9933: 2305, 9934: 2306, 9935: 2307, 9936: 2308, 9937: 2309, 9938: 2310, 9939: 2311, 9940: 2312, 9941: 2313, 9942: 2314, 9943: 2315, 9944: 2316, 9945: 2317, 9946: 2318, 9947: 2319, 9948: 2320, 9949: 2321, 9950: 2322, 9951: 2323, 9952: 2324, 9953: 2325, 9954: 2326, 9955: 2327, 9956: 2328, 9957: 2329, 9958: 2330, 9959: 2331, 9960: 2332, 9961: 2333, 9962: 2334, 9963: 2335, 9964: 2336, 9965: 2337, 9966: 2338, 9967: 2339, 9968: 2340, 9969: 2341, 9970: 2342, 9971: 2343, 9972: 2344, 9973: 2345, 9974: 2346, 9975: 2347, 9976: 2348, 9977: 2349, 9978: 2350, 9979: 2351, 9980: 2352, 9981: 2353, 9982: 2354, 9983: 2355, 9984: 9999, 9985: 2356, 9986: 2357, 9987: 2358, 9988: 2359, 9989: 2360, 9990: 2361, 9991: 2362, 9992: 2363, 9993: 2364, 9994: 2365, 9995: 2366, 9996: 2367, 9997: 2368, 9998: 2369, 9999: 2370}
 
 # from http://stackoverflow.com/questions/517923/what-is-the-best-way-to-remove-accents-in-a-python-unicode-string/518232#518232
 def strip_accents(s):
    return ''.join(c for c in unicodedata.normalize('NFD', s)
                   if unicodedata.category(c) != 'Mn')
+
+
+
+# Collation keys
+#
+# sort_key(title) returns the same key as
+#
+#   (strip_accents(title) + '   ' + title).translate(UNICODE_SORT)
+#
+# but strips the accents with a regular expression matching every
+# non-spacing mark (category Mn) instead of checking the category of each
+# character in Python, and remembers the keys of the most recently used
+# titles.
+
+# number of titles whose sort keys are remembered
+SORT_KEY_CACHE_SIZE = 10000
+
+_NON_SPACING_MARKS = None
+_SORT_KEYS = None
+
+
+def _non_spacing_marks():
+    '''
+    Return a regular expression matching the characters of category Mn.
+
+    On narrow Python builds sys.maxunicode is 0xFFFF: characters outside
+    the Basic Multilingual Plane are made of two surrogates, which
+    strip_accents() keeps as well.
+    '''
+    ranges = []
+    for code in xrange(sys.maxunicode + 1):
+        if unicodedata.category(unichr(code)) == 'Mn':
+            if ranges and ranges[-1][1] == code - 1:
+                ranges[-1][1] = code
+            else:
+                ranges.append([code, code])
+    return re.compile(u'[%s]' % u''.join(
+        u'%s-%s' % (re.escape(unichr(first)), re.escape(unichr(last)))
+        for first, last in ranges), re.UNICODE)
+
+
+def _sort_key(title):
+    return (_NON_SPACING_MARKS.sub(u'', unicodedata.normalize('NFD', title)) +
+            u'   ' + title).translate(UNICODE_SORT)
+
+
+def sort_key(title):
+    '''
+    Return the key used to sort title, ignoring accents first and then
+    taking them into account.
+    '''
+    global _NON_SPACING_MARKS, _SORT_KEYS
+    if _SORT_KEYS is None:
+        _NON_SPACING_MARKS = _non_spacing_marks()
+        _SORT_KEYS = cache.LRUCache(SORT_KEY_CACHE_SIZE)
+    key = _SORT_KEYS.get(title)
+    if key is None:
+        key = _sort_key(title)
+        _SORT_KEYS.set(title, key)
+    return key
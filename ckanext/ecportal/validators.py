@@ -220,8 +220,9 @@ def publisher_exists(publisher_name, context):
     Raises Invalid if the given publisher_name does not exist in the model
     given in the context, otherwise returns the given publisher_name.
     '''
+    group_context = dict(context, ecodp_group_counts_only=True)
     try:
-        logic.get_action('group_show')(context, {'id': publisher_name})
+        logic.get_action('group_show')(group_context, {'id': publisher_name})
     except logic.NotFound:
         raise df.Invalid('%s: %s' % (_('Publisher not found'), publisher_name))
     return publisher_name
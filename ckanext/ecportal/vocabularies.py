@@ -0,0 +1,94 @@
+import logging
+import pylons.config as config
+
+import ckan.model as model
+
+import ckanext.ecportal.cache as cache
+
+log = logging.getLogger(__name__)
+
+# the index is rebuilt at most this often (in seconds) even if it has not
+# been invalidated, to pick up vocabulary changes made by other processes
+DEFAULT_MAX_AGE = 300
+
+
+class VocabularyIndex(object):
+    '''
+    In-memory index of tags: maps each tag name to the names of the
+    vocabularies that contain it (an empty list for free tags).
+
+    The index is built with a single query the first time it is used, and
+    rebuilt after invalidate() is called or after max_age seconds. Tags
+    created since then (e.g. by a vocabulary import in another process) are
+    looked up in the database the first time they are asked for.
+    '''
+
+    def __init__(self, max_age=DEFAULT_MAX_AGE):
+        self.max_age = max_age
+        self._cache = cache.TTLCache(max_age, max_size=1)
+
+    def _query(self):
+        return model.Session.query(model.tag.Tag.name,
+                                   model.vocabulary.Vocabulary.name)\
+            .outerjoin(model.vocabulary.Vocabulary,
+                       model.tag.Tag.vocabulary_id ==
+                       model.vocabulary.Vocabulary.id)
+
+    def _load(self, query, index):
+        for tag_name, vocab_name in query:
+            vocabs = index.setdefault(tag_name, [])
+            if vocab_name is not None:
+                vocabs.append(vocab_name)
+
+    def _build(self):
+        index = {}
+        self._load(self._query(), index)
+        log.debug('Built vocabulary index of %d tags', len(index))
+        return index
+
+    def vocabularies(self, tag_name):
+        '''
+        Return a list containing the names of each vocabulary that
+        contains the tag tag_name, or an empty list if it does not belong
+        to any vocabulary.
+        '''
+        index = self._cache.get('index')
+        if index is None:
+            index = self._build()
+            self._cache.set('index', index)
+
+        vocabs = index.get(tag_name)
+        if vocabs is None:
+            # a tag created since the index was built
+            found = {}
+            self._load(self._query()
+                       .filter(model.tag.Tag.name == tag_name), found)
+            vocabs = index[tag_name] = found.get(tag_name, [])
+        return vocabs
+
+    def invalidate(self):
+        self._cache.clear()
+
+
+_vocabulary_index = None
+
+
+def vocabulary_index():
+    global _vocabulary_index
+    if _vocabulary_index is None:
+        _vocabulary_index = VocabularyIndex(int(config.get(
+            'ckan.ecportal.vocabulary_index.max_age', DEFAULT_MAX_AGE)))
+    return _vocabulary_index
+
+
+def vocabularies(tag_name):
+    return vocabulary_index().vocabularies(tag_name)
+
+
+def invalidate():
+    '''
+    Discard the vocabulary index of this process, called whenever
+    vocabularies or vocabulary tags are created or deleted.
+    '''
+    if _vocabulary_index is not None:
+        _vocabulary_index.invalidate()
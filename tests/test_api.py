@@ -239,6 +239,63 @@ class TestAPI(tests.WsgiAppCase):
                       extra_environ={'Authorization': 'ectest'},
                       status=409)
 
+    def _create_group_with_members(self, name):
+        model.repo.new_revision()
+        group = model.Group(name=name, title=u'Old title')
+        model.Session.add(group)
+        model.Session.flush()
+        model.Session.add(model.Member(
+            table_id=model.Package.get('warandpeace').id,
+            table_name='package', group=group))
+        model.Session.add(model.Member(
+            table_id=model.User.get('ectest').id,
+            table_name='user', group=group))
+        model.Session.commit()
+        return group.id
+
+    def _member_count(self, group_id, table_name):
+        return model.Session.query(model.Member)\
+            .filter_by(group_id=group_id, table_name=table_name,
+                       state='active').count()
+
+    def test_group_update_keeps_packages(self):
+        group_id = self._create_group_with_members(u'test-group-update-title')
+        params = {'id': group_id, 'name': u'test-group-update-title',
+                  'title': u'New title',
+                  'users': [{'name': u'ectest', 'capacity': u'editor'}]}
+        env = {'Authorization': str(self.sysadmin_user.apikey)}
+        response = self.app.post('/api/action/group_update',
+                                 params=json.dumps(params),
+                                 extra_environ=env)
+        assert json.loads(response.body)['result']['title'] == u'New title'
+
+        model.Session.remove()
+        assert self._member_count(group_id, 'package') == 1
+        assert self._member_count(group_id, 'user') == 1
+
+    def test_group_update_without_users_removes_users(self):
+        group_id = self._create_group_with_members(u'test-group-update-users')
+        params = {'id': group_id, 'name': u'test-group-update-users',
+                  'title': u'New title'}
+        env = {'Authorization': str(self.sysadmin_user.apikey)}
+        self.app.post('/api/action/group_update',
+                      params=json.dumps(params),
+                      extra_environ=env)
+
+        model.Session.remove()
+        assert self._member_count(group_id, 'package') == 1
+        assert self._member_count(group_id, 'user') == 0
+
+    def test_group_update_restores_context(self):
+        group_id = self._create_group_with_members(u'test-group-update-ctx')
+        context = {'model': model, 'session': model.Session,
+                   'user': self.sysadmin_user.name,
+                   'allow_partial_update': False}
+        logic.get_action('group_update')(
+            context, {'id': group_id, 'name': u'test-group-update-ctx',
+                      'title': u'New title'})
+        assert context['allow_partial_update'] is False
+
     def test_purge_publisher_datasets(self):
         dataset = {'name': u'test-purge-publisher-datasets',
                    'title': u'Test',
@@ -1,11 +1,13 @@
 import datetime
 import os
+import time
 
 import ckan.model as model
 import ckan.plugins as plugins
 import ckan.lib.search as search
 import ckan.tests as tests
 import test_api
+import ckanext.ecportal.cache as cache
 import ckanext.ecportal.searchcloud as searchcloud
 import ckanext.ecportal.helpers as helpers
 
@@ -151,3 +153,37 @@ class TestMostViewed(tests.TestController):
                            ('Most Viewed 3', 6),
                            ('Most Viewed 2', 4),
                            ('Most Viewed 1', 2)])
+
+    def test_06_fragment_not_cached_after_search_error(self):
+        '''A homepage box rendered while its search failed expires quickly'''
+        def failing_search(n):
+            raise search.SearchError('Solr is down')
+
+        def render_snippet(template_name, **kw):
+            return repr(helpers.most_viewed_datasets(10))
+
+        most_viewed_datasets = helpers._most_viewed_datasets
+        base_render_snippet = helpers.base.render_snippet
+        helpers._most_viewed_datasets = failing_search
+        helpers.base.render_snippet = render_snippet
+        helpers._WIDGET_CACHE = cache.TTLCache(60)
+        helpers._FRAGMENT_CACHE = cache.TTLCache(300)
+        try:
+            now = time.time()
+            output = helpers.cached_snippet('snippets/home_most_viewed.html')
+            self.assert_equal(output, 'None')
+
+            key = ('snippets/home_most_viewed.html', None)
+            expires, value = helpers._FRAGMENT_CACHE._cache.get(key)
+            assert expires <= now + helpers.WIDGET_ERROR_TTL + 1, expires
+
+            # the widget error is still cached, and still known as an error
+            helpers._FRAGMENT_CACHE.clear()
+            helpers.cached_snippet('snippets/home_most_viewed.html')
+            expires, value = helpers._FRAGMENT_CACHE._cache.get(key)
+            assert expires <= now + helpers.WIDGET_ERROR_TTL + 1, expires
+        finally:
+            helpers._most_viewed_datasets = most_viewed_datasets
+            helpers.base.render_snippet = base_render_snippet
+            helpers._WIDGET_CACHE = None
+            helpers._FRAGMENT_CACHE = None
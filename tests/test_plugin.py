@@ -1,4 +1,8 @@
 import json
+import os
+import tempfile
+import pylons.config as config
+import ckanext.ecportal.helpers as helpers
 import ckanext.ecportal.plugin as plugin
 
 
@@ -34,3 +38,92 @@ class TestECPortalHomePlugin():
         p = plugin.ECPortalHomepagePlugin()
         p.configure({'ckan.home.content': 'badfilepath.json'})
         assert not p.homepage_content('en')
+
+    def test_maintenance_message_reloaded(self):
+        maintenance_file = tempfile.NamedTemporaryFile(suffix='.json')
+        with open(maintenance_file.name, 'w') as f:
+            json.dump({'message': {'en': 'Down', 'fr': 'Hors service'}}, f)
+        p = plugin.ECPortalHomepagePlugin()
+        p.configure({'ckan.home.maintenance': maintenance_file.name,
+                     'ckan.ecportal.home.check_interval': 0})
+        assert p.maintenance_message('fr') == {'message': 'Hors service',
+                                               'class': 'red'}
+        assert p.maintenance_message('de')['message'] == 'Down'
+
+        with open(maintenance_file.name, 'w') as f:
+            json.dump({'message': {'en': 'Back soon'}, 'class': 'blue'}, f)
+        # make sure the modification time changes
+        os.utime(maintenance_file.name, (0, 0))
+        assert p.maintenance_message('fr') == {'message': 'Back soon',
+                                               'class': 'blue'}
+
+    def test_homepage_content_not_an_object(self):
+        content_file = tempfile.NamedTemporaryFile(suffix='.json')
+        with open(content_file.name, 'w') as f:
+            json.dump(['not', 'an', 'object'], f)
+        p = plugin.ECPortalHomepagePlugin()
+        p.configure({'ckan.home.content': content_file.name})
+        assert not p.homepage_content('en')
+
+
+class TestResourceFormats():
+
+    def teardown(self):
+        config.pop('ckan.resource_mapping', None)
+        helpers._RESOURCE_MAPPING = None
+
+    def test_resource_formats(self):
+        mapping_file = tempfile.NamedTemporaryFile(suffix='.json')
+        with open(mapping_file.name, 'w') as f:
+            json.dump({'text/csv': ['csv', 'CSV', 'Data']}, f)
+        config['ckan.resource_mapping'] = mapping_file.name
+        helpers._RESOURCE_MAPPING = None
+        assert helpers.resource_formats().formats == {'text/csv': 'csv'}
+        assert helpers.format_display_name('text/csv') == 'CSV'
+
+    def test_missing_mapping_file(self):
+        config['ckan.resource_mapping'] = 'badfilepath.json'
+        helpers._RESOURCE_MAPPING = None
+        assert helpers.resource_mapping() == {}
+        assert helpers.format_display_name('text/csv') == 'text/csv'
+
+    def test_invalid_mapping_file(self):
+        config['ckan.resource_mapping'] = __file__
+        helpers._RESOURCE_MAPPING = None
+        assert helpers.resource_mapping() == {}
+
+
+class TestTitleSortFallback():
+
+    def test_add_title_sort_fallback(self):
+        sort = plugin._add_title_sort_fallback('title_string_fr desc')
+        assert sort == 'title_string_fr desc,title_sort desc', sort
+
+    def test_add_title_sort_fallback_other_fields(self):
+        sort = plugin._add_title_sort_fallback(
+            'score desc, title_string_de asc')
+        assert sort == 'score desc, title_string_de asc,title_sort asc', sort
+        assert plugin._add_title_sort_fallback('name asc') == 'name asc'
+
+
+class TestQueryProfiles():
+
+    def test_query_fields(self):
+        profiles = plugin.QueryProfiles(plugin.LANGS, 'en')
+        qf = profiles.get('fr').qf.split()
+        assert qf[:2] == ['title_fr^8', 'text_fr^4'], qf
+        assert 'title_de^2' in qf and 'text_de' in qf
+        assert len(qf) == 2 * len(plugin.LANGS)
+        assert profiles.get('fr').sort == 'title_string_fr asc'
+
+    def test_unsupported_lang(self):
+        profiles = plugin.QueryProfiles(plugin.LANGS, 'xx')
+        assert profiles.get('yy').lang == 'en'
+
+    def test_lang_boosts(self):
+        profiles = plugin.QueryProfiles(plugin.LANGS, 'en',
+                                        lang_boosts={'en': 1.5, 'ga': 0})
+        qf = profiles.get('fr').qf.split()
+        assert 'title_en^3' in qf and 'text_en^1.5' in qf
+        assert 'title_ga^2' not in qf
+        assert profiles.get('ga').qf.startswith('title_ga^8 text_ga^4')
@@ -5,11 +5,15 @@
 '''
 import json
 
+import pylons.config as config
+
 import ckan.model as model
 import ckan.lib.create_test_data
 import ckan.lib.search as search
 import ckan.tests as tests
 
+import ckanext.ecportal.plugin as plugin
+
 import data
 import test_api
 
@@ -194,3 +198,37 @@ class TestSearch(tests.TestController):
         result = json.loads(response.body)['result']
         assert result['count'] > 1
         assert result['results'][0]['name'] == dataset['name']
+
+    def test_title_sort_fallback(self):
+        config['ckan.ecportal.index.title_sort_fallback'] = 'true'
+        plugin._query_profiles = None
+        try:
+            search.rebuild()
+
+            # none of the test datasets has a translated title, so they
+            # are all sorted on the title_sort key of their original title
+            names = [u'test-catalan', u'test-czech', u'test-english',
+                     u'test-greek']
+            for sort in ('title_string_en asc', None):
+                search_query = {'q': u'Test language', 'rows': 10}
+                if sort:
+                    search_query['sort'] = sort
+                response = self.app.post('/api/action/package_search',
+                                         params=json.dumps(search_query))
+                result = json.loads(response.body)['result']
+                result_names = [r['name'] for r in result['results']
+                                if r['name'] in names]
+                assert result_names == names, result_names
+
+            search_query = {'q': u'Test language',
+                            'sort': 'title_string_en desc'}
+            response = self.app.post('/api/action/package_search',
+                                     params=json.dumps(search_query))
+            result = json.loads(response.body)['result']
+            result_names = [r['name'] for r in result['results']
+                            if r['name'] in names]
+            assert result_names == list(reversed(names)), result_names
+        finally:
+            del config['ckan.ecportal.index.title_sort_fallback']
+            plugin._query_profiles = None
+            search.rebuild()
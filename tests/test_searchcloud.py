@@ -1,5 +1,7 @@
 import cgi
+import datetime
 import urllib
+import StringIO
 
 try:
     import json
@@ -78,6 +80,8 @@ class TestSearchCloud(tests.TestController):
             '?q=Test'
         res = self.app.get(search_url)
         self.assert_equal("Test language English" in res, True)
+        # Writing the buffered search terms doesn't fail either
+        self.assert_equal(searchcloud.flush_tracked_terms(), 0)
 
     def test_03_install_searchcloud_tables(self):
         for table in ['search_query', 'search_popular_latest',
@@ -95,6 +99,10 @@ Creating the search_popular_latest table ...
 done.
 Creating the search_popular_approved table ...
 done.
+Creating the search_popular_version table ...
+done.
+Creating the search_query_daily table ...
+done.
 Creating the search_query_date index ...
 done."""
         searchcloud.install_tables(model.Session, out)
@@ -133,6 +141,7 @@ The tables already exist"""
             search_url = tests.url_for(controller='package', action='search') +'?q='+urllib.quote(term.encode('utf8'))
             self.app.get(search_url)
         # Now the query is logged
+        searchcloud.flush_tracked_terms()
         result = model.Session.execute('select count(*) from search_query').fetchall()[0][0]
         self.assert_equal(int(result), 6)
 
@@ -282,3 +291,192 @@ The tables already exist"""
             # Check we get a 401 response from notadmin
             self.app.get(url, status=401, extra_environ={'REMOTE_USER': 'notadmin'})
             self.app.post(url, status=401, extra_environ={'REMOTE_USER': 'notadmin'})
+
+
+    def _add_searches(self, days_ago, lang, search_string, count=1):
+        searched_at = datetime.datetime.now() - \
+            datetime.timedelta(days=days_ago)
+        for i in range(count):
+            model.Session.execute(
+                '''
+                INSERT INTO search_query (lang, search_string, searched_at)
+                VALUES (:lang, :search_string, :searched_at)
+                ''',
+                {'lang': lang, 'search_string': search_string,
+                 'searched_at': searched_at})
+
+    def _count(self, table):
+        return int(model.Session.execute(
+            'SELECT count(*) FROM %s' % table).fetchone()[0])
+
+    def test_11_rolling_up_search_queries(self):
+        model.Session.execute('DELETE FROM search_query')
+        model.Session.execute('DELETE FROM search_query_daily')
+        self._add_searches(40, 'en', u'Old', 2)
+        self._add_searches(3, 'en', u'Health', 2)
+        self._add_searches(3, 'fr', u'Health')
+        self._add_searches(2, 'en', u'Water')
+        self._add_searches(0, 'en', u'Health')
+
+        today = (datetime.datetime.now() - searchcloud.ROLLUP_DELAY).date()
+        three_days_ago = (datetime.datetime.now() -
+                          datetime.timedelta(days=3)).date()
+        expected_daily = [
+            (three_days_ago, u'en', u'Health', 2L),
+            (three_days_ago, u'fr', u'Health', 1L),
+            (three_days_ago + datetime.timedelta(days=1), u'en', u'Water', 1L),
+        ]
+
+        # rolling up again doesn't add the same days twice
+        for i in range(2):
+            self.assert_equal(
+                searchcloud.rollup_search_queries(model.Session), today)
+            self.assert_equal(searchcloud.rolled_up_until(model.Session),
+                              today)
+            rows = model.Session.execute(
+                '''
+                SELECT day, lang, search_string, count
+                FROM search_query_daily
+                WHERE search_string != 'Old'
+                ORDER BY day, lang
+                ''').fetchall()
+            self.assert_equal([tuple(row) for row in rows], expected_daily)
+            self.assert_equal(self._count('search_query_daily'), 4)
+
+        # the searches of the last 30 days are counted once, whether they
+        # were rolled up or not, and older searches are left out
+        for i in range(2):
+            searchcloud.generate_unapproved_list(model.Session, days=30)
+            self.assert_equal(searchcloud.get_latest(model.Session),
+                              [[u'Health', 4L], [u'Water', 1L]])
+        searchcloud.generate_unapproved_list(model.Session, days=2)
+        self.assert_equal(sorted(searchcloud.get_latest(model.Session)),
+                          [[u'Health', 1L], [u'Water', 1L]])
+
+        # only the searches of the rolled up days are purged
+        self.assert_equal(searchcloud.purge_search_queries(model.Session), 6)
+        self.assert_equal(self._count('search_query'), 1)
+        self.assert_equal(searchcloud.purge_search_queries(model.Session), 0)
+        searchcloud.generate_unapproved_list(model.Session, days=30)
+        self.assert_equal(searchcloud.get_latest(model.Session),
+                          [[u'Health', 4L], [u'Water', 1L]])
+        model.Session.commit()
+
+
+    def test_12_search_clouds_per_language(self):
+        # the searches left by test_11 are in en and fr
+        self._add_searches(0, 'de', u'Gesundheit', 2)
+        for i in range(105):
+            self._add_searches(0, 'de', u'Begriff %d' % i)
+        searchcloud.generate_unapproved_list(model.Session, days=30)
+
+        self.assert_equal(searchcloud.get_latest(model.Session, 'en'),
+                          [[u'Health', 3L], [u'Water', 1L]])
+        self.assert_equal(searchcloud.get_latest(model.Session, 'fr'),
+                          [[u'Health', 1L]])
+        # each language keeps its own 100 most popular searches
+        latest_de = searchcloud.get_latest(model.Session, 'de')
+        self.assert_equal(len(latest_de), 100)
+        self.assert_equal(latest_de[0], [u'Gesundheit', 2L])
+        self.assert_equal(len(searchcloud.get_latest(model.Session)), 100)
+        self.assert_equal(searchcloud.get_languages(model.Session),
+                          [u'de', u'en', u'fr'])
+
+        # approving the terms of a language leaves the others alone
+        searchcloud.update_approved(model.Session, [[u'Health', 4L]])
+        searchcloud.update_approved(model.Session, [[u'Gesundheit', 2L]],
+                                    'de')
+        model.Session.commit()
+        self.assert_equal(searchcloud.get_approved(model.Session),
+                          [[u'Health', 4L]])
+        self.assert_equal(searchcloud.get_approved(model.Session, 'de'),
+                          [[u'Gesundheit', 2L]])
+
+        # languages without approved terms show the cloud for all languages
+        self.assert_equal(
+            searchcloud.approved_cloud(model.Session, 'de'),
+            searchcloud.approved_to_json([[u'Gesundheit', 2L]]))
+        self.assert_equal(
+            searchcloud.approved_cloud(model.Session, 'fr'),
+            searchcloud.approved_to_json([[u'Health', 4L]]))
+
+        # the terms of a language can be downloaded and saved
+        res = self.app.get('/searchcloud/download', params={'lang': 'fr'},
+                           status=200,
+                           extra_environ={'REMOTE_USER': 'testsysadmin'})
+        self.assert_equal(json.loads(res.body), [[u'Health', 1]])
+        self.assert_equal('ecodp-searchcloud-latest-fr-' in
+                          res.header_dict['content-disposition'], True)
+        res = self.app.post(
+            '/searchcloud/save',
+            status=200,
+            extra_environ={'REMOTE_USER': 'testsysadmin'},
+            params={'searchcloud': json.dumps([[u'Sant\xe9', 5]]),
+                    'lang': 'fr'}
+        )
+        self.assert_equal('Search Cloud Successfully Updated' in res.body,
+                          True)
+        model.Session.commit()
+        self.assert_equal(searchcloud.get_approved(model.Session, 'fr'),
+                          [[u'Sant\xe9', 5L]])
+        self.assert_equal(searchcloud.get_approved(model.Session, 'de'),
+                          [[u'Gesundheit', 2L]])
+        self.assert_equal(searchcloud.get_approved(model.Session),
+                          [[u'Health', 4L]])
+        self.assert_equal(
+            searchcloud.approved_cloud(model.Session, 'fr'),
+            searchcloud.approved_to_json([[u'Sant\xe9', 5L]]))
+
+
+class TestIterJsonList(object):
+
+    def _parse(self, text, chunk_size=2):
+        return list(searchcloud.iter_json_list(StringIO.StringIO(text),
+                                               chunk_size=chunk_size))
+
+    def _assert_raises(self, exception, text):
+        try:
+            self._parse(text)
+        except exception:
+            pass
+        else:
+            assert False, '%s not raised for %r' % (exception.__name__, text)
+
+    def test_items(self):
+        text = json.dumps([[u'Health', 3], {u'text': u'Water'}, None, 1.5])
+        for chunk_size in (1, 2, 3, 7, 64 * 1024):
+            items = self._parse(text, chunk_size)
+            assert items == json.loads(text), (chunk_size, items)
+
+    def test_utf8_split_across_chunks(self):
+        terms = [u'Tax\u6c49\u5b57', u'caf\xe9', u'\U0001f600']
+        text = json.dumps(terms, ensure_ascii=False).encode('utf8')
+        for chunk_size in (1, 2, 3):
+            assert self._parse(text, chunk_size) == terms, chunk_size
+        # unicode files are not decoded again
+        assert self._parse(text.decode('utf8')) == terms
+
+    def test_number_at_chunk_boundary(self):
+        assert self._parse('[12345, 678]', 3) == [12345, 678]
+        assert self._parse('[1,23]', 4) == [1, 23]
+        assert self._parse('[1.5, 2e3, -4]', 1) == [1.5, 2e3, -4]
+        assert self._parse('[10.25]', 3) == [10.25]
+
+    def test_whitespace(self):
+        assert self._parse(' \n[ 1 ,\t2 ]\r\n ') == [1, 2]
+        assert self._parse('[ ]') == []
+
+    def test_invalid_lists(self):
+        self._assert_raises(ValueError, '[1,]')
+        self._assert_raises(ValueError, '[1 2]')
+        self._assert_raises(ValueError, '[1, 2')
+        self._assert_raises(ValueError, '[1] 2')
+        self._assert_raises(ValueError, '[1]]')
+
+    def test_not_a_list(self):
+        self._assert_raises(TypeError, '{"Health": 3}')
+        self._assert_raises(TypeError, '3')
+
+    def test_empty_file(self):
+        self._assert_raises(ValueError, '')
+        self._assert_raises(ValueError, '  ')
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import random
+
+import ckanext.ecportal.unicode_sort as unicode_sort
+
+
+def strip_accents_key(title):
+    # the sort key computed by the portal before sort_key() was added
+    return (unicode_sort.strip_accents(title) + '   ' +
+            title).translate(unicode_sort.UNICODE_SORT)
+
+
+class TestSortKey():
+
+    titles = [u'', u' ', u'Energy', u'energy', u'Énergie', u'énergie',
+              u'Energie', u'Ελληνικά', u'Łódź', u'Tax汉字漢字',
+              u'Water<>&"{}\'', u'ạ́', u'ạ́',
+              u'ṩ', u'가', u'\U0001d15e', u'Ångström 2012']
+
+    def test_same_keys_as_strip_accents(self):
+        for title in self.titles:
+            assert unicode_sort.sort_key(title) == strip_accents_key(title)
+
+    def test_same_keys_for_every_character(self):
+        for code in xrange(0x10000):
+            char = unichr(code)
+            assert unicode_sort.sort_key(char) == strip_accents_key(char), \
+                hex(code)
+
+    def test_same_keys_for_random_titles(self):
+        rand = random.Random(0)
+        chars = [unichr(code) for code in xrange(0x2000)] + \
+            [unichr(code) for code in xrange(0x300, 0x370)] * 10
+        for i in range(10000):
+            title = u''.join(rand.choice(chars)
+                             for j in range(rand.randint(1, 10)))
+            assert unicode_sort.sort_key(title) == strip_accents_key(title), \
+                repr(title)
+
+    def test_same_order(self):
+        assert sorted(self.titles, key=unicode_sort.sort_key) == \
+            sorted(self.titles, key=strip_accents_key)
+
+    def test_keys_are_remembered(self):
+        title = u'Énergie %s' % random.random()
+        assert unicode_sort.sort_key(title) is unicode_sort.sort_key(title)